@@ -0,0 +1,78 @@
+"""Allocation profile of a headless game.
+
+Plays a seeded game through GameLoop.run_frame under the SDL dummy video
+driver, with the density bot steering and firing bombs, the arrow
+collision switched off (so the game does not end) and the frame pacer not
+waiting between frames. An AllocationProfiler marks the frame phases and
+its report is printed as JSON, or written to --output so the reports of
+two versions can be compared with diff.
+
+Usage:
+    python -m src.benchmarks.allocation_benchmark [--frames N] [--output PATH]
+"""
+import argparse
+import json
+import os
+
+
+def profile_game(screen, frames: int, seed: int, sample_interval: int):
+    """
+    Profile one game.
+
+    Args:
+        screen: Display surface
+        frames: Number of frames to run
+        seed: Random seed for red dot spawning
+        sample_interval: Frames between allocation site samples
+
+    Returns:
+        The AllocationProfiler after the run
+    """
+    from src.general.game_loop import GameLoop
+    from src.general.profiling.allocation_profiler import AllocationProfiler
+    from src.logic.control.density_bot import DensityBot
+
+    game_loop = GameLoop(*screen.get_size())
+    game_loop.quality_governor = None
+    game_loop.frame_pacer.fps = 0
+    game_loop.bot = DensityBot(game_loop.world_width, game_loop.world_height)
+    game_loop.initialize_game()
+    game_loop.red_dot_spawn.rng.seed(seed)
+    game_loop.red_dot_white_arrow_collision.red_dot_radius = -1
+
+    profiler = AllocationProfiler(sample_interval=sample_interval)
+    game_loop.allocation_profiler = profiler
+    profiler.start()
+    for _ in range(frames):
+        game_loop.run_frame(screen)
+    game_loop.frame_pacer.close()
+    return profiler
+
+
+def main(argv=None):
+    """Run the benchmark and print or write the report."""
+    parser = argparse.ArgumentParser(description="Allocation profile benchmark")
+    parser.add_argument('--frames', type=int, default=1800, help="number of frames to run")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for red dot spawning")
+    parser.add_argument('--sample-interval', type=int, default=30, help="frames between allocation site samples")
+    parser.add_argument('--output', metavar='PATH', help="write the report to PATH instead of printing it")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+    pygame.font.init()
+    from src.config.config_loader import config
+    screen = pygame.display.set_mode((config.get_screen_width(), config.get_screen_height()))
+
+    profiler = profile_game(screen, args.frames, args.seed, args.sample_interval)
+    if args.output:
+        profiler.write_report(args.output)
+    else:
+        print(json.dumps(profiler.get_report(), indent=2, sort_keys=True))
+    profiler.stop()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Density bot playtesting benchmark.
+
+Plays seeded headless games (no drawing) with the density bot and, as a
+baseline, with a random policy that heads for a new random point every
+second, and reports survival, score and games per hour. Then times single
+bot decisions against growing dot counts to show that the decision cost
+is set by the threat grid, not the number of dots. Prints the results as
+JSON.
+
+Usage:
+    python -m src.benchmarks.bot_benchmark [--games N] [--max-seconds N] [--dots N [N ...]]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+
+
+def play_game(seed: int, policy: str, max_seconds: float) -> dict:
+    """
+    Play one headless game.
+
+    Args:
+        seed: Random seed for red dot spawning and the random policy
+        policy: 'bot' or 'random'
+        max_seconds: Game time after which the game is stopped
+
+    Returns:
+        Dictionary with survival time, score and bombs fired
+    """
+    from src.general.game_loop import GameLoop
+    from src.logic.control.density_bot import DensityBot
+
+    game_loop = GameLoop()
+    game_loop.initialize_game()
+    game_loop.red_dot_spawn.rng.seed(seed)
+    rng = random.Random(seed)
+    if policy == 'bot':
+        game_loop.bot = DensityBot(game_loop.world_width, game_loop.world_height)
+
+    max_frames = int(max_seconds * game_loop.fps)
+    frames = 0
+    while not game_loop.game_over and frames < max_frames:
+        if policy == 'random' and frames % game_loop.fps == 0:
+            target = (rng.uniform(0, game_loop.world_width), rng.uniform(0, game_loop.world_height))
+            game_loop.mouse_position = (target[0] - game_loop.camera.x, target[1] - game_loop.camera.y)
+            if game_loop.bomb_control.is_ready():
+                game_loop.bomb_control.activate()
+        game_loop.update()
+        frames += 1
+
+    return {
+        'seconds': frames / game_loop.fps,
+        'score': game_loop.score_tracker.get_total_score(),
+        'bombs': game_loop.bot.bombs if game_loop.bot is not None else 0
+    }
+
+
+def run_policy(policy: str, games: int, max_seconds: float) -> dict:
+    """
+    Play a series of games with one policy.
+
+    Args:
+        policy: 'bot' or 'random'
+        games: Number of games
+        max_seconds: Game time cap per game
+
+    Returns:
+        Dictionary of measurements
+    """
+    start = time.perf_counter()
+    results = [play_game(seed, policy, max_seconds) for seed in range(games)]
+    elapsed = time.perf_counter() - start
+    return {
+        'games': games,
+        'survival_seconds_mean': round(statistics.mean(result['seconds'] for result in results), 1),
+        'survival_seconds_median': round(statistics.median(result['seconds'] for result in results), 1),
+        'score_mean': round(statistics.mean(result['score'] for result in results), 1),
+        'bombs_mean': round(statistics.mean(result['bombs'] for result in results), 1),
+        'capped_games': sum(result['seconds'] >= max_seconds for result in results),
+        'games_per_hour': round(games / elapsed * 3600)
+    }
+
+
+def time_decisions(dots: int, repeats: int, seed: int) -> dict:
+    """
+    Time bot decisions for a fixed number of dots.
+
+    Args:
+        dots: Number of dot positions
+        repeats: Number of decisions to time
+        seed: Random seed for the positions
+
+    Returns:
+        Dictionary with the mean decision time
+    """
+    import numpy as np
+    from src.config.config_loader import config
+    from src.general.position import Position
+    from src.logic.control.density_bot import DensityBot
+
+    width, height = config.get_world_width(), config.get_world_height()
+    bot = DensityBot(width, height)
+    positions = np.random.default_rng(seed).uniform((0, 0), (width, height), size=(dots, 2))
+    arrow_position = Position(width / 2, height / 2)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        bot.decide(positions, arrow_position)
+    return {'dots': dots, 'decision_us': round((time.perf_counter() - start) / repeats * 1e6, 1)}
+
+
+def main(argv=None):
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Density bot playtesting benchmark")
+    parser.add_argument('--games', type=int, default=20, help="games per policy")
+    parser.add_argument('--max-seconds', type=float, default=120.0, help="game time cap per game")
+    parser.add_argument('--dots', type=int, nargs='+', default=[100, 1000, 10000, 100000],
+                        help="dot counts for decision timing")
+    parser.add_argument('--repeats', type=int, default=200, help="decisions timed per dot count")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+
+    print(json.dumps({
+        'max_seconds': args.max_seconds,
+        'bot': run_policy('bot', args.games, args.max_seconds),
+        'random': run_policy('random', args.games, args.max_seconds),
+        'decisions': [time_decisions(dots, args.repeats, 1) for dots in args.dots]
+    }))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Arrow collision cost benchmark: point test vs two-phase polygon test.
+
+For each dot count, runs a headless game scene (the pipeline benchmark's
+dots surrounding the arrow, collisions off) to measure the update and draw
+time of a frame and to let the dots close in on the arrow. Then, on the
+frame's spatial grid, times the previous check (arrow as a point against
+the dot radius) against the two-phase check (bounding circle, then the
+rotated polygon for the candidates) while the arrow turns, and reports
+the difference as a share of the frame time. Prints the results as JSON.
+
+Usage:
+    python -m src.benchmarks.collision_benchmark [--dots N [N ...]] [--frames N]
+"""
+import argparse
+import json
+import os
+import time
+
+
+def run_scene(screen, dots: int, frames: int, repeats: int, seed: int) -> dict:
+    """
+    Measure one dot count.
+
+    Args:
+        screen: Display surface
+        dots: Number of red dots in the scene
+        frames: Frames to run before timing the checks
+        repeats: Collision checks timed per test
+        seed: Random seed for the scene
+
+    Returns:
+        Dictionary of measurements
+    """
+    from src.benchmarks.pipeline_benchmark import build_scene
+    from src.config.config_loader import config
+    from src.general.game_loop import GameLoop
+
+    game_loop = GameLoop(*screen.get_size())
+    game_loop.quality_governor = None
+    game_loop.initialize_game()
+    build_scene(game_loop, dots, seed)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        game_loop.update()
+        game_loop.draw(screen)
+    frame_ms = (time.perf_counter() - start) / frames * 1000
+
+    collision = game_loop.red_dot_white_arrow_collision
+    # Switch collisions back on for the timed checks
+    collision.red_dot_radius = config.get('media', 'pics', 'red_dot_pic', 'radius')
+    white_arrow = game_loop.white_arrow
+    grid = game_loop.get_red_dot_grid()
+    position = white_arrow.position
+
+    start = time.perf_counter()
+    point_hits = 0
+    for _ in range(repeats):
+        point_hits += len(grid.query_circle(position.x, position.y, collision.red_dot_radius)) > 0
+    point_us = (time.perf_counter() - start) / repeats * 1e6
+
+    start = time.perf_counter()
+    polygon_hits = 0
+    for repeat in range(repeats):
+        # Turn the arrow so the rotated outline has to be recomputed each check
+        white_arrow.pic.rotation_angle = repeat % 360
+        polygon_hits += collision.check_all_collisions(game_loop.red_dots, white_arrow, grid)
+    polygon_us = (time.perf_counter() - start) / repeats * 1e6
+
+    reach = collision.red_dot_radius + white_arrow.pic.bounding_radius
+    return {
+        'dots': dots,
+        'frame_ms': round(frame_ms, 3),
+        'candidates': len(grid.query_circle(position.x, position.y, reach)),
+        'point_us': round(point_us, 2),
+        'two_phase_us': round(polygon_us, 2),
+        'two_phase_hit': polygon_hits > 0,
+        'point_hit': point_hits > 0,
+        'frame_cost_change_pct': round((polygon_us - point_us) / 1000 / frame_ms * 100, 3)
+    }
+
+
+def main(argv=None):
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Arrow collision cost benchmark")
+    parser.add_argument('--dots', type=int, nargs='+', default=[100, 1000, 5000], help="dot counts to measure")
+    parser.add_argument('--frames', type=int, default=120, help="frames run before timing the checks")
+    parser.add_argument('--repeats', type=int, default=2000, help="collision checks timed per test")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for the scenes")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+    pygame.font.init()
+    from src.config.config_loader import config
+    screen = pygame.display.set_mode((config.get_screen_width(), config.get_screen_height()))
+
+    print(json.dumps({
+        'frames': args.frames,
+        'scenes': [run_scene(screen, dots, args.frames, args.repeats, args.seed) for dots in args.dots]
+    }))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Kernel backend conformance and speed benchmark.
+
+Runs the conformance checks (src.logic.kernels.conformance) against every
+kernel backend available here, then times each kernel on each backend side
+by side at growing sizes: chase() on n dots, chase_targets() on n dots
+with a target each, points_in_circles() for n dots against a few bomb
+circles, and circles_hit_polygon() for n candidates against the white
+arrow. Finally times whole headless game
+ticks with n dots and an invulnerable arrow on each backend. Prints the
+results as JSON and exits with status 1 if any backend does not conform.
+
+Usage:
+    python -m src.benchmarks.kernel_benchmark [--sizes N [N ...]] [--repeats N] [--ticks N]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+
+def time_call(function, repeats: int) -> float:
+    """
+    Time a call.
+
+    Args:
+        function: Callable without arguments
+        repeats: Number of calls to time
+
+    Returns:
+        Microseconds per call
+    """
+    function()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+
+def time_kernels(kernels, size: int, repeats: int, seed: int) -> dict:
+    """
+    Time every kernel of a backend at one size.
+
+    Args:
+        kernels: The backend
+        size: Number of dots (or polygon candidates)
+        repeats: Calls timed per kernel
+        seed: Random seed for the inputs
+
+    Returns:
+        Dictionary of microseconds per call
+    """
+    import numpy as np
+    from src.logic.kernels.conformance import ARROW_OUTLINE
+
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 2000, size=(size, 2))
+    speeds = np.full(size, 1.5)
+    targets = rng.uniform(0, 2000, size=(size, 2))
+    centers = rng.uniform(0, 2000, size=(3, 2))
+    radii = np.full(3, 120.0)
+    offsets = rng.uniform(-16, 16, size=(size, 2))
+    return {
+        'size': size,
+        'chase_us': round(time_call(lambda: kernels.chase(positions, speeds, 1000.0, 1000.0), repeats), 1),
+        'chase_targets_us': round(time_call(lambda: kernels.chase_targets(positions, speeds, targets), repeats), 1),
+        'points_in_circles_us': round(time_call(lambda: kernels.points_in_circles(positions, centers, radii),
+                                                repeats), 1),
+        'circles_hit_polygon_us': round(time_call(lambda: kernels.circles_hit_polygon(offsets, 7.5, ARROW_OUTLINE),
+                                                  repeats), 1)
+    }
+
+
+def time_ticks(dots: int, ticks: int, seed: int) -> float:
+    """
+    Time headless game ticks with the current backend.
+
+    Args:
+        dots: Number of red dots placed at the start (no more are spawned)
+        ticks: Ticks to time
+        seed: Random seed for the dot positions
+
+    Returns:
+        Microseconds per tick
+    """
+    import random
+    from src.general.game_loop import GameLoop
+    from src.general.items.red_dot import RedDot
+    from src.general.position import Position
+
+    game_loop = GameLoop()
+    game_loop.initialize_game()
+    game_loop.red_dot_emitter.stop()
+    game_loop.red_dot_white_arrow_collision.red_dot_radius = -1
+    rng = random.Random(seed)
+    for _ in range(dots):
+        game_loop.red_dots.append(RedDot(Position(rng.uniform(0, game_loop.world_width),
+                                                  rng.uniform(0, game_loop.world_height))))
+    start = time.perf_counter()
+    for tick in range(ticks):
+        # Keep the dots spread out by moving the arrow around the world
+        game_loop.mouse_position = (rng.uniform(0, game_loop.screen_width), rng.uniform(0, game_loop.screen_height))
+        if tick % game_loop.fps == 0:
+            game_loop.bomb_control.bomb_activated = True
+        game_loop.update()
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def main(argv=None):
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Kernel backend benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000], help="kernel input sizes")
+    parser.add_argument('--repeats', type=int, default=200, help="calls timed per kernel and size")
+    parser.add_argument('--ticks', type=int, default=300, help="game ticks timed per backend")
+    parser.add_argument('--dots', type=int, default=2000, help="red dots in the timed game")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for the inputs")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+    from src.logic.kernels.conformance import check_conformance
+    from src.logic.kernels.kernel_backend import KernelBackend, kernel_backend
+
+    available = KernelBackend.get_available()
+    results = {}
+    failures = {}
+    for name in available:
+        kernels = kernel_backend.select(name)
+        failures[name] = check_conformance(kernels, args.seed)
+        results[name] = {
+            'conforms': not failures[name],
+            'kernels': [time_kernels(kernels, size, args.repeats, args.seed) for size in args.sizes],
+            'tick_us': round(time_ticks(args.dots, args.ticks, args.seed), 1)
+        }
+
+    print(json.dumps({
+        'available': available,
+        'unavailable': [name for name in KernelBackend.BACKENDS if name not in available],
+        'dots': args.dots,
+        'backends': results,
+        'failures': {name: found for name, found in failures.items() if found}
+    }))
+    pygame.quit()
+    if any(failures.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Frame pacing and GC pause benchmark.
+
+Runs GameLoop.run at the configured frame rate under the SDL dummy video
+driver, once with the default pacing (clock.tick, automatic GC) and once in
+low-jitter mode (tick_busy_loop, GC in frame slack time), and prints the
+frame pacer's frame time and GC pause statistics as JSON.
+
+The game's own objects are mostly freed by reference counting, so each
+frame also creates some short-lived reference cycles (--cycles) to stand
+in for the cyclic garbage that larger scenes and extensions produce.
+
+Usage:
+    python -m src.benchmarks.pacing_benchmark [--dots N] [--frames N] [--cycles N]
+"""
+import argparse
+import json
+import os
+
+
+def make_cycles(count: int):
+    """
+    Create and drop reference cycles that only the cyclic GC can free.
+
+    Args:
+        count: Number of cycles to create
+    """
+    for _ in range(count):
+        node = {}
+        node['self'] = node
+
+
+def run_mode(screen, dots: int, frames: int, cycles: int, seed: int, low_jitter: bool) -> dict:
+    """
+    Measure one pacing mode.
+
+    Args:
+        screen: Display surface
+        dots: Number of red dots in the scene
+        frames: Number of frames to run
+        cycles: Reference cycles created per frame
+        seed: Random seed for the scene
+        low_jitter: Whether to busy-wait and run GC in frame slack time
+
+    Returns:
+        The frame pacer statistics
+    """
+    from src.general.game_loop import GameLoop
+    from src.benchmarks.pipeline_benchmark import build_scene
+
+    game_loop = GameLoop(*screen.get_size())
+    game_loop.quality_governor = None
+    game_loop.frame_pacer.busy_loop = low_jitter
+    game_loop.frame_pacer.manage_gc = low_jitter
+    game_loop.initialize_game()
+    build_scene(game_loop, dots, seed)
+
+    update = game_loop.update
+
+    def update_with_garbage():
+        make_cycles(cycles)
+        update()
+
+    game_loop.update = update_with_garbage
+
+    for _ in range(frames):
+        game_loop.run(screen)
+
+    stats = game_loop.frame_pacer.get_stats()
+    game_loop.frame_pacer.close()
+    return {key: round(value, 3) if isinstance(value, float) else value for key, value in stats.items()}
+
+
+def main(argv=None):
+    """Run both modes and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Frame pacing and GC pause benchmark")
+    parser.add_argument('--dots', type=int, default=1000, help="number of red dots in the scene")
+    parser.add_argument('--frames', type=int, default=600, help="number of frames to run per mode")
+    parser.add_argument('--cycles', type=int, default=2000, help="reference cycles created per frame")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for the scene")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+    pygame.font.init()
+    from src.config.config_loader import config
+    screen = pygame.display.set_mode((config.get_screen_width(), config.get_screen_height()))
+
+    print(json.dumps({
+        'dots': args.dots,
+        'frames': args.frames,
+        'cycles_per_frame': args.cycles,
+        'default': run_mode(screen, args.dots, args.frames, args.cycles, args.seed, low_jitter=False),
+        'low_jitter': run_mode(screen, args.dots, args.frames, args.cycles, args.seed, low_jitter=True)
+    }))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Particle system throughput benchmark.
+
+Keeps a fixed number of particles alive (refilling expired ones with new
+bursts every frame, as a steady stream of explosions would) and times the
+vectorized update and bulk draw onto a screen-sized 32-bit surface. For
+comparison, the same work is timed with one Python object per particle,
+updated in a loop and drawn with one fill per particle. Prints
+milliseconds per frame and the share of a frame at the game's frame rate
+as JSON.
+
+Usage:
+    python -m src.benchmarks.particle_benchmark [--particles N [N ...]] [--frames N] [--naive N]
+"""
+import argparse
+import json
+import os
+import time
+
+
+class NaiveParticle:
+    """One particle as a Python object, for comparison."""
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'age', 'lifetime', 'color')
+
+    def __init__(self, x, y, vx, vy, lifetime, color):
+        """Initialize the particle."""
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+        self.age = 0
+        self.lifetime = lifetime
+        self.color = color
+
+
+def run_arrays(particles: int, frames: int, seed: int) -> dict:
+    """
+    Time the array-backed particle system.
+
+    Args:
+        particles: Number of live particles to maintain
+        frames: Number of frames to time
+        seed: Random seed
+
+    Returns:
+        Dictionary of measurements
+    """
+    import numpy as np
+    import pygame
+    from src.config.config_loader import config
+    from src.general.particles.particle_system import ParticleSystem
+    from src.media.pics.particle_bulk_pic import ParticleBulkPic
+
+    width, height = config.get_screen_width(), config.get_screen_height()
+    surface = pygame.Surface((width, height), depth=32)
+    system = ParticleSystem(capacity=particles, seed=seed)
+    pic = ParticleBulkPic()
+    rng = np.random.default_rng(seed)
+
+    def refill():
+        missing = particles - len(system)
+        bursts = -(-missing // system.particles_per_burst)
+        system.burst(rng.uniform((0, 0), (width, height), size=(bursts, 2)))
+
+    refill()
+    update_seconds = draw_seconds = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        system.update()
+        refill()
+        middle = time.perf_counter()
+        positions, colors = system.get_visible(0, 0, width, height)
+        pic.draw(surface, positions, colors, system.color_table)
+        end = time.perf_counter()
+        update_seconds += middle - start
+        draw_seconds += end - middle
+
+    frame_ms = 1000 / config.get_fps()
+    total_ms = (update_seconds + draw_seconds) / frames * 1000
+    return {
+        'particles': particles,
+        'update_ms': round(update_seconds / frames * 1000, 3),
+        'draw_ms': round(draw_seconds / frames * 1000, 3),
+        'frame_share': round(total_ms / frame_ms, 3)
+    }
+
+
+def run_naive(particles: int, frames: int, seed: int) -> dict:
+    """
+    Time one Python object per particle.
+
+    Args:
+        particles: Number of live particles to maintain
+        frames: Number of frames to time
+        seed: Random seed
+
+    Returns:
+        Dictionary of measurements
+    """
+    import math
+    import random
+    import pygame
+    from src.config.config_loader import config
+
+    cfg = config.get('general', 'particles', 'particle_system')
+    size = config.get('media', 'pics', 'particle_bulk_pic', 'size')
+    width, height = config.get_screen_width(), config.get_screen_height()
+    surface = pygame.Surface((width, height), depth=32)
+    rng = random.Random(seed)
+    live = []
+
+    def refill():
+        while len(live) < particles:
+            x, y = rng.uniform(0, width), rng.uniform(0, height)
+            for _ in range(min(cfg['particles_per_burst'], particles - len(live))):
+                angle = rng.uniform(0, 2 * math.pi)
+                speed = rng.uniform(cfg['speed_min'], cfg['speed_max'])
+                live.append(NaiveParticle(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
+                                          rng.randint(cfg['lifetime_frames_min'], cfg['lifetime_frames_max']),
+                                          tuple(rng.choice(cfg['colors']))))
+
+    refill()
+    update_seconds = draw_seconds = 0.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        survivors = []
+        for particle in live:
+            particle.x += particle.vx
+            particle.y += particle.vy
+            particle.vx *= cfg['drag']
+            particle.vy *= cfg['drag']
+            particle.age += 1
+            if particle.age < particle.lifetime:
+                survivors.append(particle)
+        live[:] = survivors
+        refill()
+        middle = time.perf_counter()
+        for particle in live:
+            fade = 1 - particle.age / particle.lifetime
+            color = tuple(int(channel * fade) for channel in particle.color)
+            surface.fill(color, (int(particle.x), int(particle.y), size, size))
+        end = time.perf_counter()
+        update_seconds += middle - start
+        draw_seconds += end - middle
+
+    frame_ms = 1000 / config.get_fps()
+    total_ms = (update_seconds + draw_seconds) / frames * 1000
+    return {
+        'particles': particles,
+        'update_ms': round(update_seconds / frames * 1000, 3),
+        'draw_ms': round(draw_seconds / frames * 1000, 3),
+        'frame_share': round(total_ms / frame_ms, 3)
+    }
+
+
+def main(argv=None):
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Particle system throughput benchmark")
+    parser.add_argument('--particles', type=int, nargs='+', default=[10000, 50000, 100000],
+                        help="live particle counts for the array-backed system")
+    parser.add_argument('--naive', type=int, default=10000, help="live particle count for the object-per-particle run")
+    parser.add_argument('--frames', type=int, default=300, help="frames to time per run")
+    parser.add_argument('--seed', type=int, default=1, help="random seed")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+
+    print(json.dumps({
+        'frames': args.frames,
+        'arrays': [run_arrays(particles, args.frames, args.seed) for particles in args.particles],
+        'objects': run_naive(args.naive, args.frames, args.seed)
+    }))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Flow-field pathfinding benchmark.
+
+For each configured obstacle layout, computes flow-field distance tables
+for a set of target cells with the directional sweeps FlowField uses and
+with a plain Dijkstra search (heapq over the same 8-connected grid and
+costs), checks that both give the same distances and reports the time per
+table. Then times one tick of red dot movement at growing dot counts, as
+a straight chase and through the flow field, to show that the per-dot
+cost of the field is a constant lookup. Finally plays a seeded headless
+game on each layout with the density bot, checking after every tick that
+no red dot is inside an obstacle. Prints the results as JSON and exits
+with status 1 if the sweeps and Dijkstra disagree or a dot enters an
+obstacle.
+
+Usage:
+    python -m src.benchmarks.pathfinding_benchmark [--targets N] [--dots N [N ...]] [--repeats N] [--seconds N]
+"""
+import argparse
+import heapq
+import json
+import os
+import sys
+import time
+
+
+def dijkstra_distances(flow_field, target_cell: int):
+    """
+    Compute a flow field's distances with Dijkstra's algorithm, as a reference.
+
+    Args:
+        flow_field: FlowField whose grid, neighbors and step costs are used
+        target_cell: Flat index of the target cell
+
+    Returns:
+        Flat array of distances, like FlowField._compute_distances
+    """
+    import numpy as np
+
+    neighbor_cells = flow_field.neighbor_cells.T.tolist()
+    step_costs = flow_field.step_costs.T.tolist()
+    distances = [flow_field.UNREACHABLE] * len(neighbor_cells)
+    if not flow_field.obstacle_layer.blocked.flat[target_cell]:
+        distances[target_cell] = 0
+        queue = [(0, target_cell)]
+        while queue:
+            distance, cell = heapq.heappop(queue)
+            if distance > distances[cell]:
+                continue
+            for neighbor, cost in zip(neighbor_cells[cell], step_costs[cell]):
+                if cost < flow_field.UNREACHABLE and distance + cost < distances[neighbor]:
+                    distances[neighbor] = distance + cost
+                    heapq.heappush(queue, (distance + cost, neighbor))
+    return np.array(distances, dtype=np.int64)
+
+
+def compare_layout(rects: list, targets: int, seed: int, world_size: tuple) -> dict:
+    """
+    Compute tables for random target cells with both methods.
+
+    Args:
+        rects: Obstacle rectangles of the layout
+        targets: Number of target cells
+        seed: Random seed for the target cells
+        world_size: (width, height) of the world
+
+    Returns:
+        Dictionary of measurements
+    """
+    import numpy as np
+    from src.logic.pathfinding.flow_field import FlowField
+    from src.logic.pathfinding.obstacle_layer import ObstacleLayer
+
+    obstacle_layer = ObstacleLayer(*world_size, rects)
+    flow_field = FlowField(obstacle_layer)
+    free_cells = np.flatnonzero(~obstacle_layer.blocked)
+    target_cells = np.random.default_rng(seed).choice(free_cells, size=targets).tolist()
+
+    sweep_seconds = dijkstra_seconds = 0.0
+    mismatches = 0
+    for target_cell in target_cells:
+        start = time.perf_counter()
+        swept = flow_field._compute_distances(target_cell)
+        flow_field._compute_next_cells(target_cell)
+        sweep_seconds += time.perf_counter() - start
+        start = time.perf_counter()
+        expected = dijkstra_distances(flow_field, target_cell)
+        dijkstra_seconds += time.perf_counter() - start
+        mismatches += not np.array_equal(swept, expected)
+
+    return {
+        'cells': obstacle_layer.rows * obstacle_layer.columns,
+        'blocked_cells': int(obstacle_layer.blocked.sum()),
+        'table_us': round(sweep_seconds / targets * 1e6, 1),
+        'dijkstra_us': round(dijkstra_seconds / targets * 1e6, 1),
+        'mismatches': mismatches
+    }
+
+
+def time_movement(rects: list, dots: int, repeats: int, seed: int, world_size: tuple) -> dict:
+    """
+    Time moving dots one tick, straight and through the flow field.
+
+    The field's table is computed before timing, as on the ticks where the
+    target stays in its cell.
+
+    Args:
+        rects: Obstacle rectangles of the layout
+        dots: Number of dots
+        repeats: Ticks timed
+        seed: Random seed for the dot positions
+        world_size: (width, height) of the world
+
+    Returns:
+        Dictionary of microseconds per tick and per dot
+    """
+    import numpy as np
+    from src.logic.kernels.kernel_backend import kernel_backend
+    from src.logic.pathfinding.flow_field import FlowField
+    from src.logic.pathfinding.obstacle_layer import ObstacleLayer
+
+    obstacle_layer = ObstacleLayer(*world_size, rects)
+    flow_field = FlowField(obstacle_layer)
+    kernels = kernel_backend.kernels
+    positions = np.random.default_rng(seed).uniform((0, 0), world_size, size=(dots, 2))
+    speeds = np.full(dots, 1.5)
+    target_x, target_y = world_size[0] / 2, world_size[1] / 2
+    flow_field.update(target_x, target_y)
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        kernels.chase(positions, speeds, target_x, target_y)
+    straight = (time.perf_counter() - start) / repeats
+    start = time.perf_counter()
+    for _ in range(repeats):
+        kernels.chase_targets(positions, speeds, flow_field.get_waypoints(positions, target_x, target_y))
+    flow = (time.perf_counter() - start) / repeats
+    return {
+        'dots': dots,
+        'straight_us': round(straight * 1e6, 1),
+        'flow_field_us': round(flow * 1e6, 1),
+        'flow_field_ns_per_dot': round(flow / dots * 1e9, 1)
+    }
+
+
+def play_layout(rects: list, seconds: float, seed: int) -> dict:
+    """
+    Play one headless bot game among obstacles.
+
+    Args:
+        rects: Obstacle rectangles of the layout
+        seconds: Game time after which the game is stopped
+        seed: Random seed for red dot spawning
+
+    Returns:
+        Dictionary with survival time, flow field statistics and dots found inside obstacles
+    """
+    import numpy as np
+    from src.general.game_loop import GameLoop
+    from src.logic.control.density_bot import DensityBot
+
+    game_loop = GameLoop()
+    game_loop.set_obstacles(rects)
+    game_loop.initialize_game()
+    game_loop.red_dot_spawn.rng.seed(seed)
+    game_loop.bot = DensityBot(game_loop.world_width, game_loop.world_height)
+    blocked = game_loop.obstacle_layer.blocked.ravel()
+
+    max_frames = int(seconds * game_loop.fps)
+    frames = 0
+    blocked_dots = 0
+    start = time.perf_counter()
+    while not game_loop.game_over and frames < max_frames:
+        game_loop.update()
+        frames += 1
+        positions = game_loop.get_red_dot_grid().positions
+        blocked_dots += int(np.count_nonzero(blocked[game_loop.obstacle_layer.get_cells(positions)]))
+    elapsed = time.perf_counter() - start
+
+    stats = game_loop.flow_field.get_stats()
+    return {
+        'seconds': frames / game_loop.fps,
+        'final_dots': len(game_loop.red_dots),
+        'fields_computed': stats['fields_computed'],
+        'cache_hits': stats['cache_hits'],
+        'compute_mean_us': round(stats['compute_mean_us'], 1),
+        'tick_mean_us': round(elapsed / max(frames, 1) * 1e6, 1),
+        'blocked_dots': blocked_dots
+    }
+
+
+def main(argv=None):
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Flow-field pathfinding benchmark")
+    parser.add_argument('--targets', type=int, default=30, help="target cells per layout")
+    parser.add_argument('--dots', type=int, nargs='+', default=[1000, 10000, 50000], help="dot counts to move")
+    parser.add_argument('--repeats', type=int, default=50, help="ticks timed per dot count")
+    parser.add_argument('--seconds', type=float, default=60.0, help="game time per layout for the bot games")
+    parser.add_argument('--seed', type=int, default=1, help="random seed")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+
+    from src.config.config_loader import config
+    from src.logic.kernels.kernel_backend import kernel_backend
+
+    world_size = (config.get_world_width(), config.get_world_height())
+    layouts = {name: rects for name, rects in config.get('logic', 'pathfinding', 'obstacle_layer', 'layouts').items()
+               if rects}
+    tables = {name: compare_layout(rects, args.targets, args.seed, world_size) for name, rects in layouts.items()}
+    movement = {name: [time_movement(rects, dots, args.repeats, args.seed, world_size) for dots in args.dots]
+                for name, rects in layouts.items()}
+    games = {name: play_layout(rects, args.seconds, args.seed) for name, rects in layouts.items()}
+
+    print(json.dumps({
+        'kernels': kernel_backend.kernels.name,
+        'tables': tables,
+        'movement': movement,
+        'games': games
+    }))
+    pygame.quit()
+    if (any(result['mismatches'] for result in tables.values()) or
+            any(result['blocked_dots'] for result in games.values())):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
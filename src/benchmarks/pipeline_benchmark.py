@@ -0,0 +1,118 @@
+"""Serial versus pipelined game loop benchmark.
+
+Runs the same seeded scene with GameLoop.run in its default serial mode
+and with a SimulationWorker attached, under the SDL dummy video driver and
+without frame-rate capping, and prints frames per second, simulation
+ticks per second and the measured thread parallelism as JSON.
+
+Usage:
+    python -m src.benchmarks.pipeline_benchmark [--dots N] [--frames N]
+"""
+import argparse
+import json
+import math
+import os
+import random
+import time
+
+
+def build_scene(game_loop, dots: int, seed: int):
+    """
+    Place the arrow in the corner the dummy mouse points at and surround it with dots.
+
+    Spawning and the arrow collision are switched off so the dot count stays
+    fixed and the game keeps running for the whole measurement.
+
+    Args:
+        game_loop: An initialized GameLoop
+        dots: Number of red dots to place
+        seed: Random seed for the dot angles
+    """
+    from src.general.items.red_dot import RedDot
+    from src.general.position import Position
+
+    game_loop.red_dot_emitter.stop()
+    game_loop.red_dot_white_arrow_collision.red_dot_radius = -1
+
+    rng = random.Random(seed)
+    game_loop.white_arrow.position = Position(0, 0)
+    game_loop.red_dots = []
+    for _ in range(dots):
+        angle = rng.uniform(0, math.pi / 2)
+        radius = rng.uniform(100, 1400)
+        game_loop.red_dots.append(RedDot(Position(radius * math.cos(angle), radius * math.sin(angle))))
+
+
+def run_mode(screen, dots: int, frames: int, seed: int, pipelined: bool) -> dict:
+    """
+    Measure one mode.
+
+    Args:
+        screen: Display surface
+        dots: Number of red dots in the scene
+        frames: Number of frames to render
+        seed: Random seed for the scene
+        pipelined: Whether to attach a SimulationWorker
+
+    Returns:
+        Dictionary of measurements
+    """
+    from src.general.game_loop import GameLoop
+    from src.general.pipeline.simulation_worker import SimulationWorker
+
+    game_loop = GameLoop(*screen.get_size())
+    game_loop.initialize_game()
+    game_loop.red_dot_spawn.rng.seed(seed)
+    build_scene(game_loop, dots, seed)
+    # Uncapped: measure throughput rather than pacing
+    game_loop.fps = 0
+
+    worker = None
+    if pipelined:
+        worker = SimulationWorker(game_loop)
+        game_loop.simulation_worker = worker
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        game_loop.run(screen)
+    elapsed = time.perf_counter() - start
+
+    result = {'frames_per_second': round(frames / elapsed, 1)}
+    if worker is not None:
+        stats = worker.get_stats()
+        worker.stop()
+        result['ticks_per_second'] = round(stats['ticks'] / stats['wall_seconds'], 1)
+        result['parallelism'] = round(stats['parallelism'], 3)
+    else:
+        result['ticks_per_second'] = result['frames_per_second']
+        result['parallelism'] = 1.0
+    game_loop.frame_pacer.close()
+    return result
+
+
+def main(argv=None):
+    """Run both modes and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Pipelined game loop benchmark")
+    parser.add_argument('--dots', type=int, default=2000, help="number of red dots in the scene")
+    parser.add_argument('--frames', type=int, default=200, help="number of frames to render per mode")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for the scene")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+    pygame.font.init()
+    from src.config.config_loader import config
+    screen = pygame.display.set_mode((config.get_screen_width(), config.get_screen_height()))
+
+    print(json.dumps({
+        'dots': args.dots,
+        'frames': args.frames,
+        'serial': run_mode(screen, args.dots, args.frames, args.seed, pipelined=False),
+        'pipelined': run_mode(screen, args.dots, args.frames, args.seed, pipelined=True)
+    }))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
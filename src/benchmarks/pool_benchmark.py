@@ -0,0 +1,86 @@
+"""Item pool allocation benchmark.
+
+Simulates bomb-heavy play (a red dot spawned every frame and a bomb every
+few frames, arrow collision disabled) with the red dot and green circle
+pools enabled and disabled, and prints how many items were constructed,
+the pool statistics and the mean update time as JSON.
+
+Usage:
+    python -m src.benchmarks.pool_benchmark [--frames N] [--bomb-interval N]
+"""
+import argparse
+import json
+import os
+import time
+
+
+def run_mode(frames: int, bomb_interval: int, seed: int, pooled: bool) -> dict:
+    """
+    Simulate one mode.
+
+    Args:
+        frames: Number of simulation frames
+        bomb_interval: Frames between bombs
+        seed: Random seed for red dot spawning
+        pooled: Whether released items are reused
+
+    Returns:
+        Dictionary of measurements
+    """
+    from src.general.game_loop import GameLoop
+
+    game_loop = GameLoop()
+    game_loop.red_dot_pool.enabled = pooled
+    game_loop.green_circle_pool.enabled = pooled
+    game_loop.initialize_game()
+    game_loop.red_dot_spawn.rng.seed(seed)
+    game_loop.red_dot_emitter.set_rate(game_loop.fps)
+    game_loop.red_dot_white_arrow_collision.red_dot_radius = -1
+    # Hold the arrow still so the dots converge on it and the bombs keep hitting
+    arrow = game_loop.white_arrow.position
+    game_loop.mouse_position = (arrow.x - game_loop.camera.x, arrow.y - game_loop.camera.y)
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        if frame % bomb_interval == 0:
+            game_loop.bomb_control.bomb_activated = True
+        game_loop.update()
+    elapsed = time.perf_counter() - start
+
+    red_dot_stats = game_loop.red_dot_pool.get_stats()
+    green_circle_stats = game_loop.green_circle_pool.get_stats()
+    constructed = red_dot_stats['misses'] + green_circle_stats['misses']
+    game_seconds = frames / game_loop.fps
+    return {
+        'items_constructed': constructed,
+        'items_constructed_per_game_second': round(constructed / game_seconds, 1),
+        'red_dots_destroyed': game_loop.score_tracker.red_dots_destroyed,
+        'update_ms': round(elapsed / frames * 1000, 3),
+        'red_dot_pool': red_dot_stats,
+        'green_circle_pool': green_circle_stats
+    }
+
+
+def main(argv=None):
+    """Run both modes and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Item pool allocation benchmark")
+    parser.add_argument('--frames', type=int, default=3600, help="number of simulation frames per mode")
+    parser.add_argument('--bomb-interval', type=int, default=20, help="frames between bombs")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for red dot spawning")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+
+    print(json.dumps({
+        'frames': args.frames,
+        'bomb_interval': args.bomb_interval,
+        'unpooled': run_mode(args.frames, args.bomb_interval, args.seed, pooled=False),
+        'pooled': run_mode(args.frames, args.bomb_interval, args.seed, pooled=True)
+    }))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
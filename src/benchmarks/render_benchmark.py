@@ -0,0 +1,56 @@
+"""Golden-image render equivalence and speed benchmark.
+
+Renders the seeded golden scenes (src.general.golden.golden_scenes) with
+every render path offscreen under the SDL dummy video driver, compares
+each frame with the scene's stored golden image (per-pixel and perceptual
+tolerances from general.golden.golden_harness) and times every path on
+every scene. Prints the results as JSON and exits with status 1 if any
+frame does not match its golden image.
+
+After an intended visual change, regenerate the golden images with
+--update and review them before committing.
+
+Usage:
+    python -m src.benchmarks.render_benchmark [--update] [--scenes NAME [NAME ...]] [--paths NAME [NAME ...]]
+                                              [--repeats N] [--diff-dir DIR]
+"""
+import argparse
+import json
+import os
+import sys
+
+
+def main(argv=None):
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Golden-image render benchmark")
+    parser.add_argument('--update', action='store_true',
+                        help="store the reference path's frames as the new golden images instead of checking")
+    parser.add_argument('--scenes', nargs='+', help="scenes to render (default: all)")
+    parser.add_argument('--paths', nargs='+', help="render paths to check (default: all)")
+    parser.add_argument('--repeats', type=int, default=20, help="frames timed per scene and path (0: no timing)")
+    parser.add_argument('--diff-dir', metavar='DIR', help="write failing frames and difference images to DIR")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+    pygame.font.init()
+    from src.general.golden.golden_harness import GoldenHarness
+
+    harness = GoldenHarness()
+    if args.update:
+        print(json.dumps({'written': harness.update_goldens(args.scenes)}))
+        pygame.quit()
+        return
+
+    results = harness.check(args.scenes, args.paths, args.repeats, args.diff_dir)
+    failures = [f"{scene}/{path}" for scene, paths in results.items()
+                for path, result in paths.items() if not result['passed']]
+    print(json.dumps({'size': list(harness.size), 'scenes': results, 'failures': failures}))
+    pygame.quit()
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Tick scheduler benchmark: per-object frame counters vs a timer wheel.
+
+Keeps a fixed number of objects with random lifetimes alive (an expired
+object is replaced by a new one) and measures the time per tick of
+expiring them in two ways: a frame counter per object that is advanced and
+checked every tick (as green circles did), and one TickScheduler timer per
+object, where a tick only touches the timers that expire. Then counts the
+emissions of RateEmitter against the old frames-per-spawn rounding for a
+few spawn rates. Finally forks seeded games through a snapshot at spawn
+rates whose interval is not a whole number of ticks and checks that the
+restored fork spawns on the same ticks and ends in the same state as the
+original. Prints the results as JSON and exits with status 1 if a fork
+diverges.
+
+Usage:
+    python -m src.benchmarks.scheduler_benchmark [--objects N [N ...]] [--ticks N]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+
+class CountedObject:
+    """An object that tracks its own lifetime with a frame counter."""
+
+    __slots__ = ('current_frame', 'lifetime_frames')
+
+    def __init__(self, lifetime_frames: int):
+        """
+        Initialize the object.
+
+        Args:
+            lifetime_frames: Frames until the object expires
+        """
+        self.current_frame = 0
+        self.lifetime_frames = lifetime_frames
+
+    def update(self) -> bool:
+        """Advance the counter; True once the lifetime is over."""
+        self.current_frame += 1
+        return self.current_frame >= self.lifetime_frames
+
+
+def run_counters(objects: int, ticks: int, seed: int) -> float:
+    """
+    Expire objects by scanning their counters every tick.
+
+    Args:
+        objects: Number of live objects
+        ticks: Ticks to run
+        seed: Random seed for the lifetimes
+
+    Returns:
+        Microseconds per tick
+    """
+    rng = random.Random(seed)
+    live = [CountedObject(rng.randint(30, 300)) for _ in range(objects)]
+    start = time.perf_counter()
+    for _ in range(ticks):
+        expired = [item for item in live if item.update()]
+        if expired:
+            live = [item for item in live if item.current_frame < item.lifetime_frames]
+            live.extend(CountedObject(rng.randint(30, 300)) for _ in expired)
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def run_wheel(objects: int, ticks: int, seed: int) -> float:
+    """
+    Expire objects with one timer each.
+
+    Args:
+        objects: Number of live objects
+        ticks: Ticks to run
+        seed: Random seed for the lifetimes
+
+    Returns:
+        Microseconds per tick
+    """
+    from src.general.timing.tick_scheduler import TickScheduler
+
+    rng = random.Random(seed)
+    scheduler = TickScheduler()
+    live = set()
+
+    def expire(item):
+        live.discard(item)
+        replacement = object()
+        live.add(replacement)
+        scheduler.schedule(rng.randint(30, 300), expire, replacement)
+
+    for _ in range(objects):
+        item = object()
+        live.add(item)
+        scheduler.schedule(rng.randint(30, 300), expire, item)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        scheduler.advance()
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def count_emissions(per_second: float, fps: int, seconds: int) -> dict:
+    """
+    Count a RateEmitter's emissions and the old rounded schedule's spawns.
+
+    Args:
+        per_second: Emission rate
+        fps: Ticks per second
+        seconds: Seconds to run
+
+    Returns:
+        Dictionary with both rates per second
+    """
+    from src.general.timing.tick_scheduler import RateEmitter, TickScheduler
+
+    scheduler = TickScheduler()
+    emitted = []
+    emitter = RateEmitter(scheduler, per_second, fps, lambda: emitted.append(scheduler.tick))
+    emitter.start()
+    for _ in range(seconds * fps):
+        scheduler.advance()
+    frames_per_spawn = max(1, round(fps / per_second))
+    return {
+        'per_second': per_second,
+        'emitter_per_second': round(len(emitted) / seconds, 3),
+        'rounded_per_second': round(seconds * fps // frames_per_spawn / seconds, 3)
+    }
+
+
+def check_fork(per_second: float, ticks_before: int, ticks_after: int, seed: int) -> dict:
+    """
+    Fork a game through a snapshot and compare the fork with the original.
+
+    Args:
+        per_second: Red dot spawn rate
+        ticks_before: Ticks played before the snapshot
+        ticks_after: Ticks both games play after it
+        seed: Random seed for red dot spawning
+
+    Returns:
+        Dictionary with both games' spawn ticks and whether they match
+    """
+    from src.general.game_loop import GameLoop
+
+    def new_game():
+        game_loop = GameLoop()
+        game_loop.initialize_game()
+        game_loop.red_dot_emitter.set_rate(per_second)
+        # The arrow cannot be hit, so both games keep running
+        game_loop.red_dot_white_arrow_collision.red_dot_radius = -1
+        game_loop.mouse_position = (game_loop.screen_width / 3, game_loop.screen_height / 3)
+        return game_loop
+
+    def play(game_loop):
+        spawn_ticks = []
+        for _ in range(ticks_after):
+            dots = len(game_loop.red_dots)
+            game_loop.update()
+            if len(game_loop.red_dots) > dots:
+                spawn_ticks.append(game_loop.scheduler.tick)
+        return spawn_ticks
+
+    original = new_game()
+    original.red_dot_spawn.rng.seed(seed)
+    for _ in range(ticks_before):
+        original.update()
+    fork = new_game()
+    fork.restore(original.snapshot())
+
+    original_spawns = play(original)
+    fork_spawns = play(fork)
+    return {
+        'per_second': per_second,
+        'original_spawn_ticks': original_spawns[:8],
+        'fork_spawn_ticks': fork_spawns[:8],
+        'matches': original_spawns == fork_spawns and original.snapshot() == fork.snapshot()
+    }
+
+
+def main(argv=None):
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Tick scheduler benchmark")
+    parser.add_argument('--objects', type=int, nargs='+', default=[10, 100, 1000, 10000],
+                        help="live object counts")
+    parser.add_argument('--ticks', type=int, default=3000, help="ticks to run per object count")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for the lifetimes")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+
+    forks = [check_fork(rate, 100, 600, args.seed) for rate in (3.3, 5, 7, 13)]
+    print(json.dumps({
+        'ticks': args.ticks,
+        'expiry': [
+            {
+                'objects': objects,
+                'counters_us_per_tick': round(run_counters(objects, args.ticks, args.seed), 2),
+                'wheel_us_per_tick': round(run_wheel(objects, args.ticks, args.seed), 2)
+            }
+            for objects in args.objects
+        ],
+        'emission': [count_emissions(rate, 60, 600) for rate in (5, 7, 13, 45, 90)],
+        'forks': forks
+    }))
+    pygame.quit()
+    if not all(fork['matches'] for fork in forks):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Endurance soak test.
+
+Plays a seeded headless game for a number of game hours with the density
+bot steering and firing bombs, and samples memory, object counts and
+update and draw times every game minute (see SoakRunner). By default the
+arrow cannot be hit, so one game runs for the whole soak and red dots keep
+spawning at the configured rate, the worst case for growth; with --mortal
+the arrow can die and each ended game is followed by a new one.
+
+Prints the report as JSON and exits with status 1 if any growth limit from
+general.profiling.soak_runner is exceeded, or if the run is too short to
+leave a sample after the warm-up before the last one.
+
+Usage:
+    python -m src.benchmarks.soak_benchmark [--hours N] [--mortal] [--output PATH]
+"""
+import argparse
+import json
+import os
+import sys
+
+
+def main(argv=None):
+    """Run the soak test, print the report and exit with its result."""
+    parser = argparse.ArgumentParser(description="Endurance soak test")
+    parser.add_argument('--hours', type=float, default=1.0, help="game hours to simulate")
+    parser.add_argument('--mortal', action='store_true', help="let the arrow be hit and start a new game when it is")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for red dot spawning")
+    parser.add_argument('--sample-seconds', type=float, help="game seconds between samples (default from config)")
+    parser.add_argument('--draw-interval', type=int, help="frames between drawn frames (default from config)")
+    parser.add_argument('--output', metavar='PATH', help="also write the report to PATH")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+    pygame.font.init()
+    from src.config.config_loader import config
+    from src.general.game_loop import GameLoop
+    from src.general.profiling.soak_runner import SoakRunner
+    from src.logic.control.density_bot import DensityBot
+
+    screen = pygame.display.set_mode((config.get_screen_width(), config.get_screen_height()))
+    game_loop = GameLoop(*screen.get_size())
+    game_loop.quality_governor = None
+    game_loop.bot = DensityBot(game_loop.world_width, game_loop.world_height)
+    game_loop.initialize_game()
+    game_loop.red_dot_spawn.rng.seed(args.seed)
+    if not args.mortal:
+        game_loop.red_dot_white_arrow_collision.red_dot_radius = -1
+
+    runner = SoakRunner(game_loop, screen, args.sample_seconds, args.draw_interval)
+    runner.run(args.hours)
+    report = runner.get_report()
+    report['mortal'] = args.mortal
+    print(json.dumps(report))
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    pygame.quit()
+    sys.exit(1 if report['failures'] else 0)
+
+
+if __name__ == "__main__":
+    main()
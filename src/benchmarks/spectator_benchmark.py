@@ -0,0 +1,122 @@
+"""Spectator stream bandwidth and accuracy benchmark over localhost.
+
+For each dot count, runs a seeded game (arrow collision disabled, one dot
+spawned per tick, a bomb every second) with a SpectatorServer on a free
+localhost port and a SpectatorClient reading it in the same process. After
+every tick the client's decoded dots are checked against the server's
+mirror, and the gap between the mirror and the true positions is measured.
+Prints bytes per tick for delta and keyframe messages and the position
+error as JSON.
+
+Usage:
+    python -m src.benchmarks.spectator_benchmark [--dots N [N ...]] [--ticks N]
+"""
+import argparse
+import json
+import math
+import os
+import random
+import time
+
+
+def run_scene(dots: int, ticks: int, seed: int) -> dict:
+    """
+    Stream one scene.
+
+    Args:
+        dots: Number of red dots placed at the start
+        ticks: Number of ticks to stream
+        seed: Random seed for the scene
+
+    Returns:
+        Dictionary of measurements
+    """
+    import numpy as np
+    from src.general.game_loop import GameLoop
+    from src.general.items.red_dot import RedDot
+    from src.general.position import Position
+    from src.general.spectator.spectator_client import SpectatorClient
+    from src.general.spectator.spectator_protocol import SpectatorProtocol
+    from src.general.spectator.spectator_server import SpectatorServer
+
+    game_loop = GameLoop()
+    game_loop.initialize_game()
+    game_loop.red_dot_spawn.rng.seed(seed)
+    game_loop.red_dot_emitter.set_rate(game_loop.fps)
+    game_loop.red_dot_white_arrow_collision.red_dot_radius = -1
+    rng = random.Random(seed)
+    for _ in range(dots):
+        game_loop.red_dots.append(RedDot(Position(rng.uniform(0, game_loop.world_width),
+                                                  rng.uniform(0, game_loop.world_height))))
+    # Circle the arrow around the middle of the screen so the dots keep turning
+    center_x, center_y = game_loop.screen_width / 2, game_loop.screen_height / 2
+
+    server = SpectatorServer('127.0.0.1', 0, (game_loop.world_width, game_loop.world_height))
+    client = SpectatorClient('127.0.0.1', server.get_port())
+
+    delta_sizes = []
+    keyframe_sizes = []
+    errors = []
+    for tick in range(ticks):
+        angle = tick / 30
+        game_loop.mouse_position = (center_x + 300 * math.cos(angle), center_y + 300 * math.sin(angle))
+        if tick % game_loop.fps == 0:
+            game_loop.bomb_control.bomb_activated = True
+        game_loop.update()
+        ticks_before = server.messages_sent
+        server.publish(game_loop)
+        if server.messages_sent > ticks_before:
+            is_keyframe = server.ticks_since_keyframe == 0
+            (keyframe_sizes if is_keyframe else delta_sizes).append(server.last_message_size)
+
+        deadline = time.monotonic() + 5
+        while client.tick != server.tick and time.monotonic() < deadline:
+            client.poll()
+        if not (np.array_equal(client.dot_ids, server.mirror_ids) and
+                np.array_equal(client.dot_positions, server.mirror_positions)):
+            raise AssertionError(f"Client diverged from the server mirror at tick {server.tick}")
+
+        mirror_index = np.searchsorted(server.mirror_ids, [server.object_ids[red_dot.serial]
+                                                           for red_dot in game_loop.red_dots])
+        truth = SpectatorProtocol.quantize(
+            [(red_dot.position.x, red_dot.position.y) for red_dot in game_loop.red_dots], server.quantization
+        ).reshape(-1, 2)
+        if len(truth):
+            error = np.abs(truth - server.mirror_positions[mirror_index]).max(axis=1) / server.quantization
+            errors.append((error.mean(), error.max()))
+
+    client.close()
+    server.close()
+    return {
+        'dots': dots,
+        'final_dots': len(game_loop.red_dots),
+        'delta_bytes_mean': round(sum(delta_sizes) / max(len(delta_sizes), 1), 1),
+        'delta_bytes_max': max(delta_sizes, default=0),
+        'keyframe_bytes_max': max(keyframe_sizes, default=0),
+        'keyframes': len(keyframe_sizes),
+        'error_px_mean': round(float(np.mean([mean for mean, _ in errors])), 3) if errors else 0.0,
+        'error_px_max': round(float(max(worst for _, worst in errors)), 3) if errors else 0.0
+    }
+
+
+def main(argv=None):
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Spectator stream benchmark")
+    parser.add_argument('--dots', type=int, nargs='+', default=[500, 2000, 8000], help="dot counts to stream")
+    parser.add_argument('--ticks', type=int, default=600, help="ticks to stream per dot count")
+    parser.add_argument('--seed', type=int, default=1, help="random seed for the scenes")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+
+    print(json.dumps({
+        'ticks': args.ticks,
+        'scenes': [run_scene(dots, args.ticks, args.seed) for dots in args.dots]
+    }))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Import-time and time-to-first-frame benchmark for game startup.
+
+Each run starts a fresh interpreter under the SDL dummy video driver,
+imports src.main, runs main() until the first menu frame is flipped and
+then closes the window. Results are printed as one JSON object so they
+can be tracked across versions.
+
+Usage:
+    python -m src.benchmarks.startup_benchmark [--runs N]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+# Executed in the child interpreter; prints {"import": s, "first_frame": s}
+CHILD_SCRIPT = """
+import time
+start = time.perf_counter()
+import src.main
+imported = time.perf_counter()
+
+import json
+import pygame
+
+timings = {'import': imported - start}
+original_flip = pygame.display.flip
+
+def flip():
+    original_flip()
+    if 'first_frame' not in timings:
+        timings['first_frame'] = time.perf_counter() - start
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+pygame.display.flip = flip
+src.main.main(['--no-high-scores'])
+print(json.dumps(timings))
+"""
+
+
+def run_once(repo_root: str) -> dict:
+    """
+    Measure one cold start.
+
+    Args:
+        repo_root: Directory containing the src package
+
+    Returns:
+        Dictionary with 'import' and 'first_frame' seconds
+    """
+    env = dict(os.environ)
+    env.setdefault('SDL_VIDEODRIVER', 'dummy')
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT],
+        cwd=repo_root, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    """Run the benchmark and print the median timings as JSON."""
+    parser = argparse.ArgumentParser(description="Startup benchmark")
+    parser.add_argument('--runs', type=int, default=5, help="number of cold starts to measure")
+    args = parser.parse_args(argv)
+
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    runs = [run_once(repo_root) for _ in range(args.runs)]
+
+    print(json.dumps({
+        'runs': args.runs,
+        'import_ms': round(statistics.median(run['import'] for run in runs) * 1000, 2),
+        'first_frame_ms': round(statistics.median(run['first_frame'] for run in runs) * 1000, 2)
+    }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Telemetry recording overhead benchmark.
+
+Plays seeded headless bot games with the timeline recorder attached
+(files written to a temporary directory) and times every record() call,
+then reports the mean cost per tick as a share of the frame budget, the
+time finish_game() spends on the game thread and the size of the written
+files, and checks that a file reads back with the recorded tick count.
+Prints the results as JSON.
+
+Usage:
+    python -m src.benchmarks.telemetry_benchmark [--games N] [--max-seconds N]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+
+def main(argv=None):
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Telemetry recording overhead benchmark")
+    parser.add_argument('--games', type=int, default=5, help="number of games")
+    parser.add_argument('--max-seconds', type=float, default=60.0, help="game time cap per game")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    import pygame
+    pygame.display.init()
+    from src.general.game_loop import GameLoop
+    from src.general.telemetry.timeline_recorder import TimelineRecorder
+    from src.logic.control.density_bot import DensityBot
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorder = TimelineRecorder(directory)
+
+        # Time record() and finish_game() on the game thread
+        record_seconds = [0.0]
+        finish_seconds = []
+        record, finish_game = recorder.record, recorder.finish_game
+
+        def timed_record(*values):
+            start = time.perf_counter()
+            record(*values)
+            record_seconds[0] += time.perf_counter() - start
+
+        def timed_finish(*values):
+            start = time.perf_counter()
+            finish_game(*values)
+            finish_seconds.append(time.perf_counter() - start)
+
+        recorder.record, recorder.finish_game = timed_record, timed_finish
+
+        game_loop = GameLoop()
+        game_loop.timeline_recorder = recorder
+        game_loop.bot = DensityBot(game_loop.world_width, game_loop.world_height)
+        ticks = 0
+        for seed in range(args.games):
+            game_loop.initialize_game()
+            game_loop.red_dot_spawn.rng.seed(seed)
+            for _ in range(int(args.max_seconds * game_loop.fps)):
+                game_loop.update()
+                ticks += 1
+                if game_loop.game_over:
+                    break
+            recorder.finish_game(game_loop.score_tracker.get_score_breakdown())
+        recorder.close()
+
+        paths = sorted(os.path.join(directory, name) for name in os.listdir(directory))
+        columns, metadata = TimelineRecorder.load(paths[0])
+        frame_ms = 1000 / game_loop.fps
+        record_us = record_seconds[0] / ticks * 1e6
+        result = {
+            'games': args.games,
+            'ticks': ticks,
+            'record_us': round(record_us, 3),
+            'record_frame_share': round(record_us / 1000 / frame_ms, 6),
+            'finish_game_ms_max': round(max(finish_seconds) * 1000, 3),
+            'files': len(paths),
+            'bytes_per_tick': round(sum(os.path.getsize(path) for path in paths) / ticks, 2),
+            'first_file_roundtrip': len(columns['score']) == metadata['ticks'],
+            'totals': recorder.get_totals()
+        }
+    print(json.dumps(result))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
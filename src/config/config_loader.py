@@ -1,10 +1,11 @@
 """Configuration loader for the game."""
+import hashlib
 import json
 import os
 
 
 class Config:
-    """Singleton configuration loader."""
+    """Singleton configuration loader (config.json is read on first access)."""
     
     _instance = None
     _config = None
@@ -13,7 +14,6 @@ class Config:
         """Ensure only one instance of Config exists."""
         if cls._instance is None:
             cls._instance = super(Config, cls).__new__(cls)
-            cls._instance._load_config()
         return cls._instance
     
     def _load_config(self):
@@ -22,6 +22,12 @@ class Config:
         with open(config_path, 'r') as f:
             self._config = json.load(f)
     
+    def _get_config(self) -> dict:
+        """Return the parsed configuration, loading it on first use."""
+        if self._config is None:
+            self._load_config()
+        return self._config
+    
     def get(self, *keys):
         """
         Get a configuration value using a path of keys.
@@ -36,7 +42,7 @@ class Config:
             config.get('screen', 'width')  # Returns 1600
             config.get('media', 'pics', 'red_dot_pic', 'diameter')  # Returns 15
         """
-        value = self._config
+        value = self._get_config()
         for key in keys:
             value = value[key]
         return value
@@ -49,10 +55,28 @@ class Config:
         """Get screen height."""
         return self.get('screen', 'height')
     
+    def get_world_width(self):
+        """Get game world width."""
+        return self.get('world', 'width')
+    
+    def get_world_height(self):
+        """Get game world height."""
+        return self.get('world', 'height')
+    
     def get_fps(self):
         """Get game FPS."""
         return self.get('game', 'fps')
     
+    def get_hash(self) -> str:
+        """
+        Get a short hash identifying the loaded configuration.
+        
+        Returns:
+            Hex digest of the configuration contents
+        """
+        encoded = json.dumps(self._get_config(), sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()[:16]
+    
     def reload(self):
         """Reload configuration from file."""
         self._load_config()
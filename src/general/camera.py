@@ -0,0 +1,75 @@
+"""Camera that maps the game world onto the screen."""
+from src.general.position import Position
+
+
+class Camera:
+    """
+    A screen-sized viewport into a game world that may be larger than the screen.
+
+    The camera centers on a followed position and is clamped so it never
+    shows anything outside the world. When the world is no larger than the
+    screen the offset stays at (0, 0) and world and screen coordinates match.
+    """
+
+    def __init__(self, view_width: float, view_height: float, world_width: float, world_height: float):
+        """
+        Initialize the camera.
+
+        Args:
+            view_width: Width of the viewport (the screen)
+            view_height: Height of the viewport (the screen)
+            world_width: Width of the game world
+            world_height: Height of the game world
+        """
+        self.view_width = view_width
+        self.view_height = view_height
+        self.world_width = world_width
+        self.world_height = world_height
+        self.x = 0.0
+        self.y = 0.0
+
+    def follow(self, position: Position):
+        """
+        Center the viewport on a position, staying inside the world.
+
+        Args:
+            position: The world position to center on
+        """
+        max_x = max(self.world_width - self.view_width, 0)
+        max_y = max(self.world_height - self.view_height, 0)
+        self.x = min(max(position.x - self.view_width / 2, 0), max_x)
+        self.y = min(max(position.y - self.view_height / 2, 0), max_y)
+
+    def get_offset(self) -> tuple[float, float]:
+        """
+        Get the world position of the viewport's top left corner.
+
+        Returns:
+            Tuple of (x, y)
+        """
+        return (self.x, self.y)
+
+    def get_view_rect(self, margin: float = 0) -> tuple[float, float, float, float]:
+        """
+        Get the visible world area.
+
+        Args:
+            margin: Distance to extend the area by on every side
+
+        Returns:
+            Tuple of (left, top, right, bottom) in world coordinates
+        """
+        return (self.x - margin, self.y - margin,
+                self.x + self.view_width + margin, self.y + self.view_height + margin)
+
+    def screen_to_world(self, point: tuple) -> tuple[float, float]:
+        """
+        Convert a screen point (e.g. the mouse position) to world coordinates.
+
+        Args:
+            point: (x, y) on the screen
+
+        Returns:
+            (x, y) in the world
+        """
+        return (point[0] + self.x, point[1] + self.y)
@@ -1,18 +1,39 @@
 """Main game loop with 60 FPS."""
+import time
+import numpy as np
 import pygame
 from src.general.items.background import Background
+from src.general.items.obstacles import Obstacles
 from src.general.items.white_arrow import WhiteArrow
 from src.general.items.red_dot import RedDot
 from src.general.items.green_circle import GreenCircle
+from src.general.items.item_pool import ItemPool
 from src.logic.item_spawn.white_arrow_spawn import WhiteArrowSpawn
 from src.logic.item_spawn.red_dot_spawn import RedDotSpawn
 from src.logic.item_spawn.green_circle_spawn import GreenCircleSpawn
 from src.logic.control.pause import PauseControl
 from src.logic.control.end import EndControl
 from src.logic.control.bomb import BombControl
+from src.logic.control.input_dispatcher import InputDispatcher
 from src.logic.collision.red_dot_collide_white_arrow import RedDotCollideWhiteArrow
 from src.logic.collision.green_circle_collide_red_dot import GreenCircleCollideRedDot
+from src.logic.collision.spatial_grid import SpatialGrid
+from src.logic.movement.target_chase import TargetChase
+from src.logic.pathfinding.obstacle_layer import ObstacleLayer
+from src.logic.pathfinding.flow_field import FlowField
+from src.general.camera import Camera
 from src.general.scoring.score_tracker import ScoreTracker
+from src.media.pics.red_dot_pic import RedDotPic
+from src.media.pics.red_dot_bulk_pic import RedDotBulkPic
+from src.media.pics.particle_bulk_pic import ParticleBulkPic
+from src.media.pics.render_quality import render_quality
+from src.general.quality.quality_governor import QualityGovernor
+from src.general.pacing.frame_pacer import FramePacer
+from src.general.particles.particle_system import ParticleSystem
+from src.general.timing.tick_scheduler import TickScheduler, RateEmitter
+from src.media.pics.white_arrow_pic import WhiteArrowPic
+from src.media.pics.green_circle_pic import GreenCirclePic
+from src.general.snapshot.game_state_snapshot import GameStateSnapshot
 from src.config.config_loader import config
 
 
@@ -34,25 +55,55 @@ class GameLoop:
         
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.world_width = max(config.get_world_width(), screen_width)
+        self.world_height = max(config.get_world_height(), screen_height)
         self.fps = config.get_fps()
         self.clock = pygame.time.Clock()
         
+        # Waits out each frame; optionally busy-waits and runs GC in frame slack time
+        self.frame_pacer = FramePacer(self.clock, self.fps)
+        
+        # Game clock: every update() is one tick; spawns, cooldowns and lifetimes are scheduled on it
+        self.scheduler = TickScheduler()
+        
         # Controls
         self.pause_control = PauseControl()
         self.end_control = EndControl()
-        self.bomb_control = BombControl(fps=self.fps)
+        self.bomb_control = BombControl(fps=self.fps, scheduler=self.scheduler)
         
-        # Spawn logic
-        self.white_arrow_spawn = WhiteArrowSpawn(screen_width, screen_height)
-        self.red_dot_spawn = RedDotSpawn(screen_width, screen_height)
+        # Input: key events are routed only to the control bound to the key
+        self.input_dispatcher = InputDispatcher()
+        self.input_dispatcher.register_control(self.pause_control)
+        self.input_dispatcher.register_control(self.end_control)
+        self.input_dispatcher.register_control(self.bomb_control)
+        
+        # Spawn logic (covers the whole world, not just the screen)
+        self.white_arrow_spawn = WhiteArrowSpawn(self.world_width, self.world_height)
+        self.red_dot_spawn = RedDotSpawn(self.world_width, self.world_height)
         self.green_circle_spawn = GreenCircleSpawn()
         
         # Collision detection
         self.red_dot_white_arrow_collision = RedDotCollideWhiteArrow()
         self.green_circle_red_dot_collision = GreenCircleCollideRedDot()
         
+        # Red dot positions indexed by grid cell for collisions and visibility culling;
+        # rebuilt lazily after the dots move or the list changes
+        self.red_dot_grid = SpatialGrid(self.world_width, self.world_height)
+        self.red_dot_grid_dirty = True
+        
+        # Viewport into the world, following the white arrow
+        self.camera = Camera(screen_width, screen_height, self.world_width, self.world_height)
+        red_dot_cfg = config.get('media', 'pics', 'red_dot_pic')
+        self.red_dot_cull_margin = red_dot_cfg['radius'] + red_dot_cfg['border_width']
+        
+        # Static obstacles from the configured layout; red dots path around them with a flow field
+        self.obstacle_layer = None
+        self.flow_field = None
+        self.obstacles = None
+        self.set_obstacles()
+        
         # Scoring
-        self.score_tracker = ScoreTracker(self.fps)
+        self.score_tracker = ScoreTracker(self.fps, scheduler=self.scheduler)
         
         # Game objects
         self.background = Background()
@@ -60,18 +111,89 @@ class GameLoop:
         self.red_dots = []
         self.green_circles = []
         
-        # Spawn timing (calculated from config)
+        # Destroyed red dots and green circles are recycled instead of reallocated
+        self.red_dot_pool = ItemPool(RedDot)
+        self.green_circle_pool = ItemPool(GreenCircle)
+        
+        # Explosion particles from destroyed red dots, stored in arrays and drawn in bulk
+        self.particle_system = ParticleSystem()
+        self.particle_bulk_pic = ParticleBulkPic()
+        
+        # Spawn timing (from config; fractional frames per spawn are carried forward)
         game_loop_cfg = config.get('general', 'game_loop')
-        # Calculate frames_per_spawn from fps and red_dot_spawn_per_second
-        self.frames_per_spawn = round(self.fps / game_loop_cfg['red_dot_spawn_per_second'])
-        self.frame_counter = 0
+        self.red_dot_emitter = RateEmitter(self.scheduler, game_loop_cfg['red_dot_spawn_per_second'], self.fps,
+                                           self.queue_red_dot)
+        self.red_dots_due = 0
         
         # Game state
         self.game_over = False
         self.last_score = 0
+        
+        # Idle mode (paused or game over): the frozen frame is cached and the
+        # loop blocks on input instead of redrawing 60 times a second
+        self.idle_wait_ms = game_loop_cfg['idle_wait_ms']
+        self.idle_frame = None
+        
+        # Fonts are cached by size instead of being created every frame
+        self.fonts = {}
+        
+        # Mouse position sampled by the caller; None samples it in update, just before movement
+        self.mouse_position = None
+        self.input_sampled_at = None
+        
+        # Optional automated player that steers instead of the mouse (see src.logic.control.density_bot)
+        self.bot = None
+        
+        # Optional simulation worker for pipelined mode (see src.general.pipeline)
+        self.simulation_worker = None
+        self.state_pics = None
+        
+        # Vectorized red dot renderer used above a configurable dot count
+        self.red_dot_bulk_pic = RedDotBulkPic()
+        
+        # Reduced internal render resolution (simulation stays in full-resolution units)
+        render_quality.base_render_scale = min(1.0, config.get('screen', 'render_scale'))
+        render_quality.render_scale = render_quality.base_render_scale
+        self.smooth_scale = config.get('screen', 'smooth_scale')
+        self.render_surface = None
+        
+        # Adaptive quality: steps render quality down when frames run over budget
+        self.quality_governor = None
+        if config.get('general', 'quality', 'quality_governor', 'enabled'):
+            self.quality_governor = QualityGovernor(self.fps)
+        
+        # Rendered HUD text, reused until its text changes
+        self.hud_cache = {}
+        self.hud_frame = 0
+        
+        # Snapshot serializer
+        self.game_state_snapshot = GameStateSnapshot()
+        
+        # Optional frame capture stream (see src.media.capture.frame_capture)
+        self.frame_capture = None
+        
+        # Optional shared-memory state exporter (see src.general.live_state)
+        self.state_exporter = None
+        
+        # Optional network stream for spectators (see src.general.spectator)
+        self.spectator_server = None
+        
+        # Optional per-tick timeline of each game (see src.general.telemetry)
+        self.timeline_recorder = None
+        self.last_frame_seconds = 0.0
+        
+        # Optional allocation profiler marking the phases of serial frames (see src.general.profiling)
+        self.allocation_profiler = None
+        
+        # Optional persistent leaderboard (see src.general.scoring.high_score_store)
+        self.high_score_store = None
+        self.game_start_time = 0.0
     
     def initialize_game(self):
         """Initialize or reset the game state."""
+        # Restart the game clock, dropping timers of the previous game
+        self.scheduler.clear()
+        
         # Reset controls
         self.pause_control.reset()
         self.end_control.reset()
@@ -80,6 +202,18 @@ class GameLoop:
         # Reset spawn logic
         self.white_arrow_spawn.reset()
         
+        # Reset the automated player
+        if self.bot is not None:
+            self.bot.reset()
+        
+        # Start each game at full quality
+        if self.quality_governor is not None:
+            self.quality_governor.reset()
+        
+        # Start a new timeline
+        if self.timeline_recorder is not None:
+            self.timeline_recorder.begin_game()
+        
         # Reset scoring
         self.score_tracker.reset()
         
@@ -87,25 +221,83 @@ class GameLoop:
         arrow_position = self.white_arrow_spawn.spawn()
         self.white_arrow = WhiteArrow(arrow_position)
         
-        # Clear game objects
+        # Clear game objects (returning them to their pools)
+        self.red_dot_pool.release_all(self.red_dots)
+        self.green_circle_pool.release_all(self.green_circles)
         self.red_dots = []
         self.green_circles = []
+        self.particle_system.clear()
+        self.red_dot_grid_dirty = True
+        self.camera.follow(arrow_position)
         
-        # Reset frame counter
-        self.frame_counter = 0
+        # Start spawning red dots
+        self.red_dots_due = 0
+        self.red_dot_emitter.start()
         
         # Reset game state
         self.game_over = False
+        self.game_start_time = time.monotonic()
+        self.idle_frame = None
+    
+    def get_font(self, size: int) -> pygame.font.Font:
+        """
+        Get the default font at the given size, loading it on first use.
+        
+        Args:
+            size: Font size
+            
+        Returns:
+            The cached font
+        """
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
     
-    def handle_events(self):
-        """Handle pygame events."""
-        for event in pygame.event.get():
+    def render_hud_text(self, key: str, font_size: int, text: str, color: tuple) -> pygame.Surface:
+        """
+        Render a HUD line, reusing the previous surface when nothing changed.
+        
+        At reduced quality the previous surface is also reused while the
+        text changes, until the HUD refresh interval has passed.
+        
+        Args:
+            key: Identifies the HUD line
+            font_size: Font size to render with
+            text: The text to show
+            color: Text color
+            
+        Returns:
+            The rendered text surface
+        """
+        cached = self.hud_cache.get(key)
+        if cached is not None:
+            cached_text, cached_color, surface = cached
+            if (cached_text == text and cached_color == color) or \
+                    self.hud_frame % render_quality.hud_refresh_frames:
+                return surface
+        surface = self.get_font(font_size).render(text, True, color)
+        self.hud_cache[key] = (text, color, surface)
+        return surface
+    
+    def handle_events(self, events: list = None):
+        """
+        Handle pygame events.
+        
+        Args:
+            events: Events to handle (default: drain the event queue)
+            
+        Returns:
+            False if the window was closed, True otherwise
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in self.input_dispatcher.coalesce_motion(events):
             if event.type == pygame.QUIT:
                 return False
             
-            self.pause_control.handle_event(event)
-            self.end_control.handle_event(event)
-            self.bomb_control.handle_event(event)
+            self.input_dispatcher.dispatch(event)
         
         return True
     
@@ -115,62 +307,202 @@ class GameLoop:
         if self.pause_control.is_paused() or self.game_over:
             return
         
-        # Update score (time survived)
-        self.score_tracker.update_time()
-        
-        # Update bomb cooldown
-        self.bomb_control.update()
+        # Next tick: advances time survived and the bomb cooldown, fires due spawns and expiries
+        self.scheduler.advance()
         
-        # Update white arrow position
+        # Update white arrow position (the mouse is on the screen, the arrow in the world)
         if self.white_arrow:
-            self.white_arrow.update()
-        
-        # Update red dots (they chase the white arrow)
+            if self.bot is not None:
+                target, use_bomb = self.bot.decide(self.get_red_dot_grid().positions, self.white_arrow.position,
+                                                   self.bomb_control.is_ready(), self.obstacle_layer)
+                if use_bomb:
+                    self.bomb_control.activate()
+            else:
+                mouse_position = self.mouse_position
+                if mouse_position is None:
+                    mouse_position, self.input_sampled_at = self.input_dispatcher.sample_pointer()
+                target = self.camera.screen_to_world(mouse_position)
+            previous_position = self.white_arrow.position
+            self.white_arrow.update(mouse_position=target)
+            if self.obstacles is not None:
+                self.white_arrow.position = self.obstacle_layer.resolve_move(previous_position,
+                                                                             self.white_arrow.position)
+            self.camera.follow(self.white_arrow.position)
+        
+        # Update red dots (they chase the white arrow, around any obstacles)
         if self.white_arrow:
-            for red_dot in self.red_dots:
-                red_dot.update(target_position=self.white_arrow.position)
+            positions = TargetChase.update_all(self.red_dots, self.white_arrow.position, self.flow_field)
+            # The kernel's output is exactly what the grid would gather from the dots
+            self.red_dot_grid.rebuild(positions)
+            self.red_dot_grid_dirty = False
         
-        # Update green circles
-        for green_circle in self.green_circles[:]:
+        # Update green circles (they are removed by their expiry timers)
+        for green_circle in self.green_circles:
             green_circle.update()
-            if green_circle.should_be_destroyed():
-                self.green_circles.remove(green_circle)
+        
+        # Update explosion particles
+        self.particle_system.update()
         
         # Handle bomb activation
+        bomb_fired = False
         if self.bomb_control.should_activate_bomb() and self.white_arrow:
             spawn_position = self.green_circle_spawn.spawn(self.white_arrow.position)
-            self.green_circles.append(GreenCircle(spawn_position))
-        
-        # Spawn red dots (5 per second)
-        self.frame_counter += 1
-        if self.frame_counter >= self.frames_per_spawn:
-            self.frame_counter = 0
-            # Spawn a new red dot
-            if self.white_arrow:
-                spawn_position = self.red_dot_spawn.spawn(self.white_arrow.position)
-                self.red_dots.append(RedDot(spawn_position))
+            self.add_green_circle(self.green_circle_pool.acquire(spawn_position))
+            bomb_fired = True
+        
+        # Spawn red dots (after the dots have moved, so a new dot waits a tick before chasing)
+        if self.red_dots_due:
+            self.spawn_due_red_dots()
         
         # Collision detection
         self.handle_collisions()
+        
+        # Record the tick, then close the timeline if the game just ended
+        if self.timeline_recorder is not None:
+            self.timeline_recorder.record(len(self.red_dots), len(self.green_circles),
+                                          self.score_tracker.get_total_score(), bomb_fired,
+                                          self.last_frame_seconds)
+            if self.game_over:
+                self.timeline_recorder.finish_game(self.score_tracker.get_score_breakdown())
+    
+    def set_obstacles(self, rects: list = None):
+        """
+        Replace the arena's obstacles.
+        
+        Args:
+            rects: (x, y, width, height) obstacle rectangles in world pixels
+                (default: the configured layout); an empty list removes them
+        """
+        self.obstacle_layer = ObstacleLayer(self.world_width, self.world_height, rects)
+        if self.obstacle_layer.has_obstacles():
+            self.flow_field = FlowField(self.obstacle_layer)
+            self.obstacles = Obstacles(self.obstacle_layer.rects)
+            self.red_dot_spawn.obstacle_layer = self.obstacle_layer
+        else:
+            # Without obstacles the dots chase in a straight line, exactly as before
+            self.flow_field = None
+            self.obstacles = None
+            self.red_dot_spawn.obstacle_layer = None
+    
+    def get_red_dot_grid(self) -> SpatialGrid:
+        """
+        Get the spatial index of the red dots, rebuilding it if the dots changed.
+        
+        Returns:
+            The SpatialGrid, whose query results index into self.red_dots
+        """
+        if self.red_dot_grid_dirty or len(self.red_dot_grid) != len(self.red_dots):
+            positions = np.fromiter(
+                (value for red_dot in self.red_dots for value in (red_dot.position.x, red_dot.position.y)),
+                dtype=np.float64, count=len(self.red_dots) * 2
+            ).reshape(-1, 2)
+            self.red_dot_grid.rebuild(positions)
+            self.red_dot_grid_dirty = False
+        return self.red_dot_grid
+    
+    def get_visible_red_dots(self) -> np.ndarray:
+        """
+        Find the red dots that intersect the camera viewport.
+        
+        Returns:
+            Sorted array of indices into self.red_dots
+        """
+        left, top, right, bottom = self.camera.get_view_rect(self.red_dot_cull_margin)
+        return self.get_red_dot_grid().query_rect(left, top, right, bottom)
+    
+    def get_visible_green_circles(self) -> list:
+        """
+        Find the green circles that intersect the camera viewport.
+        
+        Returns:
+            List of visible green circles
+        """
+        left, top, right, bottom = self.camera.get_view_rect()
+        visible = []
+        for green_circle in self.green_circles:
+            radius = green_circle.get_radius()
+            position = green_circle.position
+            if (position.x + radius >= left and position.x - radius < right and
+                    position.y + radius >= top and position.y - radius < bottom):
+                visible.append(green_circle)
+        return visible
+    
+    def get_visible_particles(self) -> tuple:
+        """
+        Find the particles inside the camera viewport.
+        
+        Returns:
+            Tuple of ((n, 2) world positions, (n,) indices into the particle color table)
+        """
+        return self.particle_system.get_visible(*self.camera.get_view_rect(self.particle_bulk_pic.size))
+    
+    def queue_red_dot(self):
+        """Count a red dot as due this tick (called by the red dot emitter at the start of the tick)."""
+        self.red_dots_due += 1
+    
+    def spawn_due_red_dots(self):
+        """Spawn the red dots due this tick near the white arrow."""
+        due, self.red_dots_due = self.red_dots_due, 0
+        if self.white_arrow:
+            for _ in range(due):
+                spawn_position = self.red_dot_spawn.spawn(self.white_arrow.position)
+                self.red_dots.append(self.red_dot_pool.acquire(spawn_position))
+            self.red_dot_grid_dirty = True
+    
+    def add_green_circle(self, green_circle: GreenCircle):
+        """
+        Add a green circle and schedule the end of its lifetime.
+        
+        Args:
+            green_circle: The circle to add
+        """
+        self.green_circles.append(green_circle)
+        remaining = green_circle.lifetime_frames - green_circle.current_frame
+        self.scheduler.schedule(remaining, self.expire_green_circle, green_circle)
+    
+    def expire_green_circle(self, green_circle: GreenCircle):
+        """
+        Remove a green circle whose lifetime is over (called by its expiry timer).
+        
+        Args:
+            green_circle: The circle to remove
+        """
+        green_circle.is_alive = False
+        self.green_circles.remove(green_circle)
+        self.green_circle_pool.release(green_circle)
     
     def handle_collisions(self):
         """Handle all collision detection and responses."""
+        red_dot_grid = self.get_red_dot_grid()
+        
         # Check red dot vs white arrow (game over)
-        if self.red_dot_white_arrow_collision.check_all_collisions(self.red_dots, self.white_arrow):
+        if self.red_dot_white_arrow_collision.check_all_collisions(self.red_dots, self.white_arrow, red_dot_grid):
             self.game_over = True
             self.last_score = self.score_tracker.get_total_score()
+            if self.high_score_store is not None:
+                # Queued for the store's writer thread, so this never stalls the frame
+                self.high_score_store.record(
+                    self.score_tracker.get_score_breakdown(),
+                    time.monotonic() - self.game_start_time
+                )
             return
         
         # Check green circle vs red dots (destroy red dots)
         red_dots_to_destroy = self.green_circle_red_dot_collision.check_all_collisions(
-            self.green_circles, self.red_dots
+            self.green_circles, self.red_dots, red_dot_grid
         )
         
-        # Remove destroyed red dots and update score
-        for red_dot in red_dots_to_destroy:
-            if red_dot in self.red_dots:
-                self.red_dots.remove(red_dot)
+        # Remove destroyed red dots in one pass and update score
+        if red_dots_to_destroy:
+            destroyed = set(map(id, red_dots_to_destroy))
+            self.red_dots[:] = [red_dot for red_dot in self.red_dots if id(red_dot) not in destroyed]
+            self.red_dot_grid_dirty = True
+            self.particle_system.burst(np.array(
+                [(red_dot.position.x, red_dot.position.y) for red_dot in red_dots_to_destroy]
+            ))
+            for red_dot in red_dots_to_destroy:
                 self.score_tracker.add_red_dot_destroyed()
+                self.red_dot_pool.release(red_dot)
     
     def draw(self, screen: pygame.Surface):
         """
@@ -179,19 +511,53 @@ class GameLoop:
         Args:
             screen: The pygame Surface to draw on
         """
+        # Game objects go to the (possibly reduced resolution) render target
+        target = self.get_render_target(screen)
+        offset = self.camera.get_offset()
+        
+        # Only items intersecting the viewport are drawn
+        visible_dots = self.get_visible_red_dots()
+        
+        # At high density the red dots are stamped in one vectorized pass
+        bulk_dots = self.red_dot_bulk_pic.should_use(len(visible_dots))
+        
         # Collect all items and sort by layer
         items = [self.background]
+        if self.obstacles is not None:
+            items.append(self.obstacles)
         if self.white_arrow:
             items.append(self.white_arrow)
-        items.extend(self.red_dots)
-        items.extend(self.green_circles)
+        if not bulk_dots:
+            items.extend(self.red_dots[index] for index in visible_dots.tolist())
+        items.extend(self.get_visible_green_circles())
         
         # Sort by layer (background first, then foreground)
         items.sort(key=lambda item: item.layer)
         
         # Draw all items
-        for item in items:
-            item.draw(screen)
+        if bulk_dots:
+            # Stamp the dots after the rest of their layer, as the per-dot path would
+            dot_layer = self.red_dots[0].layer
+            dot_positions = self.red_dot_grid.positions[visible_dots] - offset
+            dots_drawn = False
+            for item in items:
+                if not dots_drawn and item.layer > dot_layer:
+                    self.red_dot_bulk_pic.draw(target, dot_positions)
+                    dots_drawn = True
+                item.draw(target, offset)
+            if not dots_drawn:
+                self.red_dot_bulk_pic.draw(target, dot_positions)
+        else:
+            for item in items:
+                item.draw(target, offset)
+        
+        # Explosion particles go on top of everything else
+        particle_positions, particle_colors = self.get_visible_particles()
+        self.particle_bulk_pic.draw(target, particle_positions - offset, particle_colors,
+                                    self.particle_system.color_table)
+        
+        # Upscale to the window; the HUD is drawn at full resolution on top
+        self.present_render_target(target, screen)
         
         # Draw real-time score at top left
         self.draw_score(screen)
@@ -199,83 +565,209 @@ class GameLoop:
         # Draw bomb cooldown at bottom left
         self.draw_bomb_cooldown(screen)
         
+        # Draw reduced quality indicator above the bomb cooldown
+        self.draw_quality_level(screen)
+        
+        # Draw pause and game over messages
+        self.draw_overlays(screen, self.pause_control.is_paused(), self.game_over, self.last_score)
+    
+    def get_render_target(self, screen: pygame.Surface) -> pygame.Surface:
+        """
+        Get the surface game objects should be drawn on this frame.
+        
+        At a render scale below 1 this is an offscreen surface of the scaled
+        size (recreated when the scale changes); otherwise it is the screen.
+        
+        Args:
+            screen: The display surface
+            
+        Returns:
+            The surface to draw game objects on
+        """
+        scale = render_quality.render_scale
+        if scale >= 1:
+            return screen
+        
+        width, height = screen.get_size()
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        if self.render_surface is None or self.render_surface.get_size() != size:
+            self.render_surface = pygame.Surface(size, 0, screen)
+        return self.render_surface
+    
+    def present_render_target(self, target: pygame.Surface, screen: pygame.Surface):
+        """
+        Scale a reduced-resolution render target up onto the screen.
+        
+        Args:
+            target: Surface returned by get_render_target
+            screen: The display surface
+        """
+        if target is screen:
+            return
+        if self.smooth_scale and target.get_bitsize() in (24, 32):
+            pygame.transform.smoothscale(target, screen.get_size(), screen)
+        else:
+            pygame.transform.scale(target, screen.get_size(), screen)
+    
+    def draw_state(self, screen: pygame.Surface, state):
+        """
+        Draw a frame from a RenderState instead of the live game objects.
+        
+        Layers are drawn in the same order as draw(): background, white
+        arrow, red dots, green circles, then particles.
+        
+        Args:
+            screen: The pygame Surface to draw on
+            state: The RenderState to draw
+        """
+        if self.state_pics is None:
+            self.state_pics = (RedDotPic(), WhiteArrowPic(), GreenCirclePic())
+        red_dot_pic, white_arrow_pic, green_circle_pic = self.state_pics
+        target = self.get_render_target(screen)
+        offset_x, offset_y = state.camera
+        
+        self.background.draw(target)
+        if self.obstacles is not None:
+            self.obstacles.draw(target, state.camera)
+        
+        if state.arrow is not None:
+            arrow_x, arrow_y, white_arrow_pic.rotation_angle = state.arrow
+            white_arrow_pic.draw(target, arrow_x - offset_x, arrow_y - offset_y)
+        
+        # The state holds only the items that were visible when it was captured
+        dots = state.dots - state.camera
+        if self.red_dot_bulk_pic.should_use(len(dots)):
+            self.red_dot_bulk_pic.draw(target, dots)
+        else:
+            for x, y in dots.tolist():
+                red_dot_pic.draw(target, x, y)
+        
+        for x, y, radius, alpha in state.circles.tolist():
+            green_circle_pic.current_radius = radius
+            green_circle_pic.alpha = int(alpha)
+            green_circle_pic.draw(target, x - offset_x, y - offset_y)
+        
+        self.particle_bulk_pic.draw(target, state.particles - state.camera, state.particle_colors,
+                                    self.particle_system.color_table)
+        
+        self.present_render_target(target, screen)
+        
+        self.draw_score(screen, state.score_breakdown)
+        self.draw_bomb_cooldown(screen, state.bomb_cooldown)
+        self.draw_quality_level(screen)
+        self.draw_overlays(screen, state.paused, state.game_over, state.last_score)
+    
+    def draw_overlays(self, screen: pygame.Surface, paused: bool, game_over: bool, last_score: int):
+        """
+        Draw the pause indicator and game over message.
+        
+        Args:
+            screen: The pygame Surface to draw on
+            paused: Whether the game is paused
+            game_over: Whether the game has ended
+            last_score: The final score shown on the game over message
+        """
         # Draw pause indicator if paused
-        if self.pause_control.is_paused():
+        if paused:
             menu_cfg = config.get('general', 'menu_page', 'menu')
-            font = pygame.font.Font(None, menu_cfg['pause_font_size'])
+            font = self.get_font(menu_cfg['pause_font_size'])
             text = font.render("PAUSED", True, (255, 255, 0))
             text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             screen.blit(text, text_rect)
         
         # Draw game over message
-        if self.game_over:
+        if game_over:
             menu_cfg = config.get('general', 'menu_page', 'menu')
-            font = pygame.font.Font(None, menu_cfg['game_over_font_size'])
+            font = self.get_font(menu_cfg['game_over_font_size'])
             text = font.render("GAME OVER", True, (255, 0, 0))
             text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
             screen.blit(text, text_rect)
             
-            score_font = pygame.font.Font(None, menu_cfg['game_over_score_font_size'])
-            score_text = score_font.render(f"Final Score: {self.last_score}", True, (255, 255, 255))
+            score_font = self.get_font(menu_cfg['game_over_score_font_size'])
+            score_text = score_font.render(f"Final Score: {last_score}", True, (255, 255, 255))
             score_rect = score_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 20))
             screen.blit(score_text, score_rect)
             
-            instruction_font = pygame.font.Font(None, menu_cfg['game_over_instruction_font_size'])
+            instruction_font = self.get_font(menu_cfg['game_over_instruction_font_size'])
             instruction_text = instruction_font.render("Press ESC to return to menu", True, (200, 200, 200))
             instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 80))
             screen.blit(instruction_text, instruction_rect)
     
-    def draw_score(self, screen: pygame.Surface):
+    def draw_score(self, screen: pygame.Surface, score_breakdown: dict = None):
         """
         Draw the real-time score at the top left corner.
         
         Args:
             screen: The pygame Surface to draw on
+            score_breakdown: Score breakdown to show (default: from the score tracker)
         """
-        score_breakdown = self.score_tracker.get_score_breakdown()
+        if score_breakdown is None:
+            score_breakdown = self.score_tracker.get_score_breakdown()
         score_cfg = config.get('general', 'scoring', 'score_tracker')
+        self.hud_frame += 1
         
-        font = pygame.font.Font(None, score_cfg['score_font_size'])
         y_offset = score_cfg['score_position_y']
         
         # Total score
-        total_text = font.render(f"Score: {score_breakdown['total']}", True, tuple(score_cfg['score_color']))
+        total_text = self.render_hud_text('score', score_cfg['score_font_size'],
+                                          f"Score: {score_breakdown['total']}", tuple(score_cfg['score_color']))
         screen.blit(total_text, (score_cfg['score_position_x'], y_offset))
         y_offset += score_cfg['breakdown_line_spacing']
         
         # Breakdown
-        small_font = pygame.font.Font(None, score_cfg['breakdown_font_size'])
-        time_text = small_font.render(f"Time: {score_breakdown['seconds']}s", True, tuple(score_cfg['breakdown_color']))
+        time_text = self.render_hud_text('time', score_cfg['breakdown_font_size'],
+                                         f"Time: {score_breakdown['seconds']}s", tuple(score_cfg['breakdown_color']))
         screen.blit(time_text, (score_cfg['score_position_x'], y_offset))
         y_offset += score_cfg['line_spacing']
         
-        dots_text = small_font.render(f"Dots: {score_breakdown['red_dots']}", True, tuple(score_cfg['breakdown_color']))
+        dots_text = self.render_hud_text('dots', score_cfg['breakdown_font_size'],
+                                         f"Dots: {score_breakdown['red_dots']}", tuple(score_cfg['breakdown_color']))
         screen.blit(dots_text, (score_cfg['score_position_x'], y_offset))
     
-    def draw_bomb_cooldown(self, screen: pygame.Surface):
+    def draw_bomb_cooldown(self, screen: pygame.Surface, cooldown_remaining: float = None):
         """
         Draw the bomb cooldown at the bottom left corner.
         
         Args:
             screen: The pygame Surface to draw on
+            cooldown_remaining: Cooldown seconds to show (default: from the bomb control)
         """
         score_cfg = config.get('general', 'scoring', 'score_tracker')
-        font = pygame.font.Font(None, score_cfg['score_font_size'])
+        font_size = score_cfg['score_font_size']
         
-        cooldown_remaining = self.bomb_control.get_cooldown_seconds_remaining()
+        if cooldown_remaining is None:
+            cooldown_remaining = self.bomb_control.get_cooldown_seconds_remaining()
         
         if cooldown_remaining > 0:
             # Show cooldown time with 2 decimal precision
-            text = font.render(f"Bomb: {cooldown_remaining:.2f}s", True, (255, 100, 100))
+            text = self.render_hud_text('bomb', font_size, f"Bomb: {cooldown_remaining:.2f}s", (255, 100, 100))
         else:
             # Show "READY" when available
-            text = font.render("Bomb: READY", True, (100, 255, 100))
+            text = self.render_hud_text('bomb', font_size, "Bomb: READY", (100, 255, 100))
         
         # Position at bottom left
         x_position = score_cfg['score_position_x']
         y_position = self.screen_height - score_cfg['score_position_y'] - 40
         screen.blit(text, (x_position, y_position))
     
+    def draw_quality_level(self, screen: pygame.Surface):
+        """
+        Draw the current quality level above the bomb cooldown while it is reduced.
+        
+        Args:
+            screen: The pygame Surface to draw on
+        """
+        if self.quality_governor is None or self.quality_governor.get_level() == 0:
+            return
+        
+        score_cfg = config.get('general', 'scoring', 'score_tracker')
+        text = self.render_hud_text('quality', score_cfg['breakdown_font_size'],
+                                    f"Quality: -{self.quality_governor.get_level()}",
+                                    tuple(score_cfg['breakdown_color']))
+        x_position = score_cfg['score_position_x']
+        y_position = self.screen_height - score_cfg['score_position_y'] - 40 - score_cfg['breakdown_line_spacing']
+        screen.blit(text, (x_position, y_position))
+    
     def get_last_score(self) -> int:
         """
         Get the last game score.
@@ -285,10 +777,55 @@ class GameLoop:
         """
         return self.last_score
     
+    def snapshot(self) -> bytes:
+        """
+        Capture the full game state as a compact binary blob.
+        
+        Returns:
+            The snapshot bytes
+        """
+        return self.game_state_snapshot.capture(self)
+    
+    def restore(self, data):
+        """
+        Restore the game state from a snapshot.
+        
+        Args:
+            data: A bytes-like object returned by snapshot()
+        """
+        self.game_state_snapshot.restore(self, data)
+        self.red_dot_grid_dirty = True
+        if self.white_arrow is not None:
+            self.camera.follow(self.white_arrow.position)
+    
     def run(self, screen: pygame.Surface) -> bool:
         """
         Run the game loop.
         
+        Args:
+            screen: The pygame Surface to draw on
+            
+        Returns:
+            True if should continue to next iteration, False if should return to menu
+        """
+        # Only the event types the game handles are queued while it runs
+        self.input_dispatcher.set_filter_enabled(True)
+        
+        keep_running = self.run_frame(screen)
+        
+        if not keep_running:
+            # Back to the menu: restore automatic GC and the full event set
+            self.frame_pacer.end_gameplay()
+            self.input_dispatcher.set_filter_enabled(False)
+            # A game left before it ended still gets its timeline
+            if self.timeline_recorder is not None:
+                self.timeline_recorder.finish_game(self.score_tracker.get_score_breakdown())
+        return keep_running
+    
+    def run_frame(self, screen: pygame.Surface) -> bool:
+        """
+        Run one iteration of the game loop.
+        
         Args:
             screen: The pygame Surface to draw on
             
@@ -299,6 +836,22 @@ class GameLoop:
         if self.white_arrow is None:
             self.initialize_game()
         
+        # Simulation on a worker thread, rendering here
+        if self.simulation_worker is not None:
+            return self.run_pipelined(screen)
+        
+        # Nothing moves while paused or after game over, so wait for input
+        if self.pause_control.is_paused() or self.game_over:
+            self.frame_pacer.end_gameplay()
+            return self.run_idle(screen)
+        self.idle_frame = None
+        self.frame_pacer.begin_gameplay()
+        
+        frame_start = time.perf_counter()
+        profiler = self.allocation_profiler
+        if profiler is not None:
+            profiler.begin_frame()
+        
         # Handle events
         if not self.handle_events():
             return False
@@ -308,15 +861,152 @@ class GameLoop:
             return False
         
         # Update game state
+        if profiler is not None:
+            profiler.switch_phase('update')
         self.update()
         
+        # Publish the new state to external observers
+        if profiler is not None:
+            profiler.switch_phase('publish')
+        if self.state_exporter is not None:
+            self.state_exporter.publish(self)
+        if self.spectator_server is not None:
+            self.spectator_server.publish(self)
+        
         # Draw everything
+        if profiler is not None:
+            profiler.switch_phase('draw')
         self.draw(screen)
         
+        # Hand the rendered frame to the capture stream
+        if profiler is not None:
+            profiler.switch_phase('present')
+        if self.frame_capture is not None:
+            self.frame_capture.capture(screen)
+        
         # Update display
         pygame.display.flip()
+        self.input_dispatcher.record_display(self.input_sampled_at)
+        
+        # Let the quality governor react to the frame's work time
+        self.last_frame_seconds = time.perf_counter() - frame_start
+        if self.quality_governor is not None:
+            self.quality_governor.record_frame(self.last_frame_seconds)
+        
+        # Maintain 60 FPS (collecting garbage in the remaining time if enabled)
+        if profiler is not None:
+            profiler.switch_phase('pace')
+        self.frame_pacer.tick()
+        if profiler is not None:
+            profiler.end_frame()
+        
+        return True
+    
+    def run_pipelined(self, screen: pygame.Surface) -> bool:
+        """
+        Run one rendered frame in pipelined mode.
+        
+        Events stay on the main thread and are forwarded to the simulation
+        worker; the frame is drawn from the worker's latest RenderState.
+        
+        Args:
+            screen: The pygame Surface to draw on
+            
+        Returns:
+            True if should continue to next iteration, False if should return to menu
+        """
+        worker = self.simulation_worker
+        if not worker.is_running():
+            worker.start()
+        
+        state = worker.latest_state
+        idle = state.paused or state.game_over
+        if idle:
+            # Block on input instead of redrawing a frozen frame
+            event = pygame.event.wait(self.idle_wait_ms)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+        else:
+            self.idle_frame = None
+            events = pygame.event.get()
+        
+        if any(event.type == pygame.QUIT for event in events):
+            worker.stop()
+            return False
+        worker.submit_input(events, *self.input_dispatcher.sample_pointer())
+        
+        if state.should_end:
+            worker.stop()
+            return False
+        
+        if idle:
+            self.frame_pacer.end_gameplay()
+            if self.idle_frame is None:
+                self.draw_state(screen, state)
+                self.idle_frame = screen.copy()
+                pygame.display.flip()
+            elif any(event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) for event in events):
+                screen.blit(self.idle_frame, (0, 0))
+                pygame.display.flip()
+            self.clock.tick()
+            return True
+        
+        self.frame_pacer.begin_gameplay()
+        frame_start = time.perf_counter()
+        render_start = time.thread_time()
+        self.draw_state(screen, state)
+        if self.frame_capture is not None:
+            self.frame_capture.capture(screen)
+        pygame.display.flip()
+        self.input_dispatcher.record_display(state.input_sampled_at)
+        worker.record_render(time.thread_time() - render_start)
+        self.last_frame_seconds = time.perf_counter() - frame_start
+        if self.quality_governor is not None:
+            self.quality_governor.record_frame(self.last_frame_seconds)
+        
+        self.frame_pacer.tick()
+        return True
+    
+    def run_idle(self, screen: pygame.Surface) -> bool:
+        """
+        Run one iteration while the game is frozen (paused or game over).
+        
+        The frozen frame is drawn once and cached; afterwards the loop blocks
+        on pygame.event.wait and only re-presents the cached frame when the
+        window needs repainting.
+        
+        Args:
+            screen: The pygame Surface to draw on
+            
+        Returns:
+            True if should continue to next iteration, False if should return to menu
+        """
+        if self.idle_frame is None:
+            self.draw(screen)
+            self.idle_frame = screen.copy()
+            pygame.display.flip()
+        
+        # Block until input arrives (or the timeout passes), then drain the rest
+        event = pygame.event.wait(self.idle_wait_ms)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        
+        if not self.handle_events(events):
+            return False
+        
+        if self.end_control.should_end_game():
+            return False
+        
+        # Keep spectators up to date on the frozen state (and let new ones join)
+        if self.spectator_server is not None:
+            self.spectator_server.publish(self)
+        
+        # Repaint the cached frame if the window was exposed
+        if any(event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED) for event in events):
+            screen.blit(self.idle_frame, (0, 0))
+            pygame.display.flip()
         
-        # Maintain 60 FPS
-        self.clock.tick(self.fps)
+        # Keep the clock from reporting the idle time as one long frame
+        self.clock.tick()
         
         return True
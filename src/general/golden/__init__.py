@@ -0,0 +1 @@
+"""Golden-image checks that renderer changes keep the picture unchanged."""
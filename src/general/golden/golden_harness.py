@@ -0,0 +1,256 @@
+"""Renders golden scenes offscreen and compares them with stored images."""
+import os
+import time
+import numpy as np
+import pygame
+from src.config.config_loader import config
+from src.general.pipeline.render_state import RenderState
+from src.media.pics.render_quality import render_quality
+from .golden_scenes import SCENES, build_scene
+
+# Golden images are stored next to this module
+GOLDEN_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+
+# Rec. 601 luma weights for the perceptual comparison
+LUMA = np.array([0.299, 0.587, 0.114])
+
+
+def draw_live(game_loop) -> callable:
+    """Render path: GameLoop.draw with the configured bulk dot threshold."""
+    return game_loop.draw
+
+
+def draw_per_dot(game_loop) -> callable:
+    """Render path: GameLoop.draw with every red dot drawn by its own RedDotPic."""
+    def draw(surface: pygame.Surface):
+        min_dots, game_loop.red_dot_bulk_pic.min_dots = game_loop.red_dot_bulk_pic.min_dots, float('inf')
+        try:
+            game_loop.draw(surface)
+        finally:
+            game_loop.red_dot_bulk_pic.min_dots = min_dots
+    return draw
+
+
+def draw_bulk(game_loop) -> callable:
+    """Render path: GameLoop.draw with the red dots always stamped by RedDotBulkPic."""
+    def draw(surface: pygame.Surface):
+        min_dots, game_loop.red_dot_bulk_pic.min_dots = game_loop.red_dot_bulk_pic.min_dots, 0
+        try:
+            game_loop.draw(surface)
+        finally:
+            game_loop.red_dot_bulk_pic.min_dots = min_dots
+    return draw
+
+
+def draw_state(game_loop) -> callable:
+    """Render path: GameLoop.draw_state from a captured RenderState, as in pipelined mode."""
+    state = RenderState.capture(game_loop)
+    return lambda surface: game_loop.draw_state(surface, state)
+
+
+# Render paths by name; each takes a game loop in a scene's state and returns a callable that draws it
+RENDER_PATHS = {
+    'draw': draw_live,
+    'draw_per_dot': draw_per_dot,
+    'draw_bulk': draw_bulk,
+    'draw_state': draw_state
+}
+
+
+class GoldenHarness:
+    """
+    Checks render paths against stored golden images and times them.
+
+    Each scene (see golden_scenes) is built from its seed, drawn by every
+    render path to an offscreen surface and compared with the scene's
+    golden image. Two checks must pass: per pixel, at most
+    max_differing_fraction of the pixels may differ by more than
+    pixel_tolerance in any channel; and perceptually, the luminance of the
+    two images, blurred with a [1, 2, 1] kernel blur_passes times, may
+    differ by at most perceptual_tolerance anywhere. The first tolerates
+    off-by-one rounding everywhere and a few stray pixels; the second
+    catches what it lets through: a slight color or brightness shift over
+    a whole area, or a small shape (a dot border, a HUD glyph) that
+    changed but covers too few pixels to count. Every path is also timed
+    on the same scene, so a faster renderer shows its equivalence and its
+    speedup in one run.
+
+    Golden images are made by the reference path, 'draw'. New render paths
+    are added to RENDER_PATHS.
+    """
+
+    def __init__(self, directory: str = None, width: int = None, height: int = None):
+        """
+        Initialize the harness.
+
+        Args:
+            directory: Directory of the golden images (default: the images directory of this package)
+            width: Width of the rendered frames (default: from config)
+            height: Height of the rendered frames (default: from config)
+        """
+        cfg = config.get('general', 'golden', 'golden_harness')
+        self.directory = directory if directory is not None else GOLDEN_DIRECTORY
+        self.size = (width if width is not None else cfg['width'], height if height is not None else cfg['height'])
+        self.seed = cfg['seed']
+        self.pixel_tolerance = cfg['pixel_tolerance']
+        self.max_differing_fraction = cfg['max_differing_fraction']
+        self.perceptual_tolerance = cfg['perceptual_tolerance']
+        self.blur_passes = cfg['blur_passes']
+
+        # Imported here so that loading the harness does not pull in the whole game
+        from src.general.game_loop import GameLoop
+        self.game_loop = GameLoop(*self.size)
+
+    def get_golden_path(self, scene: str) -> str:
+        """
+        Get the file of a scene's golden image.
+
+        Args:
+            scene: Scene name
+
+        Returns:
+            Path of the PNG file
+        """
+        return os.path.join(self.directory, f"{scene}.png")
+
+    def render(self, scene: str, path: str = 'draw') -> pygame.Surface:
+        """
+        Build a scene and draw it with one render path.
+
+        Args:
+            scene: Scene name
+            path: Render path name
+
+        Returns:
+            A new 32-bit surface holding the frame
+        """
+        build_scene(self.game_loop, scene, self.seed)
+        surface = pygame.Surface(self.size, depth=32)
+        RENDER_PATHS[path](self.game_loop)(surface)
+        render_quality.reset()
+        return surface
+
+    def update_goldens(self, scenes: list = None) -> list:
+        """
+        Render scenes with the reference path and store them as the golden images.
+
+        Args:
+            scenes: Scene names (default: all)
+
+        Returns:
+            Paths of the written images
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        written = []
+        for scene in scenes or list(SCENES):
+            golden_path = self.get_golden_path(scene)
+            pygame.image.save(self.render(scene), golden_path)
+            written.append(golden_path)
+        return written
+
+    def _blur(self, image: np.ndarray) -> np.ndarray:
+        """Smooth an image with a separable [1, 2, 1] kernel, repeated blur_passes times."""
+        for _ in range(self.blur_passes):
+            padded = np.pad(image, 1, mode='edge')
+            horizontal = padded[:-2] + 2 * padded[1:-1] + padded[2:]
+            image = (horizontal[:, :-2] + 2 * horizontal[:, 1:-1] + horizontal[:, 2:]) / 16
+        return image
+
+    def compare(self, actual: np.ndarray, expected: np.ndarray) -> dict:
+        """
+        Compare two images.
+
+        Args:
+            actual: (width, height, 3) RGB array of the rendered frame
+            expected: (width, height, 3) RGB array of the golden image
+
+        Returns:
+            Dictionary with the largest channel difference, the fraction of
+            pixels beyond pixel_tolerance, the largest perceptual difference
+            and whether the image passes
+        """
+        if actual.shape != expected.shape:
+            return {'passed': False, 'reason': f"size {actual.shape[:2]} != golden {expected.shape[:2]}"}
+        difference = np.abs(actual.astype(np.int16) - expected.astype(np.int16)).max(axis=2)
+        differing_fraction = np.count_nonzero(difference > self.pixel_tolerance) / difference.size
+        perceptual = np.abs(self._blur(actual @ LUMA) - self._blur(expected @ LUMA)).max()
+        return {
+            'passed': bool(differing_fraction <= self.max_differing_fraction and
+                           perceptual <= self.perceptual_tolerance),
+            'max_channel_diff': int(difference.max()),
+            'differing_fraction': round(float(differing_fraction), 6),
+            'perceptual_diff': round(float(perceptual), 3)
+        }
+
+    def time_path(self, path: str, repeats: int) -> float:
+        """
+        Time a render path on the game loop's current scene.
+
+        Args:
+            path: Render path name
+            repeats: Number of frames to time
+
+        Returns:
+            Milliseconds per frame (the median of the repeats)
+        """
+        surface = pygame.Surface(self.size, depth=32)
+        draw = RENDER_PATHS[path](self.game_loop)
+        draw(surface)
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            draw(surface)
+            times.append(time.perf_counter() - start)
+        return float(np.median(times)) * 1000
+
+    def check(self, scenes: list = None, paths: list = None, repeats: int = 0, diff_directory: str = None) -> dict:
+        """
+        Check render paths against the golden images.
+
+        Args:
+            scenes: Scene names (default: all)
+            paths: Render path names (default: all)
+            repeats: Frames timed per scene and path (0: no timing)
+            diff_directory: Directory to write the frame and an amplified difference image of each failure to
+
+        Returns:
+            Dictionary of results by scene and path; each has the comparison,
+            and with timing also render_ms and the speedup over 'draw'
+        """
+        results = {}
+        for scene in scenes or list(SCENES):
+            golden_path = self.get_golden_path(scene)
+            expected = None
+            if os.path.exists(golden_path):
+                expected = pygame.surfarray.array3d(pygame.image.load(golden_path))
+            scene_results = {}
+            for path in paths or list(RENDER_PATHS):
+                frame = self.render(scene, path)
+                actual = pygame.surfarray.array3d(frame)
+                if expected is None:
+                    result = {'passed': False, 'reason': f"no golden image at {golden_path}"}
+                else:
+                    result = self.compare(actual, expected)
+                if not result['passed'] and diff_directory is not None and expected is not None:
+                    self._write_diff(diff_directory, f"{scene}-{path}", frame, actual, expected)
+                if repeats:
+                    build_scene(self.game_loop, scene, self.seed)
+                    result['render_ms'] = round(self.time_path(path, repeats), 3)
+                    render_quality.reset()
+                scene_results[path] = result
+            if repeats and 'draw' in scene_results:
+                reference_ms = scene_results['draw']['render_ms']
+                for result in scene_results.values():
+                    result['speedup'] = round(reference_ms / max(result['render_ms'], 1e-9), 2)
+            results[scene] = scene_results
+        return results
+
+    def _write_diff(self, directory: str, name: str, frame: pygame.Surface, actual: np.ndarray,
+                    expected: np.ndarray):
+        """Save a failing frame and its difference from the golden image, amplified to be visible."""
+        os.makedirs(directory, exist_ok=True)
+        pygame.image.save(frame, os.path.join(directory, f"{name}-actual.png"))
+        if actual.shape == expected.shape:
+            difference = np.abs(actual.astype(np.int16) - expected.astype(np.int16))
+            amplified = np.minimum(difference * 8, 255).astype(np.uint8)
+            pygame.image.save(pygame.surfarray.make_surface(amplified), os.path.join(directory, f"{name}-diff.png"))
@@ -0,0 +1,126 @@
+"""Seeded, scripted game states for golden-image rendering."""
+import random
+import numpy as np
+from src.general.items.red_dot import RedDot
+from src.general.position import Position
+from src.media.pics.render_quality import render_quality
+from src.config.config_loader import config
+
+
+def _scatter_dots(game_loop, rng: random.Random, count: int, spread: float):
+    """
+    Place red dots around the white arrow (skipping places inside obstacles).
+
+    Args:
+        game_loop: The GameLoop to add the dots to
+        rng: Random generator for the positions
+        count: Number of dots
+        spread: Maximum distance in x and y from the arrow, in pixels
+    """
+    center = game_loop.white_arrow.position
+    for _ in range(count):
+        x = min(max(center.x + rng.uniform(-spread, spread), 0), game_loop.world_width)
+        y = min(max(center.y + rng.uniform(-spread, spread), 0), game_loop.world_height)
+        if not game_loop.obstacle_layer.is_blocked(x, y):
+            game_loop.red_dots.append(RedDot(Position(x, y)))
+    game_loop.red_dot_grid_dirty = True
+
+
+def _play(game_loop, ticks: int, mouse_position: tuple, bomb_at: int = None):
+    """
+    Run scripted ticks with the mouse held at one screen position.
+
+    Args:
+        game_loop: The GameLoop to advance
+        ticks: Number of ticks
+        mouse_position: (x, y) screen position the arrow heads for
+        bomb_at: Tick at which the bomb is fired (None: never)
+    """
+    game_loop.mouse_position = mouse_position
+    for tick in range(ticks):
+        if tick == bomb_at:
+            game_loop.bomb_control.bomb_activated = True
+        game_loop.update()
+
+
+def opening(game_loop, rng: random.Random):
+    """A new game a second in: the arrow turned towards the mouse and a few spawned dots."""
+    game_loop.red_dot_emitter.start()
+    _play(game_loop, game_loop.fps, (game_loop.screen_width * 0.8, game_loop.screen_height * 0.3))
+
+
+def crowd(game_loop, rng: random.Random):
+    """A few hundred dots closing in on the arrow (below the bulk drawing threshold)."""
+    _scatter_dots(game_loop, rng, 300, 400)
+    _play(game_loop, 20, (game_loop.screen_width * 0.2, game_loop.screen_height * 0.7))
+
+
+def swarm(game_loop, rng: random.Random):
+    """Thousands of overlapping dots filling the view."""
+    _scatter_dots(game_loop, rng, 4000, 500)
+    _play(game_loop, 10, (game_loop.screen_width * 0.6, game_loop.screen_height * 0.6))
+
+
+def bomb(game_loop, rng: random.Random):
+    """An expanding, fading green circle with the particles of the dots it destroyed."""
+    _scatter_dots(game_loop, rng, 400, 250)
+    _play(game_loop, 15, (game_loop.screen_width * 0.5, game_loop.screen_height * 0.4), bomb_at=3)
+
+
+def reduced_quality(game_loop, rng: random.Random):
+    """The bomb scene at the quality governor's lowest settings."""
+    bomb(game_loop, rng)
+    render_quality.render_scale = config.get('general', 'quality', 'quality_governor', 'reduced_render_scale')
+    render_quality.circle_border_only = True
+    render_quality.simple_red_dots = True
+
+
+def game_over(game_loop, rng: random.Random):
+    """The frame after a dot reaches the arrow, with the game over message."""
+    _scatter_dots(game_loop, rng, 120, 300)
+    game_loop.red_dot_white_arrow_collision.red_dot_radius = config.get('media', 'pics', 'red_dot_pic', 'radius')
+    game_loop.red_dots.append(RedDot(game_loop.white_arrow.position))
+    _play(game_loop, 1, (game_loop.screen_width / 2, game_loop.screen_height / 2))
+
+
+def obstacles(game_loop, rng: random.Random):
+    """Dots pathing around two walls beside the arrow to reach it."""
+    center = game_loop.white_arrow.position
+    game_loop.set_obstacles([(center.x - 150, center.y - 100, 300, 25), (center.x - 150, center.y + 75, 300, 25)])
+    _scatter_dots(game_loop, rng, 400, 400)
+    _play(game_loop, 40, (game_loop.screen_width / 2, game_loop.screen_height / 2))
+
+
+# Scenes by name, in the order they are checked
+SCENES = {
+    'opening': opening,
+    'crowd': crowd,
+    'swarm': swarm,
+    'bomb': bomb,
+    'reduced_quality': reduced_quality,
+    'game_over': game_over,
+    'obstacles': obstacles
+}
+
+
+def build_scene(game_loop, name: str, seed: int):
+    """
+    Put a game loop into a scene's state.
+
+    The game is restarted with the configured obstacles, every random
+    source seeded, red dot spawning stopped (scenes place their own dots)
+    and arrow collisions off, then the scene's script runs.
+
+    Args:
+        game_loop: The GameLoop to set up
+        name: Scene name (a key of SCENES)
+        seed: Random seed for the scene
+    """
+    render_quality.reset()
+    game_loop.set_obstacles()
+    game_loop.initialize_game()
+    game_loop.red_dot_spawn.rng.seed(seed)
+    game_loop.particle_system.rng = np.random.default_rng(seed)
+    game_loop.red_dot_emitter.stop()
+    game_loop.red_dot_white_arrow_collision.red_dot_radius = -1
+    SCENES[name](game_loop, random.Random(seed))
@@ -24,6 +24,16 @@ class BaseItem(ABC):
         self.movement = movement
         self.layer = layer
     
+    def reset(self, position: Position, **kwargs):
+        """
+        Re-initialize the item in place so it can be reused from an item pool.
+        
+        Args:
+            position: The new position of the item
+            **kwargs: Item-specific parameters, as accepted by __init__
+        """
+        self.position = position
+    
     def update(self, **kwargs):
         """
         Update the item's state.
@@ -34,12 +44,13 @@ class BaseItem(ABC):
         if self.movement:
             self.position = self.movement.update_position(self.position, **kwargs)
     
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, offset: tuple = (0, 0)):
         """
         Draw the item on the given surface.
         
         Args:
             surface: The pygame Surface to draw on
+            offset: World position of the surface's top left corner (the camera offset)
         """
         if self.pic:
-            self.pic.draw(surface, self.position.x, self.position.y)
+            self.pic.draw(surface, self.position.x - offset[0], self.position.y - offset[1])
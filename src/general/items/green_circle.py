@@ -30,6 +30,23 @@ class GreenCircle(BaseItem):
         self.current_frame = 0
         self.is_alive = True
     
+    def reset(self, position: Position, lifetime_frames: int = None):
+        """
+        Re-initialize the green circle in place (see ItemPool).
+        
+        Args:
+            position: The position where the circle spawns
+            lifetime_frames: How many frames the circle lasts (default: calculated from config)
+        """
+        if lifetime_frames is None:
+            lifetime_seconds = config.get('general', 'items', 'green_circle', 'lifetime_seconds')
+            lifetime_frames = round(lifetime_seconds * config.get_fps())
+        self.position = position
+        self.pic.reset()
+        self.lifetime_frames = lifetime_frames
+        self.current_frame = 0
+        self.is_alive = True
+    
     def update(self, **kwargs):
         """Update the green circle's state."""
         self.current_frame += 1
@@ -0,0 +1,93 @@
+"""Object pool for frequently created and destroyed game items."""
+from src.config.config_loader import config
+
+
+class ItemPool:
+    """
+    Recycles game items instead of constructing new ones.
+
+    acquire() hands out a released item re-initialized in place through its
+    reset() method, or constructs a new one when none is free. release()
+    returns an item once the game no longer references it. Up to max_free
+    released items are kept; any beyond that are left to the garbage collector.
+    """
+
+    def __init__(self, item_class: type, max_free: int = None, enabled: bool = None):
+        """
+        Initialize the pool.
+
+        Args:
+            item_class: Item type to pool; must accept the same arguments in __init__ and reset()
+            max_free: Maximum number of released items kept for reuse (default: from config)
+            enabled: Whether items are reused at all (default: from config)
+        """
+        cfg = config.get('general', 'items', 'item_pool')
+        self.item_class = item_class
+        self.max_free = max_free if max_free is not None else cfg['max_free']
+        self.enabled = enabled if enabled is not None else cfg['enabled']
+        self.free = []
+
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    def acquire(self, *args, **kwargs):
+        """
+        Get an item initialized with the given arguments.
+
+        Args:
+            *args: Positional arguments for the item's __init__/reset
+            **kwargs: Keyword arguments for the item's __init__/reset
+
+        Returns:
+            A recycled or newly constructed item
+        """
+        if self.free:
+            item = self.free.pop()
+            item.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            item = self.item_class(*args, **kwargs)
+            self.misses += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return item
+
+    def release(self, item):
+        """
+        Return an item the game no longer references.
+
+        Args:
+            item: An item previously returned by acquire()
+        """
+        self.in_use = max(self.in_use - 1, 0)
+        if self.enabled and len(self.free) < self.max_free:
+            self.free.append(item)
+
+    def release_all(self, items: list):
+        """
+        Return several items at once.
+
+        Args:
+            items: Items previously returned by acquire()
+        """
+        for item in items:
+            self.release(item)
+
+    def get_stats(self) -> dict:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with hits (reused items), misses (constructed items),
+            in_use, high_water (most items in use at once) and free counts
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'in_use': self.in_use,
+            'high_water': self.high_water,
+            'free': len(self.free)
+        }
@@ -0,0 +1,27 @@
+"""Obstacles game item."""
+from src.general.position import Position
+from src.media.pics.obstacle_pic import ObstaclePic
+from src.config.config_loader import config
+from .base_item import BaseItem
+
+
+class Obstacles(BaseItem):
+    """The arena's static obstacles, drawn as one item positioned at the world origin."""
+    
+    def __init__(self, rects: list):
+        """
+        Initialize the obstacles.
+        
+        Args:
+            rects: (x, y, width, height) obstacle rectangles in world pixels
+        """
+        cfg = config.get('general', 'items', 'obstacles')
+        position = Position(0, 0)
+        pic = ObstaclePic(rects)
+        movement = None  # Obstacles don't move
+        layer = cfg['layer']
+        super().__init__(position, pic, movement, layer)
+    
+    def update(self, **kwargs):
+        """Obstacles don't need to update."""
+        pass  # Obstacles are static
@@ -9,6 +9,9 @@ from .base_item import BaseItem
 class RedDot(BaseItem):
     """A red dot that chases the white arrow."""
     
+    # Source of serials; every dot, new or recycled, gets the next one
+    last_serial = 0
+    
     def __init__(self, position: Position, speed: float = None):
         """
         Initialize a red dot.
@@ -24,3 +27,32 @@ class RedDot(BaseItem):
         movement = TargetChase(speed=speed)
         layer = cfg['layer']
         super().__init__(position, pic, movement, layer)
+        self.serial = RedDot.next_serial()
+    
+    def reset(self, position: Position, speed: float = None):
+        """
+        Re-initialize the red dot in place (see ItemPool).
+        
+        Args:
+            position: The new position of the red dot
+            speed: The movement speed (default: from config)
+        """
+        if speed is None:
+            speed = config.get('general', 'items', 'red_dot', 'default_speed')
+        self.position = position
+        self.movement.speed = speed
+        self.serial = RedDot.next_serial()
+    
+    @staticmethod
+    def next_serial() -> int:
+        """
+        Get a serial no red dot has had before.
+        
+        Objects are recycled (see ItemPool), so the serial rather than the
+        object identity tells one spawned dot from another.
+        
+        Returns:
+            The new serial
+        """
+        RedDot.last_serial += 1
+        return RedDot.last_serial
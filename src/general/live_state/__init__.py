@@ -0,0 +1 @@
+"""Shared-memory export of the live game state."""
@@ -0,0 +1,54 @@
+"""Memory layout of the shared live-state segment."""
+import struct
+
+
+class SharedStateLayout:
+    """
+    Describes the shared-memory segment written by SharedStateWriter.
+
+    The segment is guarded by a seqlock: the writer makes the sequence
+    number odd before touching the payload and even again afterwards, so a
+    reader that sees the same even number before and after copying the
+    payload knows its copy is consistent. Readers never block the writer.
+
+    Layout (header and state little-endian; coordinate arrays native-endian,
+    since readers always share the writer's host):
+        header     magic, version, dot capacity, circle capacity, sequence
+        state      tick, dot count, circle count, flags, arrow x, arrow y,
+                   arrow rotation, score, seconds survived, red dots destroyed,
+                   bomb cooldown seconds
+        dots       (x, y) doubles for up to dot capacity red dots
+        circles    (x, y, radius) doubles for up to circle capacity green circles
+    """
+
+    MAGIC = b'DCLS'
+    VERSION = 1
+
+    HEADER = struct.Struct('<4sHxxIIQ')
+    SEQUENCE_OFFSET = 16
+    SEQUENCE = struct.Struct('<Q')
+    STATE = struct.Struct('<QIII3diiid')
+
+    DOT_FIELDS = 2
+    CIRCLE_FIELDS = 3
+
+    # State flag bits
+    FLAG_HAS_ARROW = 1 << 0
+    FLAG_GAME_OVER = 1 << 1
+    FLAG_PAUSED = 1 << 2
+    FLAG_DOTS_TRUNCATED = 1 << 3
+
+    def __init__(self, max_dots: int, max_circles: int):
+        """
+        Initialize the layout.
+
+        Args:
+            max_dots: Number of red dots the segment can hold
+            max_circles: Number of green circles the segment can hold
+        """
+        self.max_dots = max_dots
+        self.max_circles = max_circles
+        self.state_offset = self.HEADER.size
+        self.dots_offset = self.state_offset + self.STATE.size
+        self.circles_offset = self.dots_offset + max_dots * self.DOT_FIELDS * 8
+        self.size = self.circles_offset + max_circles * self.CIRCLE_FIELDS * 8
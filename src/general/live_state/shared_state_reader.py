@@ -0,0 +1,111 @@
+"""Reads the live game state published by SharedStateWriter."""
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from src.config.config_loader import config
+from .shared_state_layout import SharedStateLayout
+
+
+class SharedStateReader:
+    """Attaches to a live-state segment from another process and reads consistent frames."""
+
+    def __init__(self, name: str = None, max_retries: int = 100):
+        """
+        Attach to an existing segment.
+
+        Args:
+            name: Name of the shared-memory segment (default: from config)
+            max_retries: How many times read() retries a torn frame before giving up
+
+        Raises:
+            FileNotFoundError: If no game is publishing under that name
+            ValueError: If the segment is not a live-state segment of a supported version
+        """
+        if name is None:
+            name = config.get('general', 'live_state', 'shared_state_writer', 'segment_name')
+        self.name = name
+        self.max_retries = max_retries
+
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 always tracks, which would unlink the writer's segment on exit
+            self.shm = shared_memory.SharedMemory(name=name)
+            resource_tracker.unregister(self.shm._name, 'shared_memory')
+
+        magic, version, max_dots, max_circles, _ = SharedStateLayout.HEADER.unpack_from(self.shm.buf, 0)
+        if magic != SharedStateLayout.MAGIC:
+            raise ValueError(f"Segment {name!r} is not a live game state")
+        if version != SharedStateLayout.VERSION:
+            raise ValueError(f"Unsupported live state version {version}")
+        self.layout = SharedStateLayout(max_dots, max_circles)
+
+    def get_sequence(self) -> int:
+        """
+        Get the current sequence number without reading the payload.
+
+        Returns:
+            The sequence number (odd while the writer is publishing)
+        """
+        return SharedStateLayout.SEQUENCE.unpack_from(self.shm.buf, SharedStateLayout.SEQUENCE_OFFSET)[0]
+
+    def read(self) -> dict:
+        """
+        Read one consistent frame of state.
+
+        Returns:
+            Dictionary with tick, arrow, dots, circles and score fields, or
+            None if no consistent frame could be read within max_retries
+        """
+        layout = self.layout
+        buf = self.shm.buf
+
+        for _ in range(self.max_retries):
+            sequence = self.get_sequence()
+            if sequence & 1:
+                continue
+
+            state = SharedStateLayout.STATE.unpack_from(buf, layout.state_offset)
+            dot_count = min(state[1], layout.max_dots)
+            circle_count = min(state[2], layout.max_circles)
+            dots = array('d')
+            dots.frombytes(buf[layout.dots_offset:
+                               layout.dots_offset + dot_count * SharedStateLayout.DOT_FIELDS * 8])
+            circles = array('d')
+            circles.frombytes(buf[layout.circles_offset:
+                                  layout.circles_offset + circle_count * SharedStateLayout.CIRCLE_FIELDS * 8])
+
+            if self.get_sequence() == sequence:
+                return self._to_dict(state, dots, circles)
+        return None
+
+    def _to_dict(self, state: tuple, dots: array, circles: array) -> dict:
+        """
+        Convert a raw frame into a dictionary.
+
+        Args:
+            state: Unpacked STATE fields
+            dots: Flat (x, y) coordinates of the red dots
+            circles: Flat (x, y, radius) values of the green circles
+
+        Returns:
+            Dictionary describing the frame
+        """
+        (tick, _, _, flags, arrow_x, arrow_y, arrow_rotation,
+         score, seconds, red_dots_destroyed, bomb_cooldown) = state
+        return {
+            'tick': tick,
+            'arrow': (arrow_x, arrow_y, arrow_rotation) if flags & SharedStateLayout.FLAG_HAS_ARROW else None,
+            'dots': dots,
+            'circles': circles,
+            'score': {'seconds': seconds, 'red_dots': red_dots_destroyed, 'total': score},
+            'bomb_cooldown': bomb_cooldown,
+            'game_over': bool(flags & SharedStateLayout.FLAG_GAME_OVER),
+            'paused': bool(flags & SharedStateLayout.FLAG_PAUSED),
+            'dots_truncated': bool(flags & SharedStateLayout.FLAG_DOTS_TRUNCATED)
+        }
+
+    def close(self):
+        """Detach from the segment (the writer owns and removes it)."""
+        if self.shm is not None:
+            self.shm.close()
+            self.shm = None
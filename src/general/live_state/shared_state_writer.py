@@ -0,0 +1,113 @@
+"""Publishes the live game state into a shared-memory segment."""
+from array import array
+from multiprocessing import shared_memory
+import numpy as np
+from src.config.config_loader import config
+from .shared_state_layout import SharedStateLayout
+
+
+class SharedStateWriter:
+    """Writes arrow, dot, circle and score state to shared memory every tick."""
+
+    def __init__(self, name: str = None, max_dots: int = None, max_circles: int = None):
+        """
+        Initialize the writer and create the segment.
+
+        Args:
+            name: Name of the shared-memory segment (default: from config)
+            max_dots: Number of red dots the segment can hold (default: from config)
+            max_circles: Number of green circles the segment can hold (default: from config)
+        """
+        cfg = config.get('general', 'live_state', 'shared_state_writer')
+        self.name = name if name is not None else cfg['segment_name']
+        self.layout = SharedStateLayout(
+            max_dots if max_dots is not None else cfg['max_dots'],
+            max_circles if max_circles is not None else cfg['max_circles']
+        )
+
+        self.shm = shared_memory.SharedMemory(name=self.name, create=True, size=self.layout.size)
+        self.sequence = 0
+        self.tick = 0
+        SharedStateLayout.HEADER.pack_into(
+            self.shm.buf, 0, SharedStateLayout.MAGIC, SharedStateLayout.VERSION,
+            self.layout.max_dots, self.layout.max_circles, self.sequence
+        )
+
+        # The segment's dot array, written in one slice assignment per tick
+        self.dots = np.ndarray((self.layout.max_dots, SharedStateLayout.DOT_FIELDS), dtype=np.float64,
+                               buffer=self.shm.buf, offset=self.layout.dots_offset)
+        # Reused scratch buffer so publishing does not allocate per tick
+        self.circles = array('d', bytes(self.layout.max_circles * SharedStateLayout.CIRCLE_FIELDS * 8))
+
+    def publish(self, game_loop):
+        """
+        Publish the current state of a game loop (call once per tick).
+
+        Args:
+            game_loop: The GameLoop to publish
+        """
+        layout = self.layout
+        white_arrow = game_loop.white_arrow
+        score_tracker = game_loop.score_tracker
+
+        # The grid already holds every dot center in red_dots order
+        dot_positions = game_loop.get_red_dot_grid().positions[:layout.max_dots]
+
+        # Gather circles into the scratch buffer outside the critical section
+        green_circles = game_loop.green_circles[:layout.max_circles]
+        circles = self.circles
+        i = 0
+        for green_circle in green_circles:
+            position = green_circle.position
+            circles[i] = position.x
+            circles[i + 1] = position.y
+            circles[i + 2] = green_circle.get_radius()
+            i += 3
+        circles_size = i * 8
+
+        flags = 0
+        if white_arrow is not None:
+            flags |= SharedStateLayout.FLAG_HAS_ARROW
+            arrow_x = white_arrow.position.x
+            arrow_y = white_arrow.position.y
+            arrow_rotation = white_arrow.pic.rotation_angle
+        else:
+            arrow_x = arrow_y = arrow_rotation = 0.0
+        if game_loop.game_over:
+            flags |= SharedStateLayout.FLAG_GAME_OVER
+        if game_loop.pause_control.is_paused():
+            flags |= SharedStateLayout.FLAG_PAUSED
+        if len(game_loop.red_dots) > layout.max_dots:
+            flags |= SharedStateLayout.FLAG_DOTS_TRUNCATED
+
+        self.tick += 1
+        buf = self.shm.buf
+
+        # Odd sequence: write in progress
+        self.sequence += 1
+        SharedStateLayout.SEQUENCE.pack_into(buf, SharedStateLayout.SEQUENCE_OFFSET, self.sequence)
+
+        SharedStateLayout.STATE.pack_into(
+            buf, layout.state_offset,
+            self.tick, len(dot_positions), len(green_circles), flags,
+            arrow_x, arrow_y, arrow_rotation,
+            score_tracker.get_total_score(), score_tracker.frames_survived // score_tracker.fps,
+            score_tracker.red_dots_destroyed,
+            game_loop.bomb_control.get_cooldown_seconds_remaining()
+        )
+        self.dots[:len(dot_positions)] = dot_positions
+        buf[layout.circles_offset:layout.circles_offset + circles_size] = \
+            memoryview(circles).cast('B')[:circles_size]
+
+        # Even sequence: payload consistent
+        self.sequence += 1
+        SharedStateLayout.SEQUENCE.pack_into(buf, SharedStateLayout.SEQUENCE_OFFSET, self.sequence)
+
+    def close(self):
+        """Close and remove the shared-memory segment."""
+        if self.shm is not None:
+            # The dot array exports the segment's buffer, which would block closing it
+            self.dots = None
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
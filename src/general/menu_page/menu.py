@@ -1,18 +1,20 @@
 """Main menu page with START_GAME button."""
 import pygame
+from src.logic.control.input_dispatcher import InputDispatcher
 from src.config.config_loader import config
 
 
 class MenuPage:
     """Main menu page for the game."""
     
-    def __init__(self, screen_width: int = None, screen_height: int = None):
+    def __init__(self, screen_width: int = None, screen_height: int = None, high_score_store=None):
         """
         Initialize the menu page.
         
         Args:
             screen_width: Width of the screen (default: from config)
             screen_height: Height of the screen (default: from config)
+            high_score_store: Optional HighScoreStore to show the leaderboard from
         """
         if screen_width is None:
             screen_width = config.get_screen_width()
@@ -48,17 +50,50 @@ class MenuPage:
         self.button_font = pygame.font.Font(None, cfg['button_font_size'])
         self.score_font = pygame.font.Font(None, cfg['score_font_size'])
         self.instruction_font = pygame.font.Font(None, cfg['instruction_font_size'])
+        self.leaderboard_font = pygame.font.Font(None, cfg['leaderboard_font_size'])
+        self.leaderboard_line_spacing = cfg['leaderboard_line_spacing']
         
         # State
         self.start_game = False
         self.previous_score = None
+        
+        # Leaderboard (queried once per menu visit, not per frame)
+        self.high_score_store = high_score_store
+        self.top_scores = []
+        self.personal_best = None
+        
+        # Idle rendering: static content is cached and only redrawn when it changes
+        self.idle_wait_ms = cfg['idle_wait_ms']
+        self.static_surface = None
+        self.is_hovering = False
+        self.needs_redraw = True
     
-    def handle_events(self):
-        """Handle menu events."""
-        for event in pygame.event.get():
+    def handle_events(self, events: list = None):
+        """
+        Handle menu events.
+        
+        Args:
+            events: Events to handle (default: drain the event queue)
+            
+        Returns:
+            False if the window was closed, True otherwise
+        """
+        if events is None:
+            events = pygame.event.get()
+        # Hover only depends on the latest pointer position
+        for event in InputDispatcher.coalesce_motion(events):
             if event.type == pygame.QUIT:
                 return False
             
+            if event.type == pygame.MOUSEMOTION:
+                # Only a change of hover state needs a redraw
+                is_hovering = self.button_rect.collidepoint(event.pos)
+                if is_hovering != self.is_hovering:
+                    self.is_hovering = is_hovering
+                    self.needs_redraw = True
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.needs_redraw = True
+            
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     if self.button_rect.collidepoint(event.pos):
@@ -75,41 +110,62 @@ class MenuPage:
         """
         if score > 0:
             self.previous_score = score
+            self.static_surface = None
     
-    def draw(self, screen: pygame.Surface):
+    def refresh_leaderboard(self):
+        """Reload the top scores and personal best from the high score store."""
+        if self.high_score_store is None:
+            return
+        self.top_scores = self.high_score_store.get_top_scores()
+        self.personal_best = self.high_score_store.get_personal_best()
+        self.static_surface = None
+    
+    def draw_leaderboard(self, screen: pygame.Surface):
         """
-        Draw the menu page.
+        Draw the leaderboard on the right side of the menu.
         
         Args:
             screen: The pygame Surface to draw on
         """
+        if self.high_score_store is None:
+            return
+        
+        x_center = self.screen_width * 5 // 6
+        y_offset = self.screen_height // 4
+        
+        lines = [("HIGH SCORES", self.text_color)]
+        for rank, game in enumerate(self.top_scores, start=1):
+            lines.append((f"{rank}. {game['player']}  {game['total']}", self.instruction_color))
+        if self.personal_best is not None:
+            lines.append(("", self.instruction_color))
+            lines.append((f"Your best: {self.personal_best['total']}", self.score_color))
+        
+        for line, color in lines:
+            text = self.leaderboard_font.render(line, True, color)
+            text_rect = text.get_rect(center=(x_center, y_offset))
+            screen.blit(text, text_rect)
+            y_offset += self.leaderboard_line_spacing
+    
+    def draw_static(self, surface: pygame.Surface):
+        """
+        Draw everything on the menu that doesn't react to the mouse.
+        
+        Args:
+            surface: The pygame Surface to draw on
+        """
         # Draw background
-        screen.fill(self.bg_color)
+        surface.fill(self.bg_color)
         
         # Draw title
         title_text = self.title_font.render("Dot Chasing Game", True, self.text_color)
         title_rect = title_text.get_rect(center=(self.screen_width // 2, self.screen_height // 4))
-        screen.blit(title_text, title_rect)
+        surface.blit(title_text, title_rect)
         
         # Draw previous score if available
         if self.previous_score is not None:
             score_text = self.score_font.render(f"Your previous game score is {self.previous_score}", True, self.score_color)
             score_rect = score_text.get_rect(center=(self.screen_width // 2, self.screen_height // 3 + 20))
-            screen.blit(score_text, score_rect)
-        
-        # Check if mouse is hovering over button
-        mouse_pos = pygame.mouse.get_pos()
-        is_hovering = self.button_rect.collidepoint(mouse_pos)
-        
-        # Draw button
-        button_color = self.button_hover_color if is_hovering else self.button_color
-        pygame.draw.rect(screen, button_color, self.button_rect, border_radius=10)
-        pygame.draw.rect(screen, self.text_color, self.button_rect, width=3, border_radius=10)
-        
-        # Draw button text
-        button_text = self.button_font.render("START GAME", True, self.text_color)
-        button_text_rect = button_text.get_rect(center=self.button_rect.center)
-        screen.blit(button_text, button_text_rect)
+            surface.blit(score_text, score_rect)
         
         # Draw instructions
         instructions = [
@@ -125,10 +181,48 @@ class MenuPage:
         for instruction in instructions:
             text = self.instruction_font.render(instruction, True, self.instruction_color)
             text_rect = text.get_rect(center=(self.screen_width // 2, y_offset))
-            screen.blit(text, text_rect)
+            surface.blit(text, text_rect)
             y_offset += 40
         
+        # Draw leaderboard
+        self.draw_leaderboard(surface)
+    
+    def draw_button(self, surface: pygame.Surface, is_hovering: bool):
+        """
+        Draw the START GAME button.
+        
+        Args:
+            surface: The pygame Surface to draw on
+            is_hovering: Whether the mouse is over the button
+        """
+        button_color = self.button_hover_color if is_hovering else self.button_color
+        pygame.draw.rect(surface, button_color, self.button_rect, border_radius=10)
+        pygame.draw.rect(surface, self.text_color, self.button_rect, width=3, border_radius=10)
+        
+        # Draw button text
+        button_text = self.button_font.render("START GAME", True, self.text_color)
+        button_text_rect = button_text.get_rect(center=self.button_rect.center)
+        surface.blit(button_text, button_text_rect)
+    
+    def draw(self, screen: pygame.Surface):
+        """
+        Draw the menu page.
+        
+        The static part is rendered once into a cached surface; each redraw
+        only blits it and paints the button in its current hover state.
+        
+        Args:
+            screen: The pygame Surface to draw on
+        """
+        if self.static_surface is None:
+            self.static_surface = pygame.Surface(screen.get_size())
+            self.draw_static(self.static_surface)
+        
+        screen.blit(self.static_surface, (0, 0))
+        self.draw_button(screen, self.is_hovering)
+        
         pygame.display.flip()
+        self.needs_redraw = False
     
     def should_start_game(self) -> bool:
         """
@@ -144,25 +238,36 @@ class MenuPage:
         self.start_game = False
         # Don't reset previous_score - it persists across menu views
     
-    def run(self, screen: pygame.Surface) -> bool:
+    def run(self, screen: pygame.Surface, on_first_frame=None) -> bool:
         """
         Run the menu page.
         
         Args:
             screen: The pygame Surface to draw on
+            on_first_frame: Optional callable invoked once the first menu frame is shown
             
         Returns:
             True if should start game, False if should quit
         """
         self.reset()
-        clock = pygame.time.Clock()
+        self.refresh_leaderboard()
+        self.is_hovering = self.button_rect.collidepoint(pygame.mouse.get_pos())
+        self.needs_redraw = True
         
         while True:
-            if not self.handle_events():
+            if self.needs_redraw:
+                self.draw(screen)
+                if on_first_frame is not None:
+                    on_first_frame()
+                    on_first_frame = None
+            
+            # Block until input arrives (or the timeout passes), then drain the rest
+            event = pygame.event.wait(self.idle_wait_ms)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+            
+            if not self.handle_events(events):
                 return False
             
             if self.should_start_game():
                 return True
-            
-            self.draw(screen)
-            clock.tick(60)
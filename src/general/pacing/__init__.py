@@ -0,0 +1 @@
+"""Frame pacing and garbage collection scheduling."""
@@ -0,0 +1,174 @@
+"""Frame pacing with garbage collection moved into frame slack time."""
+import gc
+import math
+import statistics
+import time
+from collections import deque
+import pygame
+from src.config.config_loader import config
+
+
+class FramePacer:
+    """
+    Waits out the rest of each frame and keeps GC pauses out of gameplay frames.
+
+    By default this is a thin wrapper around clock.tick(). In low-jitter
+    mode it can wait with tick_busy_loop() instead, which spins rather than
+    trusting the OS sleep granularity, and it can take over garbage
+    collection: while a game is running the automatic collector is
+    disabled, objects alive at game start are moved out of its reach with
+    gc.freeze(), and each frame collects the generation the automatic
+    collector would have picked, but only once the frame's work is done and
+    enough of the frame budget is left. A hard limit on pending gen-0
+    allocations still forces a collection when frames never have slack.
+
+    Every collection during gameplay (managed or automatic) is timed
+    through gc.callbacks, so the pause histogram compares both modes. The
+    callback is only installed between begin_gameplay() and end_gameplay(),
+    so a pacer never outlives its game in gc.callbacks.
+    """
+
+    # Upper bounds (ms) of the GC pause histogram buckets
+    PAUSE_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, math.inf)
+
+    def __init__(self, clock: pygame.time.Clock, fps: int, busy_loop: bool = None, manage_gc: bool = None):
+        """
+        Initialize the pacer.
+
+        Args:
+            clock: The clock frames are paced with
+            fps: Target frame rate
+            busy_loop: Wait with tick_busy_loop instead of tick (default: from config)
+            manage_gc: Run garbage collection in frame slack time (default: from config)
+        """
+        cfg = config.get('general', 'pacing', 'frame_pacer')
+        self.clock = clock
+        self.fps = fps
+        self.busy_loop = busy_loop if busy_loop is not None else cfg['busy_loop']
+        self.manage_gc = manage_gc if manage_gc is not None else cfg['manage_gc']
+        self.slack_collect_min = cfg['slack_collect_min_ms'] / 1000
+        self.gen0_limit = cfg['gen0_limit']
+
+        self.frame_times = deque(maxlen=cfg['stats_window_frames'])
+        self.last_tick = None
+        self.in_gameplay = False
+
+        self.pause_counts = [0] * len(self.PAUSE_BUCKETS_MS)
+        self.pause_total = 0.0
+        self.pause_max = 0.0
+        self.forced_collections = 0
+        self.gc_started_at = None
+
+    def _on_gc(self, phase: str, info: dict):
+        """gc.callbacks hook timing every collection."""
+        if phase == 'start':
+            self.gc_started_at = time.perf_counter()
+        elif self.gc_started_at is not None:
+            pause = time.perf_counter() - self.gc_started_at
+            self.gc_started_at = None
+            self.pause_total += pause
+            self.pause_max = max(self.pause_max, pause)
+            pause_ms = pause * 1000
+            for index, bound in enumerate(self.PAUSE_BUCKETS_MS):
+                if pause_ms < bound:
+                    self.pause_counts[index] += 1
+                    break
+
+    def begin_gameplay(self):
+        """Switch to managed collection for gameplay frames (no-op unless manage_gc)."""
+        if self.in_gameplay:
+            return
+        self.in_gameplay = True
+        self.last_tick = None
+        gc.callbacks.append(self._on_gc)
+        if self.manage_gc:
+            # Start clean, then keep everything alive so far out of later collections
+            gc.collect()
+            gc.freeze()
+            gc.disable()
+
+    def end_gameplay(self):
+        """Give collection back to the automatic collector (paused, game over, menu)."""
+        if not self.in_gameplay:
+            return
+        self.in_gameplay = False
+        self.last_tick = None
+        gc.callbacks.remove(self._on_gc)
+        self.gc_started_at = None
+        if self.manage_gc:
+            gc.unfreeze()
+            gc.enable()
+
+    def _collect_in_slack(self):
+        """Collect the generation that is due if enough of the frame budget remains."""
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        generation = -1
+        for candidate in range(len(counts) - 1, -1, -1):
+            if counts[candidate] > thresholds[candidate]:
+                generation = candidate
+                break
+
+        if generation < 0:
+            return
+        if self.last_tick is not None and self.fps > 0:
+            remaining = 1.0 / self.fps - (time.perf_counter() - self.last_tick)
+            if remaining < self.slack_collect_min:
+                if counts[0] < self.gen0_limit:
+                    return
+                self.forced_collections += 1
+        gc.collect(generation)
+
+    def tick(self):
+        """End a gameplay frame: collect garbage if due, then wait for the next frame."""
+        if self.manage_gc and self.in_gameplay:
+            self._collect_in_slack()
+
+        if self.busy_loop:
+            self.clock.tick_busy_loop(self.fps)
+        else:
+            self.clock.tick(self.fps)
+
+        now = time.perf_counter()
+        if self.last_tick is not None:
+            self.frame_times.append(now - self.last_tick)
+        self.last_tick = now
+
+    def get_stats(self) -> dict:
+        """
+        Get frame time and GC pause statistics.
+
+        Returns:
+            Dictionary with frame time mean, standard deviation, variance,
+            99th percentile and maximum (ms) over the recent window, and the
+            GC pause histogram keyed by bucket upper bound (ms)
+        """
+        frame_ms = [seconds * 1000 for seconds in self.frame_times]
+        stats = {
+            'frames': len(frame_ms),
+            'frame_mean_ms': 0.0,
+            'frame_stdev_ms': 0.0,
+            'frame_variance_ms2': 0.0,
+            'frame_p99_ms': 0.0,
+            'frame_max_ms': 0.0,
+            'gc_collections': sum(self.pause_counts),
+            'gc_forced_collections': self.forced_collections,
+            'gc_pause_total_ms': self.pause_total * 1000,
+            'gc_pause_max_ms': self.pause_max * 1000,
+            'gc_pause_histogram': {
+                f"<{bound:g}ms" if bound != math.inf else f">={self.PAUSE_BUCKETS_MS[-2]:g}ms": count
+                for bound, count in zip(self.PAUSE_BUCKETS_MS, self.pause_counts)
+            }
+        }
+        if frame_ms:
+            ordered = sorted(frame_ms)
+            stats['frame_mean_ms'] = statistics.fmean(frame_ms)
+            stats['frame_variance_ms2'] = statistics.pvariance(frame_ms)
+            stats['frame_stdev_ms'] = math.sqrt(stats['frame_variance_ms2'])
+            stats['frame_p99_ms'] = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+            stats['frame_max_ms'] = ordered[-1]
+        return stats
+
+    def close(self):
+        """Stop timing collections and restore the automatic collector."""
+        self.end_gameplay()
@@ -0,0 +1 @@
+"""Array-backed particle effects."""
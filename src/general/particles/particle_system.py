@@ -0,0 +1,163 @@
+"""Fixed-capacity particle system stored in NumPy arrays."""
+import numpy as np
+from src.config.config_loader import config
+
+
+class ParticleSystem:
+    """
+    Explosion particles without a Python object per particle.
+
+    Particle state lives in one preallocated float32 array with a row per
+    field (x, y, velocity x, velocity y, age, lifetime) and a column per
+    particle, plus a uint8 palette index per particle; the first `count`
+    columns are the live particles, and every field is contiguous.
+    update() advances all of them with one vectorized step and retires
+    expired particles by compacting the survivors to the front, so the
+    cost per frame is a handful of array operations regardless of how many
+    particles are alive. Bursts that would exceed the capacity are
+    truncated and counted as dropped.
+
+    Particles fade out with age in fade_levels steps: color_table holds
+    every palette color at every fade level, and get_visible() returns
+    indices into it, so the renderer only maps a few colors per frame.
+    """
+
+    # Rows of the state array
+    X, Y, VELOCITY_X, VELOCITY_Y, AGE, LIFETIME = range(6)
+
+    def __init__(self, capacity: int = None, seed: int = None):
+        """
+        Initialize the particle system.
+
+        Args:
+            capacity: Maximum number of live particles (default: from config)
+            seed: Seed for the particle random generator (default: system entropy)
+        """
+        cfg = config.get('general', 'particles', 'particle_system')
+        if capacity is None:
+            capacity = cfg['capacity']
+        self.capacity = capacity
+        self.enabled = cfg['enabled']
+        self.particles_per_burst = cfg['particles_per_burst']
+        self.speed_min = cfg['speed_min']
+        self.speed_max = cfg['speed_max']
+        self.drag = cfg['drag']
+        self.lifetime_frames_min = cfg['lifetime_frames_min']
+        self.lifetime_frames_max = cfg['lifetime_frames_max']
+        self.fade_levels = cfg['fade_levels']
+        self.rng = np.random.default_rng(seed)
+
+        # Palette color p at fade level l is row p * fade_levels + l
+        palette = np.array(cfg['colors'], dtype=np.float64)
+        brightness = 1 - np.arange(self.fade_levels) / self.fade_levels
+        self.palette_size = len(palette)
+        self.color_table = (palette[:, np.newaxis, :] * brightness[:, np.newaxis]).astype(np.uint8).reshape(-1, 3)
+
+        self.state = np.zeros((6, capacity), dtype=np.float32)
+        self.palette_indices = np.zeros(capacity, dtype=np.uint8)
+        self.count = 0
+
+        self.emitted = 0
+        self.dropped = 0
+        self.high_water = 0
+
+    def __len__(self) -> int:
+        """Number of live particles."""
+        return self.count
+
+    def burst(self, centers: np.ndarray, particles_per_burst: int = None):
+        """
+        Emit a burst of particles flying outwards from each center.
+
+        Args:
+            centers: (k, 2) array of burst centers in world coordinates
+            particles_per_burst: Particles per center (default: from config)
+        """
+        if not self.enabled or len(centers) == 0:
+            return
+        if particles_per_burst is None:
+            particles_per_burst = self.particles_per_burst
+        requested = len(centers) * particles_per_burst
+        emitted = min(requested, self.capacity - self.count)
+        self.dropped += requested - emitted
+        if emitted <= 0:
+            return
+
+        rng = self.rng
+        state = self.state[:, self.count:self.count + emitted]
+        origins = np.repeat(np.asarray(centers, dtype=np.float32), particles_per_burst, axis=0)[:emitted]
+        angles = rng.uniform(0, 2 * np.pi, emitted)
+        speeds = rng.uniform(self.speed_min, self.speed_max, emitted)
+        state[self.X] = origins[:, 0]
+        state[self.Y] = origins[:, 1]
+        state[self.VELOCITY_X] = np.cos(angles) * speeds
+        state[self.VELOCITY_Y] = np.sin(angles) * speeds
+        state[self.AGE] = 0
+        state[self.LIFETIME] = rng.integers(self.lifetime_frames_min, self.lifetime_frames_max,
+                                            emitted, endpoint=True)
+        self.palette_indices[self.count:self.count + emitted] = rng.integers(0, self.palette_size, emitted)
+
+        self.count += emitted
+        self.emitted += emitted
+        self.high_water = max(self.high_water, self.count)
+
+    def update(self):
+        """Advance all live particles by one frame and retire the expired ones."""
+        count = self.count
+        if count == 0:
+            return
+        state = self.state[:, :count]
+        state[self.X:self.Y + 1] += state[self.VELOCITY_X:self.VELOCITY_Y + 1]
+        state[self.VELOCITY_X:self.VELOCITY_Y + 1] *= self.drag
+        state[self.AGE] += 1
+
+        alive = state[self.AGE] < state[self.LIFETIME]
+        if alive.all():
+            return
+        # Compact the survivors to the front, keeping their order
+        keep = np.flatnonzero(alive)
+        survivors = len(keep)
+        self.state[:, :survivors] = np.take(state, keep, axis=1)
+        self.palette_indices[:survivors] = self.palette_indices[keep]
+        self.count = survivors
+
+    def get_visible(self, left: float, top: float, right: float, bottom: float) -> tuple:
+        """
+        Get the live particles inside a rectangle.
+
+        Args:
+            left: Minimum x (inclusive)
+            top: Minimum y (inclusive)
+            right: Maximum x (exclusive)
+            bottom: Maximum y (exclusive)
+
+        Returns:
+            Tuple of ((n, 2) float32 positions, (n,) indices into color_table), both copies
+        """
+        state = self.state[:, :self.count]
+        x, y = state[self.X], state[self.Y]
+        visible = np.flatnonzero((x >= left) & (x < right) & (y >= top) & (y < bottom))
+        positions = np.take(state[self.X:self.Y + 1], visible, axis=1).T
+        levels = np.minimum(np.take(state[self.AGE], visible) * self.fade_levels /
+                            np.take(state[self.LIFETIME], visible), self.fade_levels - 1).astype(np.uint16)
+        colors = self.palette_indices[visible] * np.uint16(self.fade_levels) + levels
+        return positions, colors
+
+    def clear(self):
+        """Remove all particles."""
+        self.count = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get particle statistics.
+
+        Returns:
+            Dictionary with live, capacity, emitted, dropped and high-water counts
+        """
+        return {
+            'live': self.count,
+            'capacity': self.capacity,
+            'emitted': self.emitted,
+            'dropped': self.dropped,
+            'high_water': self.high_water
+        }
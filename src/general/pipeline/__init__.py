@@ -0,0 +1 @@
+"""Pipelined simulation and rendering."""
@@ -0,0 +1,111 @@
+"""Immutable, array-backed snapshot of everything needed to draw a frame."""
+import numpy as np
+
+
+class RenderState:
+    """
+    A read-only view of the game at one simulation tick.
+
+    Red dots and green circles are stored in NumPy arrays that are marked
+    read-only, so the simulation thread can hand a state to the render
+    thread without any locking: a new state is built every tick and
+    published by swapping a single reference.
+    """
+
+    __slots__ = (
+        'tick', 'camera', 'arrow', 'dots', 'circles', 'particles', 'particle_colors', 'score_breakdown',
+        'bomb_cooldown', 'paused', 'game_over', 'last_score', 'should_end',
+        'input_sampled_at'
+    )
+
+    def __init__(self, tick: int, camera: tuple, arrow: tuple, dots: np.ndarray, circles: np.ndarray,
+                 score_breakdown: dict, bomb_cooldown: float, paused: bool,
+                 game_over: bool, last_score: int, should_end: bool,
+                 input_sampled_at: float = None, particles: np.ndarray = None,
+                 particle_colors: np.ndarray = None):
+        """
+        Initialize a render state.
+
+        Args:
+            tick: Simulation tick the state was captured at
+            camera: (x, y) world position of the viewport's top left corner
+            arrow: (x, y, rotation_angle) of the white arrow, or None
+            dots: (n, 2) array of visible red dot centers (world coordinates)
+            circles: (m, 4) array of visible green circle (x, y, radius, alpha)
+            score_breakdown: Result of ScoreTracker.get_score_breakdown()
+            bomb_cooldown: Bomb cooldown seconds remaining
+            paused: Whether the game is paused
+            game_over: Whether the game has ended
+            last_score: Final score of the game
+            should_end: Whether the player asked to return to the menu
+            input_sampled_at: perf_counter time of the mouse sample the tick used
+            particles: (k, 2) array of visible particle positions (world coordinates)
+            particle_colors: (k,) array of indices into ParticleSystem.color_table
+        """
+        if particles is None:
+            particles = np.empty((0, 2), dtype=np.float32)
+            particle_colors = np.empty(0, dtype=np.uint16)
+        for array in (dots, circles, particles, particle_colors):
+            array.flags.writeable = False
+        self.tick = tick
+        self.camera = camera
+        self.arrow = arrow
+        self.dots = dots
+        self.circles = circles
+        self.particles = particles
+        self.particle_colors = particle_colors
+        self.score_breakdown = score_breakdown
+        self.bomb_cooldown = bomb_cooldown
+        self.paused = paused
+        self.game_over = game_over
+        self.last_score = last_score
+        self.should_end = should_end
+        self.input_sampled_at = input_sampled_at
+
+    @classmethod
+    def capture(cls, game_loop, tick: int = 0) -> 'RenderState':
+        """
+        Capture the drawable state of a game loop.
+
+        Args:
+            game_loop: The GameLoop to capture
+            tick: Simulation tick number to tag the state with
+
+        Returns:
+            A new RenderState
+        """
+        # Only what the camera sees is copied into the state
+        visible_dots = game_loop.get_visible_red_dots()
+        dots = game_loop.red_dot_grid.positions[visible_dots]
+
+        green_circles = game_loop.get_visible_green_circles()
+        circles = np.fromiter(
+            (value for green_circle in green_circles
+             for value in (green_circle.position.x, green_circle.position.y,
+                           green_circle.pic.current_radius, green_circle.pic.alpha)),
+            dtype=np.float64, count=len(green_circles) * 4
+        ).reshape(-1, 4)
+
+        particles, particle_colors = game_loop.get_visible_particles()
+
+        white_arrow = game_loop.white_arrow
+        arrow = None
+        if white_arrow is not None:
+            arrow = (white_arrow.position.x, white_arrow.position.y, white_arrow.pic.rotation_angle)
+
+        return cls(
+            tick=tick,
+            camera=game_loop.camera.get_offset(),
+            arrow=arrow,
+            dots=dots,
+            circles=circles,
+            score_breakdown=game_loop.score_tracker.get_score_breakdown(),
+            bomb_cooldown=game_loop.bomb_control.get_cooldown_seconds_remaining(),
+            paused=game_loop.pause_control.is_paused(),
+            game_over=game_loop.game_over,
+            last_score=game_loop.last_score,
+            should_end=game_loop.end_control.should_end_game(),
+            input_sampled_at=game_loop.input_sampled_at,
+            particles=particles,
+            particle_colors=particle_colors
+        )
@@ -0,0 +1,173 @@
+"""Runs the game simulation on a worker thread for pipelined mode."""
+import queue
+import threading
+import time
+import pygame
+from .render_state import RenderState
+
+
+class SimulationWorker:
+    """
+    Ticks a GameLoop's simulation on a background thread.
+
+    The main thread keeps ownership of pygame events and the display: it
+    forwards input with submit_input() and renders whatever latest_state
+    holds. The worker applies the input, runs update() and publishes a new
+    immutable RenderState each tick. Neither side waits on the other while
+    the game runs; while it is paused or over, the worker sleeps until input
+    arrives, waking every idle_wait_ms only to let spectators join.
+    """
+
+    def __init__(self, game_loop):
+        """
+        Initialize the worker.
+
+        Args:
+            game_loop: The GameLoop whose simulation should run on the worker
+        """
+        self.game_loop = game_loop
+        self.input_events = queue.SimpleQueue()
+        # Notified when input is queued or the worker is stopped
+        self.input_ready = threading.Condition()
+        self.mouse_position = None
+        self.input_sampled_at = None
+        self.latest_state = None
+        self.thread = None
+        self.running = False
+
+        # Busy time statistics for measuring overlap
+        self.ticks = 0
+        self.simulation_seconds = 0.0
+        self.frames = 0
+        self.render_seconds = 0.0
+        self.started_at = 0.0
+        self.stopped_at = 0.0
+
+    def start(self):
+        """Publish the initial state and start ticking."""
+        self.ticks = 0
+        self.simulation_seconds = 0.0
+        self.frames = 0
+        self.render_seconds = 0.0
+        self.latest_state = RenderState.capture(self.game_loop, self.ticks)
+
+        self.running = True
+        self.started_at = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def is_running(self) -> bool:
+        """
+        Check if the worker thread is ticking.
+
+        Returns:
+            True if started and not yet stopped
+        """
+        return self.running
+
+    def submit_input(self, events: list, mouse_position: tuple, sampled_at: float = None):
+        """
+        Forward input from the main thread (call once per rendered frame).
+
+        Args:
+            events: pygame events to apply on the next tick
+            mouse_position: Current (x, y) mouse position
+            sampled_at: perf_counter time the mouse position was sampled
+        """
+        for event in events:
+            self.input_events.put(event)
+        self.mouse_position, self.input_sampled_at = mouse_position, sampled_at
+        if events:
+            with self.input_ready:
+                self.input_ready.notify()
+
+    def record_render(self, seconds: float):
+        """
+        Record main-thread busy time for one rendered frame.
+
+        Args:
+            seconds: Thread CPU time spent drawing and presenting the frame
+        """
+        self.frames += 1
+        self.render_seconds += seconds
+
+    def _wait_for_input(self) -> bool:
+        """
+        Sleep until input is queued, the worker is stopped or idle_wait_ms passes.
+
+        Returns:
+            True if input is waiting to be applied
+        """
+        with self.input_ready:
+            if self.running and self.input_events.empty():
+                self.input_ready.wait(self.game_loop.idle_wait_ms / 1000)
+        return not self.input_events.empty()
+
+    def _run(self):
+        """Worker thread: tick the simulation at the game's frame rate."""
+        game_loop = self.game_loop
+        clock = pygame.time.Clock()
+        while self.running:
+            # Nothing moves while paused or after game over, so only input can change the state
+            if (game_loop.pause_control.is_paused() or game_loop.game_over) and not self._wait_for_input():
+                # Keep spectators up to date on the frozen state, as the serial idle loop does
+                if self.running and game_loop.spectator_server is not None:
+                    game_loop.spectator_server.publish(game_loop)
+                continue
+
+            tick_start = time.thread_time()
+
+            events = []
+            while True:
+                try:
+                    events.append(self.input_events.get_nowait())
+                except queue.Empty:
+                    break
+            game_loop.handle_events(events)
+            game_loop.mouse_position, game_loop.input_sampled_at = self.mouse_position, self.input_sampled_at
+
+            game_loop.update()
+            if game_loop.state_exporter is not None:
+                game_loop.state_exporter.publish(game_loop)
+            if game_loop.spectator_server is not None:
+                game_loop.spectator_server.publish(game_loop)
+
+            self.ticks += 1
+            self.latest_state = RenderState.capture(game_loop, self.ticks)
+            self.simulation_seconds += time.thread_time() - tick_start
+
+            clock.tick(game_loop.fps)
+
+    def stop(self):
+        """Stop the worker thread and wait for it to exit."""
+        if self.thread is not None:
+            with self.input_ready:
+                self.running = False
+                self.input_ready.notify()
+            self.thread.join()
+            self.thread = None
+            self.stopped_at = time.perf_counter()
+            self.game_loop.mouse_position = None
+
+    def get_stats(self) -> dict:
+        """
+        Get pipeline statistics.
+
+        Busy times are per-thread CPU time, so time spent waiting for the
+        GIL is not counted. 'parallelism' is the combined busy time of both
+        threads divided by wall time; values above 1.0 mean simulation and
+        rendering genuinely ran at the same time.
+
+        Returns:
+            Dictionary with tick, frame, busy time and parallelism figures
+        """
+        end = time.perf_counter() if self.running else self.stopped_at
+        wall_seconds = max(end - self.started_at, 1e-9)
+        return {
+            'ticks': self.ticks,
+            'frames': self.frames,
+            'simulation_seconds': self.simulation_seconds,
+            'render_seconds': self.render_seconds,
+            'wall_seconds': wall_seconds,
+            'parallelism': (self.simulation_seconds + self.render_seconds) / wall_seconds
+        }
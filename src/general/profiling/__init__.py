@@ -0,0 +1 @@
+"""Opt-in profiling of the game loop."""
@@ -0,0 +1,302 @@
+"""Attributes memory allocations to the phases of a game loop frame."""
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from src.config.config_loader import config
+
+# Repository root; allocation sites inside it are reported relative to it
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class AllocationProfiler:
+    """
+    Measures allocation churn and retained memory per frame phase.
+
+    The game loop marks phase boundaries with begin_frame(),
+    switch_phase() and end_frame(). Three kinds of measurement are taken:
+
+    - Every frame, per phase: wall time, net traced bytes and net
+      allocated blocks (what the phase left behind), the transient peak
+      of traced bytes above the phase's start (tracemalloc.reset_peak)
+      and the garbage collections that ran during the phase.
+    - Every sample_interval frames, per phase and allocation site: gross
+      allocated blocks. A sys.setprofile hook reads
+      sys.getallocatedblocks() at every call and return, and attributes
+      each increase to the line that was running, so short-lived objects
+      (like a Position replaced every update) are counted even though
+      they never show up in a snapshot. Sampled frames are excluded
+      from the per-frame numbers, since the hook slows them down.
+    - Over the whole run: retained memory growth by line, from a
+      tracemalloc snapshot taken at start() and one taken for the report.
+
+    The profiler's own bookkeeping between two phases is measured by
+    start() and subtracted, and a full collection runs before both
+    snapshots, since it also empties the interpreter's free lists (freed
+    tuples and floats held for reuse would otherwise show up as growth).
+    Memory that SDL allocates itself (e.g. pixel buffers of temporary
+    Surfaces) is outside tracemalloc's view; the Surface objects are still
+    counted as allocations. Timings include tracemalloc's own overhead.
+    """
+
+    # Frames of the snapshot that belong to the profiler or the import machinery
+    SNAPSHOT_FILTERS = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, '<unknown>')
+    )
+
+    def __init__(self, sample_interval: int = None, top_sites: int = None):
+        """
+        Initialize the profiler (call start() to begin tracing).
+
+        Args:
+            sample_interval: Frames between allocation site samples (default: from config)
+            top_sites: Number of allocation sites listed in the report (default: from config)
+        """
+        cfg = config.get('general', 'profiling', 'allocation_profiler')
+        self.sample_interval = sample_interval if sample_interval is not None else cfg['sample_interval']
+        self.top_sites = top_sites if top_sites is not None else cfg['top_sites']
+        self.traceback_frames = cfg['traceback_frames']
+
+        self.phases = {}
+        self.sites = {}
+        self.frames = 0
+        self.sampled_frames = 0
+        self.started = False
+        self.start_snapshot = None
+        self.overhead_bytes = 0.0
+        self.overhead_blocks = 0.0
+        self.overhead_peak = 0.0
+
+        # State of the frame and phase being measured
+        self.frame_open = False
+        self.sampling = False
+        self.phase = None
+        self.phase_started = 0.0
+        self.phase_bytes = 0
+        self.phase_blocks = 0
+        self.frame_phases = {}
+        self.frame_collections = {}
+        self.hook_blocks = 0
+
+    def start(self):
+        """Start tracing allocations."""
+        if self.started:
+            return
+        self.started = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_frames)
+        gc.callbacks.append(self._on_gc)
+        self._calibrate()
+        gc.collect()
+        self.start_snapshot = tracemalloc.take_snapshot().filter_traces(self.SNAPSHOT_FILTERS)
+
+    def _calibrate(self, phases: int = 100):
+        """Measure what an empty phase reports, to subtract it from real phases."""
+        self.frame_open = True
+        self.frame_phases = {}
+        for _ in range(phases):
+            self.switch_phase('calibration')
+        self.switch_phase(None)
+        _, net_bytes, net_blocks, peak_bytes, count = self.frame_phases.pop('calibration')
+        self.overhead_bytes = net_bytes / count
+        self.overhead_blocks = net_blocks / count
+        self.overhead_peak = peak_bytes
+        self.frame_open = False
+
+    def _on_gc(self, phase: str, info: dict):
+        """Count collections against the phase they interrupt."""
+        if phase == 'start' and self.phase is not None:
+            key = (self.phase, info['generation'])
+            self.frame_collections[key] = self.frame_collections.get(key, 0) + 1
+
+    def _hook(self, frame, event: str, arg):
+        """Profile hook for sampled frames: attribute new blocks to the running line."""
+        allocated = sys.getallocatedblocks() - self.hook_blocks
+        if allocated > 0 and self.phase is not None:
+            # On a call, the allocation happened in the caller
+            site_frame = frame.f_back if event == 'call' and frame.f_back is not None else frame
+            filename = site_frame.f_code.co_filename
+            if filename != __file__:
+                key = (self.phase, filename, site_frame.f_lineno)
+                self.sites[key] = self.sites.get(key, 0) + allocated
+        self.hook_blocks = sys.getallocatedblocks()
+
+    def begin_frame(self):
+        """Start measuring a frame with its first phase ('events'); an unfinished frame is discarded."""
+        if not self.started:
+            return
+        if self.frame_open:
+            self._close_frame(False)
+        self.frame_open = True
+        self.frame_phases = {}
+        self.frame_collections = {}
+        self.sampling = self.frames % self.sample_interval == 0
+        if self.sampling:
+            self.hook_blocks = sys.getallocatedblocks()
+            sys.setprofile(self._hook)
+        self.switch_phase('events')
+
+    def switch_phase(self, name: str):
+        """
+        End the current phase and start the next.
+
+        Args:
+            name: Name of the phase that starts now, or None to only end the current one
+        """
+        if not self.frame_open:
+            return
+        now = time.perf_counter()
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        if self.phase is not None:
+            totals = self.frame_phases.setdefault(self.phase, [0.0, 0, 0, 0, 0])
+            totals[0] += now - self.phase_started
+            totals[1] += current - self.phase_bytes
+            totals[2] += blocks - self.phase_blocks
+            totals[3] = max(totals[3], peak - self.phase_bytes)
+            totals[4] += 1
+        self.phase = name
+        tracemalloc.reset_peak()
+        self.phase_bytes, _ = tracemalloc.get_traced_memory()
+        self.phase_blocks = sys.getallocatedblocks()
+        self.phase_started = time.perf_counter()
+
+    def end_frame(self):
+        """Finish measuring the current frame."""
+        if self.frame_open:
+            self._close_frame(True)
+
+    def _close_frame(self, complete: bool):
+        """End the last phase and add the frame's measurements."""
+        self.switch_phase(None)
+        if self.sampling:
+            sys.setprofile(None)
+            self.sampling = False
+            self.sampled_frames += 1
+        elif complete:
+            for name, (seconds, net_bytes, net_blocks, peak_bytes, count) in self.frame_phases.items():
+                net_bytes -= self.overhead_bytes * count
+                net_blocks -= self.overhead_blocks * count
+                peak_bytes = max(peak_bytes - self.overhead_peak, 0)
+                phase = self._get_phase(name)
+                phase['frames'] += 1
+                phase['seconds'] += seconds
+                phase['net_bytes'] += net_bytes
+                phase['net_blocks'] += net_blocks
+                phase['peak_bytes'] += peak_bytes
+                phase['peak_bytes_max'] = max(phase['peak_bytes_max'], peak_bytes)
+            for (name, generation), count in self.frame_collections.items():
+                self._get_phase(name)['gc_collections'][generation] += count
+        if complete:
+            self.frames += 1
+        self.frame_open = False
+
+    def _get_phase(self, name: str) -> dict:
+        """Get the accumulators of a phase, creating them on first use."""
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = {
+                'frames': 0, 'seconds': 0.0, 'net_bytes': 0, 'net_blocks': 0,
+                'peak_bytes': 0, 'peak_bytes_max': 0, 'gc_collections': [0, 0, 0]
+            }
+        return phase
+
+    @staticmethod
+    def _site_name(filename: str, lineno: int) -> str:
+        """Format an allocation site, relative to the repository when inside it."""
+        if filename.startswith(ROOT + os.sep):
+            filename = os.path.relpath(filename, ROOT)
+        else:
+            filename = os.path.basename(filename)
+        return f"{filename}:{lineno}"
+
+    def get_report(self) -> dict:
+        """
+        Build the allocation report.
+
+        Returns:
+            JSON-serializable dictionary with per-phase, per-frame, allocation site and retained growth figures
+        """
+        phases = {}
+        sampled = max(self.sampled_frames, 1)
+        allocations = {}
+        for (name, _, _), count in self.sites.items():
+            allocations[name] = allocations.get(name, 0) + count
+        for name, phase in self.phases.items():
+            frames = max(phase['frames'], 1)
+            phases[name] = {
+                'ms_per_frame': round(phase['seconds'] / frames * 1000, 4),
+                'allocations_per_frame': round(allocations.get(name, 0) / sampled, 1),
+                'net_bytes_per_frame': round(phase['net_bytes'] / frames, 1),
+                'net_blocks_per_frame': round(phase['net_blocks'] / frames, 2),
+                'peak_bytes_mean': round(phase['peak_bytes'] / frames, 1),
+                'peak_bytes_max': round(phase['peak_bytes_max']),
+                'gc_collections': dict(zip(('gen0', 'gen1', 'gen2'), phase['gc_collections']))
+            }
+
+        sites = {}
+        for (name, filename, lineno), count in self.sites.items():
+            key = (name, self._site_name(filename, lineno))
+            sites[key] = sites.get(key, 0) + count
+        top_sites = [
+            {'phase': name, 'site': site, 'allocations_per_frame': round(count / sampled, 1)}
+            for (name, site), count in sorted(sites.items(), key=lambda item: (-item[1], item[0]))[:self.top_sites]
+        ]
+
+        retained = {'bytes': 0, 'blocks': 0, 'top_sites': []}
+        if self.start_snapshot is not None:
+            gc.collect()
+            snapshot = tracemalloc.take_snapshot().filter_traces(self.SNAPSHOT_FILTERS)
+            differences = snapshot.compare_to(self.start_snapshot, 'lineno')
+            retained['bytes'] = sum(difference.size_diff for difference in differences)
+            retained['blocks'] = sum(difference.count_diff for difference in differences)
+            growing = sorted((difference for difference in differences if difference.size_diff > 0),
+                             key=lambda difference: -difference.size_diff)[:self.top_sites]
+            retained['top_sites'] = [
+                {'site': self._site_name(difference.traceback[0].filename, difference.traceback[0].lineno),
+                 'bytes': difference.size_diff, 'blocks': difference.count_diff}
+                for difference in growing
+            ]
+
+        return {
+            'frames': self.frames,
+            'sampled_frames': self.sampled_frames,
+            'python': sys.version.split()[0],
+            'config_hash': config.get_hash(),
+            'per_frame': {
+                'allocations': round(sum(allocations.values()) / sampled, 1),
+                'net_bytes': round(sum(phase['net_bytes_per_frame'] for phase in phases.values()), 1),
+                'gc_collections': round(sum(sum(phase['gc_collections']) for phase in self.phases.values()) /
+                                        max(self.frames - self.sampled_frames, 1), 4)
+            },
+            'phases': phases,
+            'top_sites': top_sites,
+            'retained_growth': retained
+        }
+
+    def write_report(self, path: str):
+        """
+        Write the report as JSON with sorted keys, so reports of two versions diff cleanly.
+
+        Args:
+            path: Output file path
+        """
+        with open(path, 'w') as file:
+            json.dump(self.get_report(), file, indent=2, sort_keys=True)
+            file.write('\n')
+
+    def stop(self):
+        """Stop tracing (the collected figures stay available)."""
+        if not self.started:
+            return
+        self.end_frame()
+        self.started = False
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
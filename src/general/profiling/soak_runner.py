@@ -0,0 +1,205 @@
+"""Drives a headless game for hours of game time and watches for growth."""
+import gc
+import os
+import sys
+import time
+import numpy as np
+from src.config.config_loader import config
+
+
+def get_rss_bytes() -> int:
+    """
+    Get the resident set size of this process.
+
+    Returns:
+        Current RSS in bytes on Linux, peak RSS where /proc is unavailable, or 0 if neither can be read
+    """
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class SoakRunner:
+    """
+    Runs a GameLoop's simulation for a long stretch of game time.
+
+    The game loop is expected to be steered by a bot (or anything else
+    that does not need input). Every frame is updated and every
+    draw_interval-th frame is drawn to the screen surface; game time is
+    counted in frames, so an hour of play takes as long as the frames take
+    to compute. When the game ends, a new one starts, so a session can
+    also reveal memory that is not released between games.
+
+    Every sample_seconds of game time a sample records RSS, allocated
+    blocks, gc-tracked objects, the number of live dots, circles and
+    particles and the update and draw times since the previous sample.
+    check() compares the last sample with the first one after the warm-up
+    against the configured limits; a run too short to have both fails.
+    """
+
+    def __init__(self, game_loop, screen, sample_seconds: float = None, draw_interval: int = None):
+        """
+        Initialize the runner.
+
+        Args:
+            game_loop: The GameLoop to drive
+            screen: Surface to draw on
+            sample_seconds: Game seconds between samples (default: from config)
+            draw_interval: Frames between drawn frames (default: from config)
+        """
+        cfg = config.get('general', 'profiling', 'soak_runner')
+        self.game_loop = game_loop
+        self.screen = screen
+        self.sample_frames = max(1, round((sample_seconds if sample_seconds is not None else cfg['sample_seconds'])
+                                          * game_loop.fps))
+        self.draw_interval = max(1, draw_interval if draw_interval is not None else cfg['draw_interval'])
+        self.warmup_seconds = cfg['warmup_minutes'] * 60
+        self.limits = {
+            'rss_growth_mb': cfg['max_rss_growth_mb'],
+            'object_growth': cfg['max_object_growth'],
+            'frame_time_growth': cfg['max_frame_time_growth']
+        }
+
+        self.frames = 0
+        self.games = 1
+        self.samples = []
+        self.wall_seconds = 0.0
+
+        # Timings since the last sample
+        self.update_seconds = []
+        self.draw_seconds = []
+
+    def run(self, hours: float):
+        """
+        Play for the given amount of game time, sampling as it goes.
+
+        Args:
+            hours: Game hours to simulate
+        """
+        game_loop = self.game_loop
+        if game_loop.white_arrow is None:
+            game_loop.initialize_game()
+        total_frames = self.frames + round(hours * 3600 * game_loop.fps)
+        if not self.samples:
+            self.sample()
+
+        started = time.perf_counter()
+        while self.frames < total_frames:
+            if game_loop.game_over:
+                game_loop.initialize_game()
+                self.games += 1
+
+            update_start = time.perf_counter()
+            game_loop.update()
+            self.update_seconds.append(time.perf_counter() - update_start)
+
+            if self.frames % self.draw_interval == 0:
+                draw_start = time.perf_counter()
+                game_loop.draw(self.screen)
+                self.draw_seconds.append(time.perf_counter() - draw_start)
+
+            self.frames += 1
+            if self.frames % self.sample_frames == 0:
+                self.sample()
+        self.wall_seconds += time.perf_counter() - started
+
+    def sample(self):
+        """Record a sample and start timing the next interval."""
+        game_loop = self.game_loop
+        update_ms = np.array(self.update_seconds) * 1000
+        draw_ms = np.array(self.draw_seconds) * 1000
+        self.samples.append({
+            'game_seconds': round(self.frames / game_loop.fps, 1),
+            'games': self.games,
+            'rss_mb': round(get_rss_bytes() / 2 ** 20, 2),
+            'allocated_blocks': sys.getallocatedblocks(),
+            'gc_objects': len(gc.get_objects()),
+            'red_dots': len(game_loop.red_dots),
+            'green_circles': len(game_loop.green_circles),
+            'particles': len(game_loop.particle_system),
+            'update_ms_mean': round(float(update_ms.mean()), 4) if len(update_ms) else 0.0,
+            'update_ms_max': round(float(update_ms.max()), 4) if len(update_ms) else 0.0,
+            'draw_ms_mean': round(float(draw_ms.mean()), 4) if len(draw_ms) else 0.0,
+            'draw_ms_max': round(float(draw_ms.max()), 4) if len(draw_ms) else 0.0
+        })
+        self.update_seconds = []
+        self.draw_seconds = []
+
+    def get_baseline(self) -> dict:
+        """
+        Get the sample that growth is measured from.
+
+        Returns:
+            The first sample taken after the warm-up with timings, or None if
+            no sample before the last one is past the warm-up (the run is too
+            short to measure growth)
+        """
+        for sample in self.samples[1:-1]:
+            if sample['game_seconds'] >= self.warmup_seconds:
+                return sample
+        return None
+
+    def check(self) -> list:
+        """
+        Compare the end of the run with the baseline.
+
+        Returns:
+            Descriptions of every exceeded limit (empty if the run passed)
+        """
+        baseline = self.get_baseline()
+        if baseline is None:
+            game_seconds = self.samples[-1]['game_seconds'] if self.samples else 0
+            return [f"run too short to judge: {game_seconds:g} game seconds, growth is measured from the first "
+                    f"sample after the {self.warmup_seconds:g} s warm-up to a later sample"]
+        last = self.samples[-1]
+        failures = []
+
+        rss_growth = last['rss_mb'] - baseline['rss_mb']
+        if rss_growth > self.limits['rss_growth_mb']:
+            failures.append(f"RSS grew by {rss_growth:.1f} MB (limit {self.limits['rss_growth_mb']} MB)")
+
+        object_growth = last['gc_objects'] - baseline['gc_objects']
+        if object_growth > self.limits['object_growth']:
+            failures.append(f"gc-tracked objects grew by {object_growth} (limit {self.limits['object_growth']})")
+
+        # Frame cost: every frame is updated, every draw_interval-th one drawn
+        def frame_ms(sample):
+            return sample['update_ms_mean'] + sample['draw_ms_mean']
+        if frame_ms(baseline) > 0:
+            frame_time_growth = frame_ms(last) / frame_ms(baseline)
+            if frame_time_growth > self.limits['frame_time_growth']:
+                failures.append(f"frame time grew {frame_time_growth:.1f}x, from {frame_ms(baseline):.2f} ms "
+                                f"to {frame_ms(last):.2f} ms (limit {self.limits['frame_time_growth']}x)")
+        return failures
+
+    def get_report(self) -> dict:
+        """
+        Get the samples, the growth since the baseline and the result of check().
+
+        Returns:
+            JSON-serializable dictionary
+        """
+        baseline, last = self.get_baseline(), self.samples[-1]
+        return {
+            'game_hours': round(self.frames / self.game_loop.fps / 3600, 3),
+            'games': self.games,
+            'wall_seconds': round(self.wall_seconds, 1),
+            'baseline_game_seconds': baseline['game_seconds'] if baseline is not None else None,
+            'growth': {
+                key: round(last[key] - baseline[key], 4)
+                for key in ('rss_mb', 'allocated_blocks', 'gc_objects', 'red_dots',
+                            'update_ms_mean', 'draw_ms_mean')
+            } if baseline is not None else {},
+            'limits': self.limits,
+            'failures': self.check(),
+            'samples': self.samples
+        }
@@ -0,0 +1 @@
+"""Adaptive render quality."""
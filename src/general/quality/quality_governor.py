@@ -0,0 +1,146 @@
+"""Adaptive quality governor driven by measured frame time."""
+from collections import deque
+from src.media.pics.render_quality import render_quality
+from src.config.config_loader import config
+
+
+class QualityGovernor:
+    """
+    Steps render quality down when frames run over budget and back up when there is headroom.
+
+    Frame work time (everything except the pacing sleep) is kept in a
+    rolling window. Once the window is full, a mean above the step-down
+    ratio of the frame budget lowers quality by one level and a mean below
+    the step-up ratio raises it by one. The gap between the two ratios plus
+    a hold period after every change keep the level from flapping. Level
+    changes are kept for get_stats(), which main.py prints on exit.
+
+    Levels:
+        0  full quality
+        1  green circles drawn as a ring without the alpha fill
+        2  red dots drawn without their border
+        3  HUD text re-rendered only every few frames
+        4  game drawn at a reduced internal resolution and upscaled
+    """
+
+    MAX_LEVEL = 4
+    # Most recent level changes kept for the report
+    REPORTED_CHANGES = 20
+
+    def __init__(self, fps: int = None):
+        """
+        Initialize the governor.
+
+        Args:
+            fps: Target frame rate (default: from config)
+        """
+        if fps is None:
+            fps = config.get_fps()
+        cfg = config.get('general', 'quality', 'quality_governor')
+        self.frame_budget = 1.0 / fps
+        self.step_down_ratio = cfg['step_down_ratio']
+        self.step_up_ratio = cfg['step_up_ratio']
+        self.hold_frames = cfg['hold_frames']
+        self.hud_refresh_frames = cfg['hud_refresh_frames']
+        self.reduced_render_scale = cfg['reduced_render_scale']
+        self.max_level = min(cfg['max_level'], self.MAX_LEVEL)
+
+        self.frame_times = deque(maxlen=cfg['window_frames'])
+        self.window_total = 0.0
+        self.level = 0
+        self.frames_since_change = 0
+        self.apply_level()
+
+        # Statistics
+        self.frames = 0
+        self.level_changes = 0
+        self.lowest_quality = 0
+        self.recent_changes = deque(maxlen=self.REPORTED_CHANGES)
+
+    def record_frame(self, seconds: float):
+        """
+        Record the work time of one frame and adjust the level if needed.
+
+        Args:
+            seconds: Time spent on the frame, excluding the pacing sleep
+        """
+        if len(self.frame_times) == self.frame_times.maxlen:
+            self.window_total -= self.frame_times[0]
+        self.frame_times.append(seconds)
+        self.window_total += seconds
+        self.frames_since_change += 1
+        self.frames += 1
+
+        if len(self.frame_times) < self.frame_times.maxlen or self.frames_since_change < self.hold_frames:
+            return
+
+        mean = self.window_total / len(self.frame_times)
+        if mean > self.frame_budget * self.step_down_ratio and self.level < self.max_level:
+            self.set_level(self.level + 1)
+        elif mean < self.frame_budget * self.step_up_ratio and self.level > 0:
+            self.set_level(self.level - 1)
+
+    def set_level(self, level: int):
+        """
+        Switch to a quality level.
+
+        Args:
+            level: The new level (0 = full quality)
+        """
+        self.recent_changes.append({
+            'frame': self.frames,
+            'from': self.level,
+            'to': level,
+            'mean_frame_ms': self.window_total / max(len(self.frame_times), 1) * 1000
+        })
+        self.level_changes += 1
+        self.lowest_quality = max(self.lowest_quality, level)
+        self.level = level
+        self.frames_since_change = 0
+        self.frame_times.clear()
+        self.window_total = 0.0
+        self.apply_level()
+
+    def apply_level(self):
+        """Push the current level into the shared render quality settings."""
+        render_quality.circle_border_only = self.level >= 1
+        render_quality.simple_red_dots = self.level >= 2
+        render_quality.hud_refresh_frames = self.hud_refresh_frames if self.level >= 3 else 1
+        render_quality.render_scale = render_quality.base_render_scale
+        if self.level >= 4:
+            render_quality.render_scale = min(render_quality.base_render_scale, self.reduced_render_scale)
+
+    def get_level(self) -> int:
+        """
+        Get the current quality level.
+
+        Returns:
+            The level (0 = full quality)
+        """
+        return self.level
+
+    def reset(self):
+        """Return to full quality and forget measured frames."""
+        self.level = 0
+        self.frames_since_change = 0
+        self.frame_times.clear()
+        self.window_total = 0.0
+        self.apply_level()
+
+    def get_stats(self) -> dict:
+        """
+        Get level change statistics.
+
+        Returns:
+            Dictionary with frames recorded, current level, number of level
+            changes, lowest quality (highest level) reached, the frame budget
+            and the most recent changes
+        """
+        return {
+            'frames': self.frames,
+            'level': self.level,
+            'level_changes': self.level_changes,
+            'lowest_quality': self.lowest_quality,
+            'budget_ms': self.frame_budget * 1000,
+            'recent_changes': list(self.recent_changes)
+        }
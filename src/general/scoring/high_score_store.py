@@ -0,0 +1,250 @@
+"""Persistent high-score store backed by SQLite."""
+import getpass
+import os
+import queue
+import sqlite3
+import threading
+import time
+from src.config.config_loader import config
+
+
+class HighScoreStore:
+    """
+    Durable local leaderboard.
+
+    Finished games are queued and inserted by a background writer thread,
+    so recording a score never blocks the render thread. Queries run on the
+    caller's own connection and are answered from indexes, so they stay
+    fast no matter how many games have been recorded. Games that are still
+    waiting in the queue are merged into query results. A batch the
+    database rejects (locked, full) is retried write_attempts times and
+    then dropped from the queue; the last error is kept for close().
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS games (
+            id INTEGER PRIMARY KEY,
+            player TEXT NOT NULL,
+            total INTEGER NOT NULL,
+            seconds INTEGER NOT NULL,
+            red_dots INTEGER NOT NULL,
+            duration_seconds REAL NOT NULL,
+            config_hash TEXT NOT NULL,
+            finished_at REAL NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS games_by_total ON games (total DESC)",
+        "CREATE INDEX IF NOT EXISTS games_by_player_total ON games (player, total DESC)",
+    )
+
+    COLUMNS = ('player', 'total', 'seconds', 'red_dots', 'duration_seconds', 'config_hash', 'finished_at')
+
+    def __init__(self, database_path: str = None, player: str = None):
+        """
+        Open (or create) the store and start the writer thread.
+
+        Args:
+            database_path: Path of the SQLite database (default: from config)
+            player: Name games are recorded under (default: from config, then the OS user)
+        """
+        cfg = config.get('general', 'scoring', 'high_score_store')
+        if database_path is None:
+            database_path = os.path.expanduser(cfg['database_path'])
+        if not player:
+            player = cfg['player_name'] or getpass.getuser()
+        self.database_path = database_path
+        self.player = player
+        self.leaderboard_size = cfg['leaderboard_size']
+        self.write_attempts = max(1, cfg['write_attempts'])
+        self.retry_delay = cfg['retry_delay_ms'] / 1000
+        self.config_hash = config.get_hash()
+
+        directory = os.path.dirname(database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Reader connection for the caller's thread
+        self.connection = self._connect()
+        with self.connection:
+            for statement in self.SCHEMA:
+                self.connection.execute(statement)
+
+        self.pending = []
+        self.pending_lock = threading.Lock()
+        # Writer statistics; error is the last sqlite3.Error that cost games
+        self.games_written = 0
+        self.games_lost = 0
+        self.error = None
+        self.write_queue = queue.Queue()
+        self.writer_thread = threading.Thread(target=self._write_games, daemon=True)
+        self.writer_thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection in WAL mode so readers and the writer don't block each other.
+
+        Returns:
+            The new connection
+        """
+        connection = sqlite3.connect(self.database_path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def record(self, score_breakdown: dict, duration_seconds: float):
+        """
+        Queue a finished game for insertion.
+
+        Args:
+            score_breakdown: Result of ScoreTracker.get_score_breakdown()
+            duration_seconds: Wall-clock length of the game
+        """
+        row = {
+            'player': self.player,
+            'total': score_breakdown['total'],
+            'seconds': score_breakdown['seconds'],
+            'red_dots': score_breakdown['red_dots'],
+            'duration_seconds': duration_seconds,
+            'config_hash': self.config_hash,
+            'finished_at': time.time()
+        }
+        with self.pending_lock:
+            self.pending.append(row)
+        self.write_queue.put(row)
+
+    def _write_games(self):
+        """Writer thread: insert queued games, batching whatever has piled up."""
+        connection = self._connect()
+        insert = (f"INSERT INTO games ({', '.join(self.COLUMNS)}) "
+                  f"VALUES ({', '.join(':' + column for column in self.COLUMNS)})")
+        running = True
+        while running:
+            rows = [self.write_queue.get()]
+            while True:
+                try:
+                    rows.append(self.write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in rows:
+                running = False
+                rows = [row for row in rows if row is not None]
+            if rows:
+                for attempt in range(self.write_attempts):
+                    try:
+                        with connection:
+                            connection.executemany(insert, rows)
+                    except sqlite3.Error as error:
+                        # Locked or full: retry, then give up on the batch but keep the writer running
+                        if attempt + 1 == self.write_attempts:
+                            self.error = error
+                            self.games_lost += len(rows)
+                        else:
+                            time.sleep(self.retry_delay)
+                    else:
+                        self.games_written += len(rows)
+                        break
+                # Saved or lost, the games are no longer pending
+                with self.pending_lock:
+                    for row in rows:
+                        self.pending.remove(row)
+        connection.close()
+
+    def _merge_pending(self, rows: list, limit: int, player: str = None) -> list:
+        """
+        Merge queued games into query results.
+
+        Args:
+            rows: Rows returned by the database
+            limit: Maximum number of rows to return
+            player: Only merge games of this player (default: all players)
+
+        Returns:
+            The merged rows, best first
+        """
+        with self.pending_lock:
+            pending = [row for row in self.pending if player is None or row['player'] == player]
+        if not pending:
+            return rows
+        rows = rows + pending
+        rows.sort(key=lambda row: row['total'], reverse=True)
+        return rows[:limit]
+
+    def _query(self, sql: str, parameters: tuple) -> list:
+        """
+        Run a query and return rows as dictionaries.
+
+        Args:
+            sql: The query to run
+            parameters: Query parameters
+
+        Returns:
+            List of row dictionaries
+        """
+        cursor = self.connection.execute(sql, parameters)
+        return [dict(zip(self.COLUMNS, row)) for row in cursor]
+
+    def get_top_scores(self, limit: int = None) -> list:
+        """
+        Get the best games of all players.
+
+        Args:
+            limit: Number of games to return (default: from config)
+
+        Returns:
+            List of game dictionaries, best first
+        """
+        if limit is None:
+            limit = self.leaderboard_size
+        rows = self._query(
+            f"SELECT {', '.join(self.COLUMNS)} FROM games ORDER BY total DESC LIMIT ?",
+            (limit,)
+        )
+        return self._merge_pending(rows, limit)
+
+    def get_personal_best(self, player: str = None) -> dict:
+        """
+        Get a player's best game.
+
+        Args:
+            player: Player name (default: the store's player)
+
+        Returns:
+            The best game dictionary, or None if the player has no games
+        """
+        if player is None:
+            player = self.player
+        rows = self._query(
+            f"SELECT {', '.join(self.COLUMNS)} FROM games WHERE player = ? ORDER BY total DESC LIMIT 1",
+            (player,)
+        )
+        rows = self._merge_pending(rows, 1, player)
+        return rows[0] if rows else None
+
+    def close(self) -> dict:
+        """
+        Flush queued games and close the store.
+
+        Returns:
+            Dictionary with writer statistics
+        """
+        if self.writer_thread is not None:
+            self.write_queue.put(None)
+            self.writer_thread.join()
+            self.writer_thread = None
+            self.connection.close()
+        return self.get_stats()
+
+    def get_stats(self) -> dict:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with games written, games lost to database errors and
+            the last such error's message (None if every game was saved)
+        """
+        return {
+            'written': self.games_written,
+            'lost': self.games_lost,
+            'error': str(self.error) if self.error is not None else None
+        }
@@ -1,23 +1,38 @@
 """Score tracking system."""
+from src.general.timing.tick_scheduler import TickScheduler
 
 
 class ScoreTracker:
     """Tracks the player's score based on time survived and red dots destroyed."""
     
-    def __init__(self, fps: int = 60):
+    def __init__(self, fps: int = 60, scheduler: TickScheduler = None):
         """
         Initialize the score tracker.
         
         Args:
             fps: Frames per second for time calculation
+            scheduler: The game's tick clock; time survived is counted in its ticks (default: a clock
+                advanced by update_time())
         """
         self.fps = fps
-        self.frames_survived = 0
+        self.owns_scheduler = scheduler is None
+        self.scheduler = scheduler if scheduler is not None else TickScheduler()
+        self.start_tick = self.scheduler.tick
         self.red_dots_destroyed = 0
     
+    @property
+    def frames_survived(self) -> int:
+        """Frames since the game started."""
+        return self.scheduler.tick - self.start_tick
+    
+    @frames_survived.setter
+    def frames_survived(self, frames: int):
+        self.start_tick = self.scheduler.tick - frames
+    
     def update_time(self):
-        """Increment the frame counter (call every frame)."""
-        self.frames_survived += 1
+        """Count a frame survived (only needed when the tracker has its own clock)."""
+        if self.owns_scheduler:
+            self.scheduler.advance()
     
     def add_red_dot_destroyed(self, count: int = 1):
         """
@@ -62,5 +77,5 @@ class ScoreTracker:
     
     def reset(self):
         """Reset the score tracker."""
-        self.frames_survived = 0
+        self.start_tick = self.scheduler.tick
         self.red_dots_destroyed = 0
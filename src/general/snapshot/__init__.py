@@ -0,0 +1 @@
+"""Game state snapshot and restore."""
@@ -0,0 +1,230 @@
+"""Compact binary snapshot of the full game state."""
+import struct
+import sys
+from array import array
+from src.general.position import Position
+from src.general.items.white_arrow import WhiteArrow
+
+
+class GameStateSnapshot:
+    """
+    Serializes a GameLoop into a versioned binary blob and restores it.
+
+    Layout (little-endian, every section 8-byte aligned):
+        header     magic, version, flags, dot count, circle count
+        arrow      x, y, rotation angle, last dx, last dy
+        counters   bomb cooldown, frames survived, red dots destroyed, last
+                   score, red dot spawns emitted and the spawn emitter's start
+                   tick (a double, so a fractional carry survives), gauss_next
+        rng        Mersenne Twister state of the red dot spawner
+        dots       (x, y, speed) doubles per red dot
+        circles    (x, y, current_frame, lifetime_frames) doubles per green circle
+    """
+
+    MAGIC = b'DCGS'
+    VERSION = 2
+
+    HEADER = struct.Struct('<4sHHII')
+    ARROW = struct.Struct('<5d')
+    COUNTERS = struct.Struct('<5i4x2d')
+    RNG = struct.Struct('<625I4x')
+
+    DOT_FIELDS = 3
+    CIRCLE_FIELDS = 4
+
+    # Header flag bits
+    FLAG_HAS_ARROW = 1 << 0
+    FLAG_GAME_OVER = 1 << 1
+    FLAG_PAUSED = 1 << 2
+    FLAG_PAUSE_KEY_PRESSED = 1 << 3
+    FLAG_BOMB_ACTIVATED = 1 << 4
+    FLAG_SPACE_KEY_PRESSED = 1 << 5
+    FLAG_HAS_GAUSS_NEXT = 1 << 6
+
+    FIXED_SIZE = HEADER.size + ARROW.size + COUNTERS.size + RNG.size
+
+    def capture(self, game_loop) -> bytes:
+        """
+        Serialize the state of a game loop.
+
+        Args:
+            game_loop: The GameLoop to capture
+
+        Returns:
+            The snapshot as bytes
+        """
+        pause_control = game_loop.pause_control
+        bomb_control = game_loop.bomb_control
+        score_tracker = game_loop.score_tracker
+        white_arrow = game_loop.white_arrow
+        red_dot_emitter = game_loop.red_dot_emitter
+
+        _, rng_state, gauss_next = game_loop.red_dot_spawn.rng.getstate()
+
+        flags = 0
+        if white_arrow is not None:
+            flags |= self.FLAG_HAS_ARROW
+        if game_loop.game_over:
+            flags |= self.FLAG_GAME_OVER
+        if pause_control.paused:
+            flags |= self.FLAG_PAUSED
+        if pause_control.pause_key_pressed:
+            flags |= self.FLAG_PAUSE_KEY_PRESSED
+        if bomb_control.bomb_activated:
+            flags |= self.FLAG_BOMB_ACTIVATED
+        if bomb_control.space_key_pressed:
+            flags |= self.FLAG_SPACE_KEY_PRESSED
+        if gauss_next is not None:
+            flags |= self.FLAG_HAS_GAUSS_NEXT
+
+        if white_arrow is not None:
+            last_dx, last_dy = white_arrow.movement.get_last_direction()
+            arrow = self.ARROW.pack(
+                white_arrow.position.x, white_arrow.position.y,
+                white_arrow.pic.rotation_angle, last_dx, last_dy
+            )
+        else:
+            arrow = self.ARROW.pack(0.0, 0.0, 0.0, 0.0, 0.0)
+
+        dots = array('d', [
+            value
+            for red_dot in game_loop.red_dots
+            for value in (red_dot.position.x, red_dot.position.y, red_dot.movement.speed)
+        ])
+        circles = array('d', [
+            value
+            for green_circle in game_loop.green_circles
+            for value in (green_circle.position.x, green_circle.position.y,
+                          green_circle.current_frame, green_circle.lifetime_frames)
+        ])
+        if sys.byteorder == 'big':
+            dots.byteswap()
+            circles.byteswap()
+
+        return b''.join((
+            self.HEADER.pack(self.MAGIC, self.VERSION, flags,
+                             len(game_loop.red_dots), len(game_loop.green_circles)),
+            arrow,
+            self.COUNTERS.pack(
+                bomb_control.cooldown_remaining,
+                score_tracker.frames_survived,
+                score_tracker.red_dots_destroyed,
+                game_loop.last_score,
+                red_dot_emitter.emitted,
+                red_dot_emitter.start_tick,
+                gauss_next if gauss_next is not None else 0.0
+            ),
+            self.RNG.pack(*rng_state),
+            dots.tobytes(),
+            circles.tobytes(),
+        ))
+
+    def restore(self, game_loop, data):
+        """
+        Restore a game loop from a snapshot.
+
+        The dot and circle sections are read straight out of the buffer
+        through memoryview casts, so no intermediate copy is made.
+
+        Args:
+            game_loop: The GameLoop to restore into
+            data: A bytes-like object produced by capture()
+
+        Raises:
+            ValueError: If the data is not a snapshot of a supported version
+        """
+        view = memoryview(data).cast('B')
+        if len(view) < self.FIXED_SIZE:
+            raise ValueError("Snapshot is truncated")
+
+        magic, version, flags, dot_count, circle_count = self.HEADER.unpack_from(view, 0)
+        if magic != self.MAGIC:
+            raise ValueError("Not a game state snapshot")
+        if version != self.VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+
+        dots_size = dot_count * self.DOT_FIELDS * 8
+        circles_size = circle_count * self.CIRCLE_FIELDS * 8
+        if len(view) != self.FIXED_SIZE + dots_size + circles_size:
+            raise ValueError("Snapshot size does not match its header")
+
+        offset = self.HEADER.size
+        arrow_x, arrow_y, rotation_angle, last_dx, last_dy = self.ARROW.unpack_from(view, offset)
+        offset += self.ARROW.size
+        (cooldown_remaining, frames_survived, red_dots_destroyed,
+         last_score, spawns_emitted, spawn_start_tick, gauss_next) = self.COUNTERS.unpack_from(view, offset)
+        offset += self.COUNTERS.size
+        rng_state = self.RNG.unpack_from(view, offset)
+        offset += self.RNG.size
+
+        if sys.byteorder == 'big':
+            # Cast views are native-endian, so fall back to a swapped copy
+            dots = array('d', view[offset:offset + dots_size].tobytes())
+            circles = array('d', view[offset + dots_size:].tobytes())
+            dots.byteswap()
+            circles.byteswap()
+        else:
+            dots = view[offset:offset + dots_size].cast('d')
+            circles = view[offset + dots_size:].cast('d')
+
+        # Game clock: the tick counts the frames survived; pending timers are rebuilt below
+        game_loop.scheduler.clear(frames_survived)
+        
+        # Controls
+        game_loop.pause_control.paused = bool(flags & self.FLAG_PAUSED)
+        game_loop.pause_control.pause_key_pressed = bool(flags & self.FLAG_PAUSE_KEY_PRESSED)
+        game_loop.end_control.reset()
+        game_loop.bomb_control.bomb_activated = bool(flags & self.FLAG_BOMB_ACTIVATED)
+        game_loop.bomb_control.space_key_pressed = bool(flags & self.FLAG_SPACE_KEY_PRESSED)
+        game_loop.bomb_control.cooldown_remaining = cooldown_remaining
+
+        # Scoring and game state
+        game_loop.score_tracker.frames_survived = frames_survived
+        game_loop.score_tracker.red_dots_destroyed = red_dots_destroyed
+        game_loop.red_dot_emitter.resume(spawn_start_tick, spawns_emitted)
+        game_loop.last_score = last_score
+        game_loop.game_over = bool(flags & self.FLAG_GAME_OVER)
+
+        # Spawn random generator
+        game_loop.red_dot_spawn.rng.setstate((
+            3, tuple(rng_state),
+            gauss_next if flags & self.FLAG_HAS_GAUSS_NEXT else None
+        ))
+
+        # White arrow
+        if flags & self.FLAG_HAS_ARROW:
+            white_arrow = WhiteArrow(Position(arrow_x, arrow_y))
+            white_arrow.pic.rotation_angle = rotation_angle
+            white_arrow.movement.last_dx = last_dx
+            white_arrow.movement.last_dy = last_dy
+            game_loop.white_arrow = white_arrow
+            game_loop.white_arrow_spawn.has_spawned = True
+        else:
+            game_loop.white_arrow = None
+            game_loop.white_arrow_spawn.reset()
+
+        # Red dots (the current ones are recycled through the game loop's pool)
+        red_dot_pool = game_loop.red_dot_pool
+        red_dot_pool.release_all(game_loop.red_dots)
+        game_loop.red_dots = [
+            red_dot_pool.acquire(Position(dots[i], dots[i + 1]), speed=dots[i + 2])
+            for i in range(0, len(dots), self.DOT_FIELDS)
+        ]
+
+        # Green circles
+        green_circle_pool = game_loop.green_circle_pool
+        green_circle_pool.release_all(game_loop.green_circles)
+        game_loop.green_circles = []
+        for i in range(0, len(circles), self.CIRCLE_FIELDS):
+            green_circle = green_circle_pool.acquire(Position(circles[i], circles[i + 1]),
+                                                     lifetime_frames=int(circles[i + 3]))
+            green_circle.current_frame = int(circles[i + 2])
+            if green_circle.current_frame > 0:
+                green_circle.pic.set_radius(green_circle.current_frame / green_circle.lifetime_frames)
+            green_circle.is_alive = green_circle.current_frame < green_circle.lifetime_frames
+            game_loop.add_green_circle(green_circle)
+
+        if isinstance(dots, memoryview):
+            dots.release()
+            circles.release()
+        view.release()
@@ -0,0 +1 @@
+"""Network spectator stream of the live game state."""
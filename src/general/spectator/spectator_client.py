@@ -0,0 +1,188 @@
+"""Receives and decodes the spectator stream."""
+import socket
+import numpy as np
+from src.config.config_loader import config
+from .spectator_protocol import SpectatorProtocol
+
+
+class SpectatorClient:
+    """
+    Connects to a SpectatorServer and keeps the latest decoded game state.
+
+    poll() reads whatever has arrived without blocking and applies every
+    complete message in order; the attributes then describe the newest tick.
+    Deltas received before the first keyframe are ignored.
+    """
+
+    RECEIVE_SIZE = 1 << 16
+
+    def __init__(self, host: str = None, port: int = None, timeout: float = 5.0):
+        """
+        Connect to a server.
+
+        Args:
+            host: Server host (default: from config)
+            port: Server port (default: from config)
+            timeout: Seconds to wait for the connection
+
+        Raises:
+            OSError: If the server cannot be reached
+        """
+        cfg = config.get('general', 'spectator', 'spectator_server')
+        self.socket = socket.create_connection(
+            (host if host is not None else cfg['host'], port if port is not None else cfg['port']), timeout
+        )
+        self.socket.setblocking(False)
+        self.buffer = bytearray()
+        self.connected = True
+        # The server greets a client together with its first keyframe
+        self.greeted = False
+
+        # Decoded state
+        self.synced = False
+        self.tick = 0
+        self.world_size = (0, 0)
+        self.quantization = 1
+        self.arrow = None
+        self.paused = False
+        self.game_over = False
+        self.bomb_cooldown = 0.0
+        self.score = 0
+        self.seconds = 0
+        self.red_dots_destroyed = 0
+        self.circles = []
+        self.dot_ids = np.empty(0, dtype=np.uint32)
+        self.dot_positions = np.empty((0, 2), dtype=np.int32)
+
+        self.bytes_received = 0
+        self.messages_received = 0
+
+    def poll(self) -> int:
+        """
+        Apply all complete messages that have arrived.
+
+        Returns:
+            Number of messages applied
+
+        Raises:
+            ValueError: If the server does not speak a supported protocol version
+        """
+        while self.connected:
+            try:
+                chunk = self.socket.recv(self.RECEIVE_SIZE)
+            except BlockingIOError:
+                break
+            except OSError:
+                chunk = b''
+            if not chunk:
+                self.connected = False
+                break
+            self.buffer += chunk
+            self.bytes_received += len(chunk)
+
+        if not self.greeted:
+            if len(self.buffer) < SpectatorProtocol.HELLO.size:
+                return 0
+            magic, version = SpectatorProtocol.HELLO.unpack_from(self.buffer, 0)
+            if magic != SpectatorProtocol.MAGIC:
+                raise ValueError("Not a spectator stream")
+            if version != SpectatorProtocol.VERSION:
+                raise ValueError(f"Unsupported spectator stream version {version}")
+            del self.buffer[:SpectatorProtocol.HELLO.size]
+            self.greeted = True
+
+        applied = 0
+        header_size = SpectatorProtocol.HEADER.size
+        view = memoryview(self.buffer)
+        offset = 0
+        while len(self.buffer) - offset >= header_size:
+            length, kind, flags, circle_count, tick = SpectatorProtocol.HEADER.unpack_from(view, offset)
+            end = offset + header_size + length
+            if end > len(self.buffer):
+                break
+            self._apply(view[offset + header_size:end], kind, flags, circle_count, tick)
+            offset = end
+            applied += 1
+        view.release()
+        del self.buffer[:offset]
+        self.messages_received += applied
+        return applied
+
+    def _apply(self, body: memoryview, kind: int, flags: int, circle_count: int, tick: int):
+        """Decode one message body into the current state."""
+        if kind == SpectatorProtocol.KIND_DELTA and not self.synced:
+            return
+        quantization = self.quantization
+        offset = 0
+
+        if kind == SpectatorProtocol.KIND_KEYFRAME:
+            # Quantization is needed for the state, so read the keyframe fields first
+            keyframe_offset = SpectatorProtocol.STATE.size + circle_count * SpectatorProtocol.CIRCLE.size
+            width, height, quantization, dot_count = SpectatorProtocol.KEYFRAME.unpack_from(body, keyframe_offset)
+            self.world_size = (width, height)
+            self.quantization = quantization
+
+        (arrow_x, arrow_y, rotation, cooldown, self.score,
+         self.seconds, self.red_dots_destroyed) = SpectatorProtocol.STATE.unpack_from(body, offset)
+        offset += SpectatorProtocol.STATE.size
+        self.tick = tick
+        self.arrow = None
+        if flags & SpectatorProtocol.FLAG_HAS_ARROW:
+            self.arrow = (arrow_x / quantization, arrow_y / quantization, rotation / 100)
+        self.paused = bool(flags & SpectatorProtocol.FLAG_PAUSED)
+        self.game_over = bool(flags & SpectatorProtocol.FLAG_GAME_OVER)
+        self.bomb_cooldown = cooldown / 100
+
+        circles = []
+        for _ in range(circle_count):
+            x, y, radius, alpha = SpectatorProtocol.CIRCLE.unpack_from(body, offset)
+            circles.append((x / quantization, y / quantization, radius / quantization, alpha))
+            offset += SpectatorProtocol.CIRCLE.size
+        self.circles = circles
+
+        if kind == SpectatorProtocol.KIND_KEYFRAME:
+            offset += SpectatorProtocol.KEYFRAME.size
+            self.dot_ids = np.frombuffer(body, dtype='<u4', count=dot_count, offset=offset).astype(np.uint32)
+            offset += dot_count * 4
+            self.dot_positions = np.frombuffer(body, dtype='<u2', count=dot_count * 2,
+                                               offset=offset).astype(np.int32).reshape(-1, 2)
+            self.synced = True
+            return
+
+        destroyed_count, spawned_count, moved_count = SpectatorProtocol.DELTA.unpack_from(body, offset)
+        offset += SpectatorProtocol.DELTA.size
+        destroyed = np.frombuffer(body, dtype='<u4', count=destroyed_count, offset=offset)
+        offset += destroyed_count * 4
+        spawned_ids = np.frombuffer(body, dtype='<u4', count=spawned_count, offset=offset)
+        offset += spawned_count * 4
+        spawned_positions = np.frombuffer(body, dtype='<u2', count=spawned_count * 2,
+                                          offset=offset).astype(np.int32).reshape(-1, 2)
+        offset += spawned_count * 4
+        moved_ids = np.frombuffer(body, dtype='<u4', count=moved_count, offset=offset)
+        offset += moved_count * 4
+        offsets = np.frombuffer(body, dtype='i1', count=moved_count * 2, offset=offset).reshape(-1, 2)
+
+        # Same order of operations as the server's mirror update
+        if destroyed_count:
+            keep = ~np.isin(self.dot_ids, destroyed)
+            self.dot_ids = self.dot_ids[keep]
+            self.dot_positions = self.dot_positions[keep]
+        if moved_count:
+            self.dot_positions[np.searchsorted(self.dot_ids, moved_ids)] += offsets
+        if spawned_count:
+            self.dot_ids = np.concatenate([self.dot_ids, spawned_ids.astype(np.uint32)])
+            self.dot_positions = np.concatenate([self.dot_positions, spawned_positions])
+
+    def get_dot_positions(self) -> np.ndarray:
+        """
+        Get the red dot centers in world pixels.
+
+        Returns:
+            (n, 2) float array
+        """
+        return self.dot_positions / self.quantization
+
+    def close(self):
+        """Disconnect from the server."""
+        self.connected = False
+        self.socket.close()
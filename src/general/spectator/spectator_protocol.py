@@ -0,0 +1,71 @@
+"""Wire format of the spectator stream."""
+import struct
+import numpy as np
+
+
+class SpectatorProtocol:
+    """
+    Describes the messages SpectatorServer sends to spectator clients over TCP.
+
+    Every message is a header followed by the common state, the green
+    circles and a keyframe or delta body (all little-endian). Positions are
+    quantized to 1/quantization pixel and sent as unsigned 16-bit values.
+
+    Red dots carry a stream id. Server and client both keep a "mirror" of
+    the dots: their ids in ascending order and their last sent positions.
+    A keyframe replaces the mirror; a delta removes destroyed ids, appends
+    spawned ids (always larger than any id before them, so the mirror stays
+    sorted) and then adds small per-axis offsets to some of the remaining
+    dots.
+
+    Layout:
+        header     body length, message type, state flags, circle count, tick
+        state      arrow x, arrow y, arrow rotation (centidegrees), bomb cooldown
+                   (centiseconds), score, seconds survived, red dots destroyed
+        circles    (x, y, radius, alpha) per green circle
+        keyframe   world width, world height, quantization, dot count,
+                   then dot ids (u32) and dot positions (2 x u16)
+        delta      destroyed count, spawned count, moved count, then destroyed
+                   ids, spawned ids, spawned positions, moved ids and moved
+                   offsets (2 x i8)
+    """
+
+    MAGIC = b'DCSP'
+    VERSION = 1
+
+    # Sent once on connect
+    HELLO = struct.Struct('<4sH2x')
+
+    HEADER = struct.Struct('<IBBHI')
+    STATE = struct.Struct('<HHhHIII')
+    CIRCLE = struct.Struct('<HHHBx')
+    KEYFRAME = struct.Struct('<HHHxxI')
+    DELTA = struct.Struct('<III')
+
+    # Message types
+    KIND_KEYFRAME = 1
+    KIND_DELTA = 2
+
+    # State flag bits
+    FLAG_HAS_ARROW = 1 << 0
+    FLAG_GAME_OVER = 1 << 1
+    FLAG_PAUSED = 1 << 2
+
+    # Largest per-axis offset a delta can carry (quantized units)
+    MAX_OFFSET = 127
+    MAX_COORDINATE = 0xFFFF
+
+    @staticmethod
+    def quantize(values: np.ndarray, quantization: int) -> np.ndarray:
+        """
+        Convert world coordinates to quantized stream coordinates.
+
+        Args:
+            values: Coordinates in pixels
+            quantization: Stream units per pixel
+
+        Returns:
+            int32 array of clamped quantized coordinates
+        """
+        quantized = np.rint(np.asarray(values, dtype=np.float64) * quantization)
+        return np.clip(quantized, 0, SpectatorProtocol.MAX_COORDINATE).astype(np.int32)
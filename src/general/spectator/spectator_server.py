@@ -0,0 +1,307 @@
+"""Broadcasts the live game state to spectator clients over TCP."""
+import socket
+import numpy as np
+from src.config.config_loader import config
+from .spectator_protocol import SpectatorProtocol
+
+
+class SpectatorServer:
+    """
+    Streams quantized, delta-compressed game state to connected spectators.
+
+    All clients receive the same stream, built against one mirror of what
+    they have been sent (see SpectatorProtocol). Each tick sends the dots
+    spawned and destroyed since the previous tick plus position offsets for
+    at most max_moves_per_tick dots, chosen by how far their mirrored
+    position lags behind; everything else stays where the spectators last
+    saw it until a later tick or keyframe catches it up. A full keyframe is
+    sent every keyframe_interval ticks and whenever a client joins.
+
+    Sockets are non-blocking and publish() never waits: a client whose
+    unsent backlog grows beyond max_backlog_bytes is disconnected.
+    """
+
+    def __init__(self, host: str = None, port: int = None, world_size: tuple = None):
+        """
+        Initialize the server and start listening.
+
+        Args:
+            host: Interface to listen on (default: from config)
+            port: TCP port, 0 for any free port (default: from config)
+            world_size: (width, height) of the game world (default: from config)
+
+        Raises:
+            ValueError: If the world is too large for the configured quantization
+        """
+        cfg = config.get('general', 'spectator', 'spectator_server')
+        self.quantization = cfg['quantization']
+        self.keyframe_interval = cfg['keyframe_interval']
+        self.max_moves_per_tick = cfg['max_moves_per_tick']
+        self.max_backlog_bytes = cfg['max_backlog_bytes']
+        if world_size is None:
+            world_size = (config.get_world_width(), config.get_world_height())
+        self.world_size = world_size
+        if max(world_size) * self.quantization > SpectatorProtocol.MAX_COORDINATE:
+            raise ValueError(f"World size {world_size} does not fit quantization {self.quantization}")
+
+        self.listener = socket.create_server(
+            (host if host is not None else cfg['host'], port if port is not None else cfg['port'])
+        )
+        self.listener.setblocking(False)
+        self.address = self.listener.getsockname()
+
+        # Connected clients: socket -> unsent bytes; new clients wait for the next keyframe
+        self.clients = {}
+        self.pending_clients = []
+
+        # Mirror of what the clients have been sent
+        self.object_ids = {}
+        self.next_id = 1
+        self.mirror_ids = np.empty(0, dtype=np.uint32)
+        self.mirror_positions = np.empty((0, 2), dtype=np.int32)
+        self.tick = 0
+        self.ticks_since_keyframe = 0
+
+        self.bytes_sent = 0
+        self.messages_sent = 0
+        self.last_message_size = 0
+        self.connects = 0
+        self.disconnects = {}
+
+    def get_port(self) -> int:
+        """
+        Get the port the server listens on.
+
+        Returns:
+            The TCP port
+        """
+        return self.address[1]
+
+    def _accept_clients(self):
+        """Accept waiting connections and greet them."""
+        while True:
+            try:
+                client, _ = self.listener.accept()
+            except BlockingIOError:
+                return
+            client.setblocking(False)
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.connects += 1
+            self.pending_clients.append(client)
+
+    def _collect_dots(self, red_dots: list):
+        """
+        Assign stream ids to the current red dots.
+
+        Dots are keyed by their serial, which changes when the object is
+        recycled, so spectators see a reused dot destroyed and respawned.
+
+        Args:
+            red_dots: The game's red dots
+
+        Returns:
+            Tuple of (ids, quantized positions) in game order
+        """
+        positions = np.fromiter(
+            (value for red_dot in red_dots for value in (red_dot.position.x, red_dot.position.y)),
+            dtype=np.float64, count=len(red_dots) * 2
+        ).reshape(-1, 2)
+        positions = SpectatorProtocol.quantize(positions, self.quantization)
+
+        object_ids = {}
+        ids = np.empty(len(red_dots), dtype=np.uint32)
+        previous_ids = self.object_ids
+        for index, red_dot in enumerate(red_dots):
+            key = red_dot.serial
+            dot_id = previous_ids.get(key)
+            if dot_id is None:
+                dot_id = self.next_id
+                self.next_id += 1
+            object_ids[key] = dot_id
+            ids[index] = dot_id
+
+        self.object_ids = object_ids
+        return ids, positions
+
+    def _encode_common(self, kind: int, game_loop, body_size: int) -> list:
+        """
+        Encode the header, state and circles.
+
+        Args:
+            kind: Message type
+            game_loop: The GameLoop being streamed
+            body_size: Size of the keyframe or delta body that follows
+
+        Returns:
+            List of byte chunks
+        """
+        quantization = self.quantization
+        white_arrow = game_loop.white_arrow
+        score_tracker = game_loop.score_tracker
+
+        flags = 0
+        arrow_x = arrow_y = rotation = 0
+        if white_arrow is not None:
+            flags |= SpectatorProtocol.FLAG_HAS_ARROW
+            arrow_x, arrow_y = SpectatorProtocol.quantize(
+                (white_arrow.position.x, white_arrow.position.y), quantization
+            ).tolist()
+            rotation = int(round(white_arrow.pic.rotation_angle * 100)) % 36000
+            if rotation > 18000:
+                rotation -= 36000
+        if game_loop.game_over:
+            flags |= SpectatorProtocol.FLAG_GAME_OVER
+        if game_loop.pause_control.is_paused():
+            flags |= SpectatorProtocol.FLAG_PAUSED
+
+        circles = []
+        for green_circle in game_loop.green_circles:
+            x, y, radius = SpectatorProtocol.quantize(
+                (green_circle.position.x, green_circle.position.y, green_circle.get_radius()), quantization
+            ).tolist()
+            circles.append(SpectatorProtocol.CIRCLE.pack(x, y, radius, max(0, min(255, green_circle.pic.alpha))))
+
+        state = SpectatorProtocol.STATE.pack(
+            arrow_x, arrow_y, rotation,
+            min(int(game_loop.bomb_control.get_cooldown_seconds_remaining() * 100), 0xFFFF),
+            score_tracker.get_total_score(), score_tracker.frames_survived // score_tracker.fps,
+            score_tracker.red_dots_destroyed
+        )
+        length = len(state) + len(circles) * SpectatorProtocol.CIRCLE.size + body_size
+        header = SpectatorProtocol.HEADER.pack(length, kind, flags, len(circles), self.tick)
+        return [header, state] + circles
+
+    def _encode_keyframe(self, game_loop, ids: np.ndarray, positions: np.ndarray) -> bytes:
+        """Replace the mirror with the current dots and encode a keyframe."""
+        self.mirror_ids = ids.copy()
+        self.mirror_positions = positions.copy()
+        order = np.argsort(self.mirror_ids, kind='stable')
+        self.mirror_ids = self.mirror_ids[order]
+        self.mirror_positions = self.mirror_positions[order]
+
+        body = [
+            SpectatorProtocol.KEYFRAME.pack(self.world_size[0], self.world_size[1],
+                                            self.quantization, len(ids)),
+            self.mirror_ids.astype('<u4').tobytes(),
+            self.mirror_positions.astype('<u2').tobytes()
+        ]
+        body_size = sum(len(chunk) for chunk in body)
+        return b''.join(self._encode_common(SpectatorProtocol.KIND_KEYFRAME, game_loop, body_size) + body)
+
+    def _encode_delta(self, game_loop, ids: np.ndarray, positions: np.ndarray) -> bytes:
+        """Update the mirror towards the current dots and encode a delta."""
+        current = np.isin(self.mirror_ids, ids)
+        destroyed = self.mirror_ids[~current]
+        self.mirror_ids = self.mirror_ids[current]
+        self.mirror_positions = self.mirror_positions[current]
+
+        spawned = ~np.isin(ids, self.mirror_ids)
+        order = np.argsort(ids[spawned], kind='stable')
+        spawned_ids = ids[spawned][order]
+        spawned_positions = positions[spawned][order]
+
+        # Offsets for the dots whose mirrored position lags the most
+        existing = np.flatnonzero(~spawned)
+        mirror_index = np.searchsorted(self.mirror_ids, ids[existing])
+        error = positions[existing] - self.mirror_positions[mirror_index]
+        magnitude = np.abs(error).max(axis=1)
+        lagging = np.flatnonzero(magnitude > 0)
+        if len(lagging) > self.max_moves_per_tick:
+            lagging = lagging[np.argpartition(magnitude[lagging], -self.max_moves_per_tick)
+                              [-self.max_moves_per_tick:]]
+        offsets = np.clip(error[lagging], -SpectatorProtocol.MAX_OFFSET, SpectatorProtocol.MAX_OFFSET)
+        moved_index = mirror_index[lagging]
+        self.mirror_positions[moved_index] += offsets
+        moved_ids = self.mirror_ids[moved_index]
+
+        self.mirror_ids = np.concatenate([self.mirror_ids, spawned_ids])
+        self.mirror_positions = np.concatenate([self.mirror_positions, spawned_positions])
+
+        body = [
+            SpectatorProtocol.DELTA.pack(len(destroyed), len(spawned_ids), len(moved_ids)),
+            destroyed.astype('<u4').tobytes(),
+            spawned_ids.astype('<u4').tobytes(),
+            spawned_positions.astype('<u2').tobytes(),
+            moved_ids.astype('<u4').tobytes(),
+            offsets.astype('i1').tobytes()
+        ]
+        body_size = sum(len(chunk) for chunk in body)
+        return b''.join(self._encode_common(SpectatorProtocol.KIND_DELTA, game_loop, body_size) + body)
+
+    def publish(self, game_loop):
+        """
+        Send the current state of a game loop to all spectators (call once per tick).
+
+        Args:
+            game_loop: The GameLoop to stream
+        """
+        self._accept_clients()
+        if not self.clients and not self.pending_clients:
+            # Nobody is watching: the next spectator starts from a keyframe anyway
+            self.object_ids = {}
+            return
+
+        self.tick += 1
+        ids, positions = self._collect_dots(game_loop.red_dots)
+        if self.pending_clients or self.ticks_since_keyframe >= self.keyframe_interval:
+            message = self._encode_keyframe(game_loop, ids, positions)
+            self.ticks_since_keyframe = 0
+            hello = SpectatorProtocol.HELLO.pack(SpectatorProtocol.MAGIC, SpectatorProtocol.VERSION)
+            for client in self.pending_clients:
+                self.clients[client] = bytearray(hello)
+            self.pending_clients = []
+        else:
+            message = self._encode_delta(game_loop, ids, positions)
+            self.ticks_since_keyframe += 1
+
+        self.messages_sent += 1
+        self.last_message_size = len(message)
+        for client in list(self.clients):
+            backlog = self.clients[client]
+            backlog += message
+            self._flush(client, backlog)
+
+    def _flush(self, client: socket.socket, backlog: bytearray):
+        """Send as much of a client's backlog as the socket takes without blocking."""
+        try:
+            sent = client.send(backlog)
+        except BlockingIOError:
+            sent = 0
+        except OSError:
+            self._drop(client, "connection lost")
+            return
+        self.bytes_sent += sent
+        del backlog[:sent]
+        if len(backlog) > self.max_backlog_bytes:
+            self._drop(client, "too far behind")
+
+    def _drop(self, client: socket.socket, reason: str):
+        """Disconnect a client."""
+        self.disconnects[reason] = self.disconnects.get(reason, 0) + 1
+        self.clients.pop(client, None)
+        client.close()
+
+    def get_stats(self) -> dict:
+        """
+        Get stream statistics.
+
+        Returns:
+            Dictionary with client count, connects, disconnects by reason,
+            messages and bytes sent and the last message size
+        """
+        return {
+            'clients': len(self.clients),
+            'connects': self.connects,
+            'disconnects': dict(self.disconnects),
+            'messages': self.messages_sent,
+            'bytes_sent': self.bytes_sent,
+            'last_message_size': self.last_message_size
+        }
+
+    def close(self):
+        """Disconnect all spectators and stop listening."""
+        for client in list(self.clients) + self.pending_clients:
+            client.close()
+        self.clients = {}
+        self.pending_clients = []
+        self.listener.close()
@@ -0,0 +1,118 @@
+"""Renders a spectator stream with the game's own pics."""
+import pygame
+from src.general.camera import Camera
+from src.general.position import Position
+from src.media.pics.background_pic import BackgroundPic
+from src.media.pics.red_dot_pic import RedDotPic
+from src.media.pics.red_dot_bulk_pic import RedDotBulkPic
+from src.media.pics.white_arrow_pic import WhiteArrowPic
+from src.media.pics.green_circle_pic import GreenCirclePic
+from src.config.config_loader import config
+
+
+class SpectatorView:
+    """Draws the state decoded by a SpectatorClient, following the white arrow like the game does."""
+
+    def __init__(self, client, screen_width: int = None, screen_height: int = None):
+        """
+        Initialize the view.
+
+        Args:
+            client: A connected SpectatorClient
+            screen_width: Width of the screen (default: from config)
+            screen_height: Height of the screen (default: from config)
+        """
+        if screen_width is None:
+            screen_width = config.get_screen_width()
+        if screen_height is None:
+            screen_height = config.get_screen_height()
+        self.client = client
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.fps = config.get_fps()
+        self.clock = pygame.time.Clock()
+
+        self.background_pic = BackgroundPic()
+        self.red_dot_pic = RedDotPic()
+        self.red_dot_bulk_pic = RedDotBulkPic()
+        self.white_arrow_pic = WhiteArrowPic()
+        self.green_circle_pic = GreenCirclePic()
+        self.camera = None
+        self.cull_margin = self.red_dot_pic.radius + self.red_dot_pic.border_width
+
+        score_cfg = config.get('general', 'scoring', 'score_tracker')
+        self.score_font = pygame.font.Font(None, score_cfg['score_font_size'])
+        self.info_font = pygame.font.Font(None, score_cfg['breakdown_font_size'])
+        self.score_position = (score_cfg['score_position_x'], score_cfg['score_position_y'])
+        self.score_color = tuple(score_cfg['score_color'])
+        self.info_color = tuple(score_cfg['breakdown_color'])
+
+    def draw(self, screen: pygame.Surface):
+        """
+        Draw the latest decoded state.
+
+        Args:
+            screen: The pygame Surface to draw on
+        """
+        client = self.client
+        self.background_pic.draw(screen)
+
+        if client.synced:
+            if self.camera is None or (self.camera.world_width, self.camera.world_height) != client.world_size:
+                self.camera = Camera(self.screen_width, self.screen_height, *client.world_size)
+            if client.arrow is not None:
+                self.camera.follow(Position(client.arrow[0], client.arrow[1]))
+            offset_x, offset_y = self.camera.get_offset()
+
+            if client.arrow is not None:
+                arrow_x, arrow_y, self.white_arrow_pic.rotation_angle = client.arrow
+                self.white_arrow_pic.draw(screen, arrow_x - offset_x, arrow_y - offset_y)
+
+            dots = client.get_dot_positions() - (offset_x, offset_y)
+            margin = self.cull_margin
+            visible = ((dots[:, 0] >= -margin) & (dots[:, 0] < self.screen_width + margin) &
+                       (dots[:, 1] >= -margin) & (dots[:, 1] < self.screen_height + margin))
+            dots = dots[visible]
+            if self.red_dot_bulk_pic.should_use(len(dots)):
+                self.red_dot_bulk_pic.draw(screen, dots)
+            else:
+                for x, y in dots.tolist():
+                    self.red_dot_pic.draw(screen, x, y)
+
+            for x, y, radius, alpha in client.circles:
+                self.green_circle_pic.current_radius = radius
+                self.green_circle_pic.alpha = alpha
+                self.green_circle_pic.draw(screen, x - offset_x, y - offset_y)
+
+        x, y = self.score_position
+        screen.blit(self.score_font.render(f"Score: {client.score}", True, self.score_color), (x, y))
+        status = "SPECTATING"
+        if not client.connected:
+            status = "STREAM ENDED"
+        elif not client.synced:
+            status = "WAITING FOR KEYFRAME"
+        elif client.game_over:
+            status = "GAME OVER"
+        elif client.paused:
+            status = "PAUSED"
+        info = f"{status}  Time: {client.seconds}s  Dots: {client.red_dots_destroyed}  Tick: {client.tick}"
+        screen.blit(self.info_font.render(info, True, self.info_color), (x, y + 35))
+
+    def run(self, screen: pygame.Surface):
+        """
+        Show the stream until the window is closed or ESC is pressed.
+
+        Args:
+            screen: The pygame Surface to draw on
+        """
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    return
+
+            self.client.poll()
+            self.draw(screen)
+            pygame.display.flip()
+            self.clock.tick(self.fps)
@@ -0,0 +1 @@
+"""Per-game telemetry recording and metrics export."""
@@ -0,0 +1,107 @@
+"""Localhost HTTP endpoint serving game metrics in Prometheus text format."""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.config.config_loader import config
+
+
+class MetricsServer:
+    """
+    Serves a TimelineRecorder's aggregate counters at /metrics.
+
+    Requests are answered on a background thread from a copy of the
+    recorder's totals, so scraping never touches the game loop.
+    """
+
+    PREFIX = 'dot_chasing_game_'
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self, recorder, host: str = None, port: int = None):
+        """
+        Initialize the server and start serving.
+
+        Args:
+            recorder: The TimelineRecorder whose totals are exported
+            host: Interface to listen on (default: from config)
+            port: TCP port, 0 for any free port (default: from config)
+        """
+        cfg = config.get('general', 'telemetry', 'metrics_server')
+        self.recorder = recorder
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Answers GET /metrics."""
+
+            def do_GET(self):
+                """Send the metrics page, or 404 for any other path."""
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = server.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', MetricsServer.CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                """Keep scrapes out of the console."""
+
+        self.http_server = ThreadingHTTPServer(
+            (host if host is not None else cfg['host'], port if port is not None else cfg['port']), Handler
+        )
+        self.http_server.daemon_threads = True
+        self.address = self.http_server.server_address
+        self.thread = threading.Thread(target=self.http_server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def get_port(self) -> int:
+        """
+        Get the port the server listens on.
+
+        Returns:
+            The TCP port
+        """
+        return self.address[1]
+
+    def render(self) -> str:
+        """
+        Format the recorder's totals in the Prometheus text exposition format.
+
+        Returns:
+            The metrics page
+        """
+        totals = self.recorder.get_totals()
+        prefix = self.PREFIX
+        lines = []
+
+        def metric(name: str, kind: str, description: str, value):
+            lines.append(f"# HELP {prefix}{name} {description}")
+            lines.append(f"# TYPE {prefix}{name} {kind}")
+            lines.append(f"{prefix}{name} {value}")
+
+        metric('games_total', 'counter', "Finished games.", totals['games'])
+        metric('ticks_total', 'counter', "Simulation ticks of finished games.", totals['ticks'])
+        metric('red_dots_destroyed_total', 'counter', "Red dots destroyed in finished games.",
+               totals['red_dots_destroyed'])
+        metric('bombs_total', 'counter', "Bombs fired in finished games.", totals['bombs'])
+        metric('score_total', 'counter', "Sum of the final scores of finished games.", totals['score'])
+        metric('recording_ticks', 'gauge', "Ticks recorded so far in the current game.", totals['recording_ticks'])
+
+        name = f"{prefix}frame_time_milliseconds"
+        lines.append(f"# HELP {name} Frame work time of finished games.")
+        lines.append(f"# TYPE {name} histogram")
+        cumulative = 0
+        for bound, count in zip(totals['frame_time_buckets_ms'], totals['frame_time_bucket_counts']):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+        cumulative += totals['frame_time_bucket_counts'][-1]
+        lines.append(f'{name}_bucket{{le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum {totals['frame_time_ms_sum']}")
+        lines.append(f"{name}_count {cumulative}")
+        return '\n'.join(lines) + '\n'
+
+    def close(self):
+        """Stop serving."""
+        self.http_server.shutdown()
+        self.http_server.server_close()
+        self.thread.join()
@@ -0,0 +1,203 @@
+"""Per-tick game timeline recorder with columnar file output."""
+import json
+import os
+import queue
+import threading
+import time
+import numpy as np
+from src.config.config_loader import config
+
+
+class TimelineRecorder:
+    """
+    Records how each game unfolds, one row per simulation tick.
+
+    Rows go into preallocated NumPy columns (doubled in size if a game
+    outlasts them), so recording a tick is a few scalar stores. When a
+    game ends, its columns are trimmed, added to the aggregate counters
+    and handed to a background writer thread, which saves them as one
+    .npz file per game: one array per column plus a JSON metadata entry.
+    The file can be read back with TimelineRecorder.load().
+    """
+
+    # Column name -> dtype
+    COLUMNS = {
+        'red_dots': np.uint32,
+        'green_circles': np.uint16,
+        'score': np.uint32,
+        'bomb_fired': np.uint8,
+        'frame_ms': np.float32
+    }
+
+    def __init__(self, directory: str = None, save: bool = True):
+        """
+        Initialize the recorder and start the writer thread.
+
+        Args:
+            directory: Directory for the timeline files (default: from config)
+            save: Whether finished games are written to files (False keeps only the aggregates)
+        """
+        cfg = config.get('general', 'telemetry', 'timeline_recorder')
+        if directory is None:
+            directory = cfg['directory']
+        self.directory = os.path.expanduser(directory)
+        self.save = save
+        self.frame_time_buckets_ms = tuple(cfg['frame_time_buckets_ms'])
+        self.config_hash = config.get_hash()
+
+        self.capacity = cfg['initial_ticks']
+        self.columns = {name: np.zeros(self.capacity, dtype=dtype) for name, dtype in self.COLUMNS.items()}
+        self.ticks = 0
+        self.recording = False
+        self.game_started_at = 0.0
+
+        # Aggregates over all finished games, read by the metrics server
+        self.totals_lock = threading.Lock()
+        self.totals = {
+            'games': 0,
+            'ticks': 0,
+            'red_dots_destroyed': 0,
+            'bombs': 0,
+            'score': 0,
+            'frame_time_bucket_counts': [0] * (len(self.frame_time_buckets_ms) + 1),
+            'frame_time_ms_sum': 0.0
+        }
+        self.files_written = 0
+
+        self.write_queue = queue.Queue()
+        self.writer_thread = None
+        if save:
+            os.makedirs(self.directory, exist_ok=True)
+            self.writer_thread = threading.Thread(target=self._write_games, daemon=True)
+            self.writer_thread.start()
+
+    def begin_game(self):
+        """Start recording a new game (a game still being recorded is finished first)."""
+        self.finish_game()
+        self.ticks = 0
+        self.recording = True
+        self.game_started_at = time.time()
+
+    def record(self, red_dots: int, green_circles: int, score: int, bomb_fired: bool, frame_seconds: float):
+        """
+        Record one simulation tick.
+
+        Args:
+            red_dots: Number of red dots
+            green_circles: Number of green circles
+            score: Total score
+            bomb_fired: Whether a bomb went off this tick
+            frame_seconds: Work time of the latest rendered frame
+        """
+        if not self.recording:
+            return
+        tick = self.ticks
+        if tick == self.capacity:
+            self._grow()
+        columns = self.columns
+        columns['red_dots'][tick] = red_dots
+        columns['green_circles'][tick] = green_circles
+        columns['score'][tick] = score
+        columns['bomb_fired'][tick] = bomb_fired
+        columns['frame_ms'][tick] = frame_seconds * 1000
+        self.ticks = tick + 1
+
+    def _grow(self):
+        """Double the column capacity, keeping the recorded rows."""
+        self.capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.zeros(self.capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            self.columns[name] = grown
+
+    def finish_game(self, score_breakdown: dict = None):
+        """
+        Stop recording the current game, update the aggregates and queue its file.
+
+        Args:
+            score_breakdown: Final ScoreTracker.get_score_breakdown(), stored as metadata
+        """
+        if not self.recording:
+            return
+        self.recording = False
+        ticks = self.ticks
+        if ticks == 0:
+            return
+        timeline = {name: column[:ticks].copy() for name, column in self.columns.items()}
+
+        frame_ms = timeline['frame_ms']
+        bucket_counts = np.bincount(np.searchsorted(self.frame_time_buckets_ms, frame_ms),
+                                    minlength=len(self.frame_time_buckets_ms) + 1)
+        with self.totals_lock:
+            totals = self.totals
+            totals['games'] += 1
+            totals['ticks'] += ticks
+            if score_breakdown is not None:
+                totals['red_dots_destroyed'] += score_breakdown['red_dots']
+            totals['bombs'] += int(timeline['bomb_fired'].sum())
+            totals['score'] += int(timeline['score'][-1])
+            totals['frame_time_bucket_counts'] = [
+                count + int(added) for count, added in zip(totals['frame_time_bucket_counts'], bucket_counts)
+            ]
+            totals['frame_time_ms_sum'] += float(frame_ms.sum(dtype=np.float64))
+
+        if self.save:
+            metadata = {
+                'started_at': self.game_started_at,
+                'finished_at': time.time(),
+                'ticks': ticks,
+                'fps': config.get_fps(),
+                'config_hash': self.config_hash,
+                'score_breakdown': score_breakdown
+            }
+            self.write_queue.put((timeline, metadata))
+
+    def _write_games(self):
+        """Writer thread: save queued games until close() is called."""
+        while True:
+            item = self.write_queue.get()
+            if item is None:
+                return
+            timeline, metadata = item
+            name = time.strftime('game-%Y%m%d-%H%M%S', time.localtime(metadata['started_at']))
+            path = os.path.join(self.directory, f"{name}-{self.files_written:04d}.npz")
+            np.savez_compressed(path, metadata=np.array(json.dumps(metadata)), **timeline)
+            self.files_written += 1
+
+    @staticmethod
+    def load(path: str) -> tuple:
+        """
+        Read a timeline file.
+
+        Args:
+            path: Path of a file written by the recorder
+
+        Returns:
+            Tuple of (dictionary of column arrays, metadata dictionary)
+        """
+        with np.load(path) as data:
+            metadata = json.loads(str(data['metadata']))
+            columns = {name: data[name] for name in data.files if name != 'metadata'}
+        return columns, metadata
+
+    def get_totals(self) -> dict:
+        """
+        Get the aggregates over all finished games.
+
+        Returns:
+            Copy of the totals dictionary, including the frame time bucket bounds
+        """
+        with self.totals_lock:
+            totals = dict(self.totals)
+            totals['frame_time_bucket_counts'] = list(totals['frame_time_bucket_counts'])
+        totals['frame_time_buckets_ms'] = self.frame_time_buckets_ms
+        totals['recording_ticks'] = self.ticks if self.recording else 0
+        return totals
+
+    def close(self):
+        """Finish the current game and wait for all queued files to be written."""
+        self.finish_game()
+        if self.writer_thread is not None:
+            self.write_queue.put(None)
+            self.writer_thread.join()
+            self.writer_thread = None
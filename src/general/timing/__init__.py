@@ -0,0 +1 @@
+"""Tick-based scheduling of timers and periodic emitters."""
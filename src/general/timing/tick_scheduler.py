@@ -0,0 +1,226 @@
+"""Hashed timer wheel that fires callbacks at scheduled game ticks."""
+import math
+from src.config.config_loader import config
+
+
+class Timer:
+    """A callback scheduled on a TickScheduler (returned by schedule())."""
+
+    __slots__ = ('due', 'callback', 'args', 'active')
+
+    def __init__(self, due: int, callback, args: tuple):
+        """
+        Initialize a timer.
+
+        Args:
+            due: Tick at which the callback fires
+            callback: Function to call
+            args: Positional arguments for the callback
+        """
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+
+class TickScheduler:
+    """
+    Central clock for everything that happens a number of ticks from now.
+
+    Timers live in a ring of slots indexed by their due tick modulo the
+    number of slots. advance() moves to the next tick and only looks at
+    that tick's slot, so a tick costs O(timers due) rather than O(timers
+    alive); a timer further away than one turn of the ring simply stays in
+    its slot until its turn comes round. Counters that only need to know
+    how long ago something happened (cooldowns, time survived) read tick
+    instead of being decremented every frame.
+    """
+
+    def __init__(self, slots: int = None):
+        """
+        Initialize the scheduler at tick 0.
+
+        Args:
+            slots: Number of slots in the wheel, rounded up to a power of two (default: from config)
+        """
+        if slots is None:
+            slots = config.get('general', 'timing', 'tick_scheduler', 'slots')
+        slots = 1 << max(0, int(slots) - 1).bit_length()
+        self.mask = slots - 1
+        self.slots = [[] for _ in range(slots)]
+        self.tick = 0
+        self.pending = 0
+        self.fired = 0
+
+    def schedule(self, delay: int, callback, *args) -> Timer:
+        """
+        Call a function a number of ticks from now.
+
+        Args:
+            delay: Ticks from now (at least 1; the callback fires during that tick's advance())
+            callback: Function to call
+            *args: Positional arguments for the callback
+
+        Returns:
+            The Timer, which can be passed to cancel()
+        """
+        due = self.tick + max(1, int(delay))
+        timer = Timer(due, callback, args)
+        self.slots[due & self.mask].append(timer)
+        self.pending += 1
+        return timer
+
+    def cancel(self, timer: Timer):
+        """
+        Stop a timer from firing (it is dropped when its slot comes round).
+
+        Args:
+            timer: A timer returned by schedule()
+        """
+        if timer.active:
+            timer.active = False
+            self.pending -= 1
+
+    def advance(self):
+        """Move to the next tick and fire the timers due at it, in the order they were scheduled."""
+        self.tick += 1
+        index = self.tick & self.mask
+        slot = self.slots[index]
+        if not slot:
+            return
+        # Timers scheduled by the callbacks go into a fresh list
+        self.slots[index] = []
+        tick = self.tick
+        for timer in slot:
+            if not timer.active:
+                continue
+            if timer.due != tick:
+                # Due on a later turn of the wheel
+                self.slots[index].append(timer)
+                continue
+            timer.active = False
+            self.pending -= 1
+            self.fired += 1
+            timer.callback(*timer.args)
+
+    def clear(self, tick: int = 0):
+        """
+        Drop all timers and set the clock.
+
+        Args:
+            tick: The tick to continue from
+        """
+        for slot in self.slots:
+            for timer in slot:
+                timer.active = False
+            slot.clear()
+        self.tick = tick
+        self.pending = 0
+
+    def __len__(self) -> int:
+        """Number of timers waiting to fire."""
+        return self.pending
+
+
+class RateEmitter:
+    """
+    Calls a function at a steady rate on a TickScheduler.
+
+    The rate does not have to divide the tick rate: emission n is due at
+    the first tick at or after n ticks-per-emission from the start, so the
+    fractional part of the interval is carried forward instead of being
+    rounded away (7 per second at 60 ticks per second alternates 8 and 9
+    tick gaps). Rates above the tick rate emit several times per tick.
+    """
+
+    def __init__(self, scheduler: TickScheduler, per_second: float, fps: int, callback):
+        """
+        Initialize the emitter (call start() to begin emitting).
+
+        Args:
+            scheduler: The scheduler that drives the emitter
+            per_second: Emissions per second (0 or less emits nothing)
+            fps: Ticks per second
+            callback: Function called once per emission, without arguments
+        """
+        self.scheduler = scheduler
+        self.fps = fps
+        self.callback = callback
+        self.per_second = per_second
+        self.interval = fps / per_second if per_second > 0 else math.inf
+        self.start_tick = 0.0
+        self.emitted = 0
+        self.timer = None
+
+    def _due_tick(self, emission: int) -> int:
+        """Tick at which an emission is due (the small epsilon absorbs float error in whole intervals)."""
+        return math.ceil(self.start_tick + emission * self.interval - 1e-9)
+
+    def start(self, ticks_since_emission: float = 0):
+        """
+        Start emitting, the first emission one interval after the last one.
+
+        Args:
+            ticks_since_emission: Ticks that have already passed since the previous emission
+        """
+        self.stop()
+        self.start_tick = self.scheduler.tick - ticks_since_emission
+        self.emitted = 0
+        self._schedule_next()
+
+    def resume(self, start_tick: float, emitted: int):
+        """
+        Continue an emission schedule exactly where another emitter left it (for snapshots).
+
+        Args:
+            start_tick: The other emitter's start_tick
+            emitted: The other emitter's emitted count
+        """
+        self.stop()
+        self.start_tick = start_tick
+        self.emitted = emitted
+        self._schedule_next()
+
+    def stop(self):
+        """Stop emitting."""
+        if self.timer is not None:
+            self.scheduler.cancel(self.timer)
+            self.timer = None
+
+    def set_rate(self, per_second: float):
+        """
+        Change the rate, counting the next interval from the last emission.
+
+        Args:
+            per_second: Emissions per second (0 or less stops the emitter)
+        """
+        ticks_since_emission = self.get_ticks_since_emission()
+        self.per_second = per_second
+        self.interval = self.fps / per_second if per_second > 0 else math.inf
+        self.start(ticks_since_emission)
+
+    def get_ticks_since_emission(self) -> float:
+        """
+        Get the time since the last emission (or since start() if there was none).
+
+        Returns:
+            Ticks since the last emission, including the carried fraction
+        """
+        if self.emitted == 0 or math.isinf(self.interval):
+            return self.scheduler.tick - self.start_tick
+        return self.scheduler.tick - (self.start_tick + self.emitted * self.interval)
+
+    def _schedule_next(self):
+        """Schedule the timer for the next emission."""
+        if math.isinf(self.interval):
+            return
+        self.timer = self.scheduler.schedule(self._due_tick(self.emitted + 1) - self.scheduler.tick, self._emit)
+
+    def _emit(self):
+        """Timer callback: emit everything due by now, then schedule the next emission."""
+        self.timer = None
+        tick = self.scheduler.tick
+        while self._due_tick(self.emitted + 1) <= tick:
+            self.emitted += 1
+            self.callback()
+        self._schedule_next()
@@ -0,0 +1,36 @@
+"""Background warm-up of game modules after the first menu frame."""
+import importlib
+import threading
+
+
+class BackgroundWarmup:
+    """Imports modules the game needs later on a background thread."""
+    
+    # Everything reachable from the game loop is imported through it
+    DEFAULT_MODULES = ('src.general.game_loop',)
+    
+    def __init__(self, modules: tuple = None):
+        """
+        Initialize the warm-up.
+        
+        Args:
+            modules: Dotted module names to import (default: DEFAULT_MODULES)
+        """
+        self.modules = modules if modules is not None else self.DEFAULT_MODULES
+        self.thread = None
+    
+    def start(self):
+        """Start importing in the background (safe to call more than once)."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._import_modules, daemon=True)
+            self.thread.start()
+    
+    def _import_modules(self):
+        """Warm-up thread: import every module in turn."""
+        for module in self.modules:
+            importlib.import_module(module)
+    
+    def wait(self):
+        """Block until the warm-up has finished (returns at once if it never started)."""
+        if self.thread is not None:
+            self.thread.join()
@@ -1,10 +1,18 @@
 """Collision detection between green circles and red dots."""
+import numpy as np
 from src.general.items.red_dot import RedDot
 from src.general.items.green_circle import GreenCircle
+from src.logic.kernels.kernel_backend import kernel_backend
 
 
 class GreenCircleCollideRedDot:
-    """Detects collisions between green circles and red dots."""
+    """
+    Detects collisions between green circles and red dots.
+    
+    All dots are tested against all circles in one points_in_circles call
+    on the selected kernel backend; with a spatial grid, only the dots in
+    the circles' bounding boxes are passed to it.
+    """
     
     def __init__(self):
         """Initialize the collision detector."""
@@ -24,23 +32,33 @@ class GreenCircleCollideRedDot:
         distance = green_circle.position.distance_to(red_dot.position)
         return distance < green_circle.get_radius()
     
-    def check_all_collisions(self, green_circles: list, red_dots: list) -> list:
+    def check_all_collisions(self, green_circles: list, red_dots: list, spatial_grid=None) -> list:
         """
         Check collisions between all green circles and red dots.
         
         Args:
             green_circles: List of green circles
             red_dots: List of red dots
+            spatial_grid: SpatialGrid indexing red_dots; when given only dots near each circle are checked
             
         Returns:
             List of red dots that should be destroyed
         """
-        red_dots_to_destroy = []
+        if not green_circles or not red_dots:
+            return []
+        centers = np.array([(green_circle.position.x, green_circle.position.y) for green_circle in green_circles],
+                           dtype=np.float64)
+        radii = np.array([green_circle.get_radius() for green_circle in green_circles], dtype=np.float64)
         
-        for green_circle in green_circles:
-            for red_dot in red_dots:
-                if red_dot not in red_dots_to_destroy:
-                    if self.check_collision(green_circle, red_dot):
-                        red_dots_to_destroy.append(red_dot)
+        if spatial_grid is not None:
+            candidates = np.unique(np.concatenate([
+                spatial_grid.query_rect(x - radius, y - radius, x + radius, y + radius)
+                for (x, y), radius in zip(centers.tolist(), radii.tolist())
+            ]))
+            points = spatial_grid.positions[candidates]
+        else:
+            candidates = np.arange(len(red_dots))
+            points = np.array([(red_dot.position.x, red_dot.position.y) for red_dot in red_dots], dtype=np.float64)
         
-        return red_dots_to_destroy
+        hit = candidates[kernel_backend.kernels.points_in_circles(points, centers, radii)]
+        return [red_dots[index] for index in hit.tolist()]
@@ -1,11 +1,26 @@
 """Collision detection between red dots and white arrow."""
+import numpy as np
 from src.general.items.red_dot import RedDot
 from src.general.items.white_arrow import WhiteArrow
+from src.logic.kernels.kernel_backend import kernel_backend
 from src.config.config_loader import config
 
 
 class RedDotCollideWhiteArrow:
-    """Detects collisions between red dots and the white arrow."""
+    """
+    Detects collisions between red dots and the white arrow.
+    
+    Dots are circles and the arrow is the rotated polygon its pic draws.
+    The check has two phases: a broad phase keeps only the dots whose
+    centers are closer than the dot radius plus the arrow's bounding
+    radius (a squared distance test, or a spatial grid circle query), and
+    only those few candidates get the exact polygon-versus-circle test.
+    The first scalar_candidates candidates are tested one at a time,
+    stopping at the first hit, which in a swarm usually comes early; only
+    if none of them hits do the rest go through one circles_hit_polygon
+    call on the selected kernel backend, whose array setup only pays off
+    for larger batches.
+    """
     
     def __init__(self, red_dot_radius: float = None):
         """
@@ -18,6 +33,12 @@ class RedDotCollideWhiteArrow:
             # Read radius from red_dot_pic config to avoid duplication
             red_dot_radius = config.get('media', 'pics', 'red_dot_pic', 'radius')
         self.red_dot_radius = red_dot_radius
+        self.scalar_candidates = config.get('logic', 'collision', 'red_dot_collide_white_arrow',
+                                            'scalar_candidates')
+        
+        # The arrow's outline as an array for the kernel, rebuilt only when the pic rotates
+        self.outline = None
+        self.outline_array = None
     
     def check_collision(self, red_dot: RedDot, white_arrow: WhiteArrow) -> bool:
         """
@@ -30,16 +51,79 @@ class RedDotCollideWhiteArrow:
         Returns:
             True if collision detected, False otherwise
         """
-        distance = red_dot.position.distance_to(white_arrow.position)
-        return distance < self.red_dot_radius
+        pic = white_arrow.pic
+        dx = red_dot.position.x - white_arrow.position.x
+        dy = red_dot.position.y - white_arrow.position.y
+        reach = self.red_dot_radius + pic.bounding_radius
+        if dx * dx + dy * dy >= reach * reach:
+            return False
+        return self.circle_hits_outline(dx, dy, pic.get_outline())
+    
+    def circle_hits_outline(self, dx: float, dy: float, outline: tuple) -> bool:
+        """
+        Exactly test a red dot against the arrow's polygon.
+        
+        The dot hits if its center is inside the polygon (even-odd rule, so
+        the concave arrow shape is handled) or closer than the dot radius
+        to one of the polygon's edges. A negative radius never hits.
+        
+        Args:
+            dx: Dot center x relative to the arrow's center
+            dy: Dot center y relative to the arrow's center
+            outline: The arrow's rotated points relative to its center
+            
+        Returns:
+            True if the dot overlaps the arrow
+        """
+        radius = self.red_dot_radius
+        if radius < 0:
+            return False
+        radius_squared = radius * radius
+        inside = False
+        start_x, start_y = outline[-1]
+        for end_x, end_y in outline:
+            edge_x = end_x - start_x
+            edge_y = end_y - start_y
+            # Crossing of a ray from the center towards +x
+            if (end_y > dy) != (start_y > dy) and dx < start_x + (dy - start_y) * edge_x / edge_y:
+                inside = not inside
+            # Squared distance from the center to the closest point of the edge
+            t = ((dx - start_x) * edge_x + (dy - start_y) * edge_y) / (edge_x * edge_x + edge_y * edge_y)
+            t = min(max(t, 0.0), 1.0)
+            offset_x = start_x + t * edge_x - dx
+            offset_y = start_y + t * edge_y - dy
+            if offset_x * offset_x + offset_y * offset_y < radius_squared:
+                return True
+            start_x, start_y = end_x, end_y
+        return inside
     
-    def check_all_collisions(self, red_dots: list, white_arrow: WhiteArrow) -> bool:
+    def get_outline_array(self, white_arrow: WhiteArrow) -> np.ndarray:
+        """
+        Get the arrow's rotated outline as an array for the kernel backend.
+        
+        The pic returns the same outline tuple until it rotates, so the
+        array is only rebuilt when that tuple changes.
+        
+        Args:
+            white_arrow: The white arrow
+            
+        Returns:
+            (k, 2) float array of the outline points relative to the arrow's center
+        """
+        outline = white_arrow.pic.get_outline()
+        if outline is not self.outline:
+            self.outline = outline
+            self.outline_array = np.array(outline, dtype=np.float64)
+        return self.outline_array
+    
+    def check_all_collisions(self, red_dots: list, white_arrow: WhiteArrow, spatial_grid=None) -> bool:
         """
         Check if any red dot collides with the white arrow.
         
         Args:
             red_dots: List of red dots to check
             white_arrow: The white arrow to check
+            spatial_grid: SpatialGrid indexing red_dots; when given only nearby dots are checked
             
         Returns:
             True if any collision detected, False otherwise
@@ -47,6 +131,26 @@ class RedDotCollideWhiteArrow:
         if white_arrow is None:
             return False
         
+        if spatial_grid is not None:
+            position = white_arrow.position
+            reach = self.red_dot_radius + white_arrow.pic.bounding_radius
+            candidates = spatial_grid.query_circle(position.x, position.y, reach)
+            if len(candidates) == 0:
+                return False
+            outline = white_arrow.pic.get_outline()
+            first = candidates[:self.scalar_candidates]
+            for dx, dy in (spatial_grid.positions.take(first, axis=0) - (position.x, position.y)).tolist():
+                if self.circle_hits_outline(dx, dy, outline):
+                    return True
+            rest = candidates[self.scalar_candidates:]
+            if len(rest) == 0:
+                return False
+            offsets = spatial_grid.positions.take(rest, axis=0)
+            offsets -= (position.x, position.y)
+            hits = kernel_backend.kernels.circles_hit_polygon(offsets, self.red_dot_radius,
+                                                              self.get_outline_array(white_arrow))
+            return bool(hits.any())
+        
         for red_dot in red_dots:
             if self.check_collision(red_dot, white_arrow):
                 return True
@@ -0,0 +1,113 @@
+"""Uniform grid index for fast area queries over many items."""
+import numpy as np
+from src.config.config_loader import config
+
+
+class SpatialGrid:
+    """
+    Buckets item positions into square cells covering the game world.
+
+    rebuild() sorts the items by cell with NumPy, so every cell's items
+    are a contiguous run of one index array. A rectangle query then only
+    has to slice one run of cells per grid row and check the few
+    candidates exactly, instead of scanning every item. Positions outside
+    the world are clamped into the border cells.
+    """
+
+    EMPTY = np.empty(0, dtype=np.intp)
+
+    def __init__(self, world_width: float, world_height: float, cell_size: float = None):
+        """
+        Initialize the grid.
+
+        Args:
+            world_width: Width of the game world
+            world_height: Height of the game world
+            cell_size: Side length of a cell (default: from config)
+        """
+        if cell_size is None:
+            cell_size = config.get('logic', 'collision', 'spatial_grid', 'cell_size')
+        self.cell_size = cell_size
+        self.columns = max(1, int(np.ceil(world_width / cell_size)))
+        self.rows = max(1, int(np.ceil(world_height / cell_size)))
+
+        self.positions = np.empty((0, 2), dtype=np.float64)
+        self.order = self.EMPTY
+        self.cell_starts = np.zeros(self.columns * self.rows + 1, dtype=np.intp)
+
+    def rebuild(self, positions: np.ndarray):
+        """
+        Index a new set of positions, replacing the previous ones.
+
+        Args:
+            positions: (n, 2) array of item centers; query results index into it
+        """
+        self.positions = positions
+        cells = self._cell_x(positions[:, 0]) + self._cell_y(positions[:, 1]) * self.columns
+        self.order = np.argsort(cells, kind='stable')
+        self.cell_starts = np.searchsorted(cells[self.order], np.arange(self.columns * self.rows + 1))
+
+    def _cell_x(self, x):
+        """Column of x coordinates, clamped to the grid."""
+        return np.clip(np.floor_divide(x, self.cell_size), 0, self.columns - 1).astype(np.intp)
+
+    def _cell_y(self, y):
+        """Row of y coordinates, clamped to the grid."""
+        return np.clip(np.floor_divide(y, self.cell_size), 0, self.rows - 1).astype(np.intp)
+
+    def __len__(self) -> int:
+        """Number of indexed positions."""
+        return len(self.positions)
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> np.ndarray:
+        """
+        Find the items whose centers lie inside a rectangle.
+
+        Args:
+            left: Minimum x (inclusive)
+            top: Minimum y (inclusive)
+            right: Maximum x (exclusive)
+            bottom: Maximum y (exclusive)
+
+        Returns:
+            Sorted array of item indices
+        """
+        if len(self.positions) == 0 or right <= left or bottom <= top:
+            return self.EMPTY
+        column_start, column_end = int(self._cell_x(left)), int(self._cell_x(right))
+        row_start, row_end = int(self._cell_y(top)), int(self._cell_y(bottom))
+
+        # Cells are numbered row by row, so each row of the query is one slice
+        runs = []
+        for row in range(row_start, row_end + 1):
+            first = self.cell_starts[row * self.columns + column_start]
+            last = self.cell_starts[row * self.columns + column_end + 1]
+            if last > first:
+                runs.append(self.order[first:last])
+        if not runs:
+            return self.EMPTY
+        candidates = np.concatenate(runs)
+
+        x = self.positions[candidates, 0]
+        y = self.positions[candidates, 1]
+        inside = (x >= left) & (x < right) & (y >= top) & (y < bottom)
+        return np.sort(candidates[inside])
+
+    def query_circle(self, x: float, y: float, radius: float) -> np.ndarray:
+        """
+        Find the items whose centers lie strictly within a distance of a point.
+
+        Args:
+            x: Circle center x
+            y: Circle center y
+            radius: Circle radius
+
+        Returns:
+            Sorted array of item indices
+        """
+        if radius <= 0:
+            return self.EMPTY
+        candidates = self.query_rect(x - radius, y - radius, x + radius, y + radius)
+        dx = self.positions[candidates, 0] - x
+        dy = self.positions[candidates, 1] - y
+        return candidates[dx * dx + dy * dy < radius * radius]
@@ -1,17 +1,23 @@
 """Bomb control for spawning green circles."""
 import pygame
 from src.config.config_loader import config
+from src.general.timing.tick_scheduler import TickScheduler
 
 
 class BombControl:
     """Handles bomb activation with SPACE key and cooldown."""
     
-    def __init__(self, fps: int = None):
+    # Keys whose events this control handles (see InputDispatcher)
+    KEYS = (pygame.K_SPACE,)
+    
+    def __init__(self, fps: int = None, scheduler: TickScheduler = None):
         """
         Initialize the bomb control.
         
         Args:
             fps: Frames per second for cooldown calculation (default: from config)
+            scheduler: The game's tick clock; the cooldown runs while it advances (default: a clock
+                advanced by update())
         """
         if fps is None:
             fps = config.get_fps()
@@ -20,15 +26,26 @@ class BombControl:
         self.cooldown_seconds = cfg['cooldown_seconds']
         self.cooldown_frames = round(self.cooldown_seconds * fps)
         self.fps = fps
+        self.owns_scheduler = scheduler is None
+        self.scheduler = scheduler if scheduler is not None else TickScheduler()
         
         self.bomb_activated = False
         self.space_key_pressed = False
-        self.cooldown_remaining = 0  # Frames remaining until next bomb available
+        self.ready_tick = 0  # Tick at which the next bomb becomes available
+    
+    @property
+    def cooldown_remaining(self) -> int:
+        """Frames remaining until next bomb available."""
+        return max(0, self.ready_tick - self.scheduler.tick)
+    
+    @cooldown_remaining.setter
+    def cooldown_remaining(self, frames: int):
+        self.ready_tick = self.scheduler.tick + frames
     
     def update(self):
-        """Update cooldown state (call every frame)."""
-        if self.cooldown_remaining > 0:
-            self.cooldown_remaining -= 1
+        """Advance the cooldown by a frame (only needed when the control has its own clock)."""
+        if self.owns_scheduler:
+            self.scheduler.advance()
     
     def handle_event(self, event: pygame.event.Event):
         """
@@ -39,15 +56,25 @@ class BombControl:
         """
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE and not self.space_key_pressed:
-                # Only activate if cooldown is finished
-                if self.cooldown_remaining <= 0:
-                    self.bomb_activated = True
-                    self.cooldown_remaining = self.cooldown_frames
+                self.activate()
                 self.space_key_pressed = True
         elif event.type == pygame.KEYUP:
             if event.key == pygame.K_SPACE:
                 self.space_key_pressed = False
     
+    def activate(self) -> bool:
+        """
+        Activate the bomb if the cooldown is finished (what pressing SPACE does).
+        
+        Returns:
+            True if the bomb was activated, False if it is still cooling down
+        """
+        if self.cooldown_remaining > 0:
+            return False
+        self.bomb_activated = True
+        self.cooldown_remaining = self.cooldown_frames
+        return True
+    
     def should_activate_bomb(self) -> bool:
         """
         Check if bomb should be activated.
@@ -0,0 +1,159 @@
+"""Automated player that steers the white arrow away from crowds of red dots."""
+import time
+import numpy as np
+from src.config.config_loader import config
+
+
+class DensityBot:
+    """
+    Plays the game in place of the mouse, for automated playtesting.
+
+    Each decision bins all red dots into a coarse threat grid with one
+    np.bincount, blurs it into a potential field and adds a fixed
+    repulsion from the world edges (so the arrow is not chased into a
+    corner). The arrow then steers down the field: the potential is
+    sampled at a ring of points lookahead pixels away and the lowest one
+    becomes the target, which follows the gradient at the scale of the
+    lookahead and, unlike the local gradient, does not flip back and forth
+    in a local minimum. A small bonus for keeping the previous heading
+    stops the arrow from dithering between two equally good directions.
+    Among obstacles, directions whose ray to the ring crosses a blocked
+    cell are skipped, so the arrow is not pinned against a wall.
+    The bomb is fired when the number of dots within bomb range of the
+    arrow reaches bomb_threshold.
+
+    Apart from the histogram, every step works on the grid, so the cost of
+    a decision depends on the grid size rather than the number of dots.
+    """
+
+    def __init__(self, world_width: float, world_height: float, cell_size: float = None):
+        """
+        Initialize the bot.
+
+        Args:
+            world_width: Width of the game world
+            world_height: Height of the game world
+            cell_size: Side length of a threat grid cell (default: from config)
+        """
+        cfg = config.get('logic', 'control', 'density_bot')
+        if cell_size is None:
+            cell_size = cfg['cell_size']
+        self.cell_size = cell_size
+        self.world_width = world_width
+        self.world_height = world_height
+        self.columns = max(2, int(np.ceil(world_width / cell_size)))
+        self.rows = max(2, int(np.ceil(world_height / cell_size)))
+        self.smoothing_passes = cfg['smoothing_passes']
+        self.heading_inertia = cfg['heading_inertia']
+        self.bomb_threshold = cfg['bomb_threshold']
+        # Cells on each side of the arrow's cell that count towards the bomb threshold
+        self.bomb_reach = int(cfg['bomb_radius'] // cell_size)
+
+        # Unit directions of the lookahead ring and their offsets in pixels
+        angles = np.arange(cfg['directions']) * (2 * np.pi / cfg['directions'])
+        self.directions = np.column_stack([np.cos(angles), np.sin(angles)])
+        self.ring = self.directions * cfg['lookahead']
+
+        # Edge repulsion: inverse distance (in cells) from each cell center to the nearest edge
+        column_distance = np.minimum(np.arange(self.columns) + 0.5, self.columns - np.arange(self.columns) - 0.5)
+        row_distance = np.minimum(np.arange(self.rows) + 0.5, self.rows - np.arange(self.rows) - 0.5)
+        self.wall_potential = cfg['wall_weight'] / np.minimum.outer(row_distance, column_distance)
+
+        # Grids from the latest decision, kept for inspection
+        self.density = np.zeros((self.rows, self.columns), dtype=np.intp)
+        self.potential = self.wall_potential.copy()
+        self.heading = np.zeros(2)
+
+        self.decisions = 0
+        self.bombs = 0
+        self.decision_seconds = 0.0
+
+    def reset(self):
+        """Forget the previous heading (call when a new game starts)."""
+        self.heading = np.zeros(2)
+
+    def _blur(self, grid: np.ndarray) -> np.ndarray:
+        """Smooth a grid with a separable [1, 2, 1] kernel, repeated smoothing_passes times."""
+        for _ in range(self.smoothing_passes):
+            padded = np.pad(grid, 1, mode='edge')
+            horizontal = padded[:, :-2] + 2 * padded[:, 1:-1] + padded[:, 2:]
+            grid = (horizontal[:-2] + 2 * horizontal[1:-1] + horizontal[2:]) / 16
+        return grid
+
+    def _sample(self, points: np.ndarray) -> np.ndarray:
+        """Bilinearly sample the potential at world points (cell centers sit at half cells)."""
+        x = np.clip(points[:, 0] / self.cell_size - 0.5, 0, self.columns - 1)
+        y = np.clip(points[:, 1] / self.cell_size - 0.5, 0, self.rows - 1)
+        column = np.minimum(x.astype(np.intp), self.columns - 2)
+        row = np.minimum(y.astype(np.intp), self.rows - 2)
+        fx, fy = x - column, y - row
+        potential = self.potential
+        return ((potential[row, column] * (1 - fx) + potential[row, column + 1] * fx) * (1 - fy) +
+                (potential[row + 1, column] * (1 - fx) + potential[row + 1, column + 1] * fx) * fy)
+
+    def decide(self, dot_positions: np.ndarray, arrow_position, bomb_ready: bool = True,
+               obstacle_layer=None) -> tuple:
+        """
+        Choose where the white arrow should head this tick.
+
+        Args:
+            dot_positions: (n, 2) array of red dot centers in world pixels
+            arrow_position: The white arrow's Position
+            bomb_ready: Whether the bomb's cooldown has finished
+            obstacle_layer: ObstacleLayer whose blocked cells the arrow must avoid (optional)
+
+        Returns:
+            Tuple of ((x, y) world target for the arrow's movement, True to fire the bomb)
+        """
+        started = time.perf_counter()
+        columns, rows = self.columns, self.rows
+
+        # Threat density: one histogram over every dot
+        cell_x = np.clip((dot_positions[:, 0] // self.cell_size).astype(np.intp), 0, columns - 1)
+        cell_y = np.clip((dot_positions[:, 1] // self.cell_size).astype(np.intp), 0, rows - 1)
+        self.density = np.bincount(cell_x + cell_y * columns, minlength=columns * rows).reshape(rows, columns)
+        self.potential = self._blur(self.density.astype(np.float64)) + self.wall_potential
+
+        # Lowest potential on the lookahead ring, never leaving the world
+        points = self.ring + (arrow_position.x, arrow_position.y)
+        cost = self._sample(points) - self.heading_inertia * (self.directions @ self.heading)
+        outside = ((points[:, 0] < 0) | (points[:, 0] > self.world_width) |
+                   (points[:, 1] < 0) | (points[:, 1] > self.world_height))
+        cost[outside] = np.inf
+        if obstacle_layer is not None and obstacle_layer.has_obstacles():
+            # Sample each ray at every obstacle cell's length so thin walls are not stepped over
+            steps = max(1, int(np.ceil(np.linalg.norm(self.ring[0]) / obstacle_layer.cell_size)))
+            for step in range(1, steps + 1):
+                along = self.ring * (step / steps) + (arrow_position.x, arrow_position.y)
+                cost[obstacle_layer.blocked.flat[obstacle_layer.get_cells(along)]] = np.inf
+        best = int(np.argmin(cost))
+        self.heading = self.directions[best]
+        target = tuple(points[best].tolist())
+
+        # Bomb when enough dots are within reach of the arrow's cell
+        use_bomb = False
+        if bomb_ready:
+            reach = self.bomb_reach
+            arrow_column = min(max(int(arrow_position.x // self.cell_size), 0), columns - 1)
+            arrow_row = min(max(int(arrow_position.y // self.cell_size), 0), rows - 1)
+            nearby = self.density[max(arrow_row - reach, 0):arrow_row + reach + 1,
+                                  max(arrow_column - reach, 0):arrow_column + reach + 1].sum()
+            use_bomb = bool(nearby >= self.bomb_threshold)
+            self.bombs += use_bomb
+
+        self.decisions += 1
+        self.decision_seconds += time.perf_counter() - started
+        return target, use_bomb
+
+    def get_stats(self) -> dict:
+        """
+        Get decision statistics.
+
+        Returns:
+            Dictionary with decision count, bombs fired and mean decision time
+        """
+        return {
+            'decisions': self.decisions,
+            'bombs': self.bombs,
+            'decision_mean_us': self.decision_seconds / max(self.decisions, 1) * 1e6
+        }
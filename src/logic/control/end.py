@@ -5,6 +5,9 @@ import pygame
 class EndControl:
     """Handles ending the game and returning to menu."""
     
+    # Keys whose events this control handles (see InputDispatcher)
+    KEYS = (pygame.K_ESCAPE,)
+    
     def __init__(self):
         """Initialize the end control."""
         self.should_end = False
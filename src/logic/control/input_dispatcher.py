@@ -0,0 +1,149 @@
+"""Input filtering, motion coalescing, key dispatch and pointer sampling."""
+import statistics
+import time
+from collections import deque
+import pygame
+from src.config.config_loader import config
+
+
+class InputDispatcher:
+    """
+    Routes input to the game controls with as little per-event work as possible.
+
+    - While enabled, the event filter blocks every event type the game does
+      not handle (pygame.event.set_allowed), so high-rate mouse motion never
+      reaches the queue during a game.
+    - Motion events that do arrive are coalesced into one per batch.
+    - Key events go through a (event type, key) lookup table to the
+      controls registered for that key, instead of every control
+      inspecting every event.
+    - The pointer is sampled once per update, just before movement, and
+      the time from that sample until the frame showing its effect is
+      presented is kept as the input-to-display latency.
+    """
+
+    # Event types the game handles while the filter is enabled
+    GAMEPLAY_EVENTS = (
+        pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+        pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED
+    )
+
+    def __init__(self):
+        """Initialize the dispatcher."""
+        cfg = config.get('logic', 'control', 'input_dispatcher')
+        self.filter_events = cfg['filter_events']
+        self.handlers = {}
+        self.filter_enabled = False
+        self.latencies = deque(maxlen=cfg['latency_window_frames'])
+
+    def register_control(self, control):
+        """
+        Route key events for a control's keys to its handle_event method.
+
+        Args:
+            control: A control with a KEYS tuple and a handle_event(event) method
+        """
+        for key in control.KEYS:
+            for event_type in (pygame.KEYDOWN, pygame.KEYUP):
+                self.handlers.setdefault((event_type, key), []).append(control.handle_event)
+
+    def set_filter_enabled(self, enabled: bool):
+        """
+        Block or unblock the event types the game does not use.
+
+        Args:
+            enabled: True while a game is running, False for the menu
+        """
+        if not self.filter_events or enabled == self.filter_enabled:
+            return
+        self.filter_enabled = enabled
+        if enabled:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(self.GAMEPLAY_EVENTS))
+        else:
+            pygame.event.set_allowed(None)
+
+    @staticmethod
+    def coalesce_motion(events: list) -> list:
+        """
+        Replace all mouse motion events in a batch with a single one.
+
+        The remaining motion event sits where the last one was, carries its
+        position and buttons, and the summed relative motion.
+
+        Args:
+            events: Events in arrival order
+
+        Returns:
+            The events with motion coalesced
+        """
+        last_motion = -1
+        motion_count = 0
+        for index, event in enumerate(events):
+            if event.type == pygame.MOUSEMOTION:
+                last_motion = index
+                motion_count += 1
+        if motion_count < 2:
+            return events
+
+        rel_x = rel_y = 0
+        coalesced = []
+        for index, event in enumerate(events):
+            if event.type != pygame.MOUSEMOTION:
+                coalesced.append(event)
+                continue
+            rel_x += event.rel[0]
+            rel_y += event.rel[1]
+            if index == last_motion:
+                coalesced.append(pygame.event.Event(
+                    pygame.MOUSEMOTION, pos=event.pos, rel=(rel_x, rel_y), buttons=event.buttons
+                ))
+        return coalesced
+
+    def dispatch(self, event: pygame.event.Event):
+        """
+        Hand a key event to the controls registered for its key.
+
+        Args:
+            event: The pygame event
+        """
+        handlers = self.handlers.get((event.type, getattr(event, 'key', None)))
+        if handlers:
+            for handler in handlers:
+                handler(event)
+
+    def sample_pointer(self) -> tuple:
+        """
+        Read the pointer position for this update.
+
+        Returns:
+            Tuple of ((x, y) screen position, perf_counter time of the sample)
+        """
+        return pygame.mouse.get_pos(), time.perf_counter()
+
+    def record_display(self, sampled_at: float):
+        """
+        Record that a frame driven by an input sample has been presented.
+
+        Args:
+            sampled_at: perf_counter time the input was sampled, or None
+        """
+        if sampled_at is not None:
+            self.latencies.append(time.perf_counter() - sampled_at)
+
+    def get_latency_stats(self) -> dict:
+        """
+        Get input-to-display latency over the recent window.
+
+        Returns:
+            Dictionary with frame count and mean, 95th percentile and maximum latency (ms)
+        """
+        latency_ms = sorted(seconds * 1000 for seconds in self.latencies)
+        if not latency_ms:
+            return {'frames': 0, 'mean_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        return {
+            'frames': len(latency_ms),
+            'mean_ms': statistics.fmean(latency_ms),
+            'p95_ms': latency_ms[min(len(latency_ms) - 1, int(len(latency_ms) * 0.95))],
+            'max_ms': latency_ms[-1]
+        }
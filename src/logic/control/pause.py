@@ -5,6 +5,9 @@ import pygame
 class PauseControl:
     """Handles pausing and unpausing the game."""
     
+    # Keys whose events this control handles (see InputDispatcher)
+    KEYS = (pygame.K_p,)
+    
     def __init__(self):
         """Initialize the pause control."""
         self.paused = False
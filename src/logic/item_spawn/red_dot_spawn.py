@@ -7,21 +7,26 @@ from src.config.config_loader import config
 class RedDotSpawn:
     """Handles spawning of red dots at random locations."""
     
-    def __init__(self, screen_width: int, screen_height: int, min_distance: float = None):
+    def __init__(self, world_width: int, world_height: int, min_distance: float = None, seed: int = None):
         """
         Initialize the red dot spawn logic.
         
         Args:
-            screen_width: Width of the game screen
-            screen_height: Height of the game screen
+            world_width: Width of the game world
+            world_height: Height of the game world
             min_distance: Minimum distance from white arrow position (default: from config)
+            seed: Seed for the spawn random generator (default: system entropy)
         """
         cfg = config.get('logic', 'item_spawn', 'red_dot_spawn')
-        self.screen_width = screen_width
-        self.screen_height = screen_height
+        self.world_width = world_width
+        self.world_height = world_height
         self.min_distance = min_distance if min_distance is not None else cfg['min_distance_from_arrow']
         self.max_attempts = cfg['max_spawn_attempts']
         self.margin = cfg['margin']
+        # Own generator so the spawn sequence can be captured and restored
+        self.rng = random.Random(seed)
+        # ObstacleLayer whose blocked cells are never spawned in (set by the game loop)
+        self.obstacle_layer = None
     
     def spawn(self, avoid_position: Position = None) -> Position:
         """
@@ -34,9 +39,13 @@ class RedDotSpawn:
             A Position object for the new red dot
         """
         for _ in range(self.max_attempts):
-            # Generate random position within screen bounds
-            x = random.uniform(self.margin, self.screen_width - self.margin)
-            y = random.uniform(self.margin, self.screen_height - self.margin)
+            # Generate random position within world bounds
+            x = self.rng.uniform(self.margin, self.world_width - self.margin)
+            y = self.rng.uniform(self.margin, self.world_height - self.margin)
+            
+            # Never inside an obstacle
+            if self.obstacle_layer is not None and self.obstacle_layer.is_blocked(x, y):
+                continue
             new_position = Position(x, y)
             
             # If no position to avoid, return this position
@@ -48,9 +57,19 @@ class RedDotSpawn:
             if distance >= self.min_distance:
                 return new_position
         
-        # If we couldn't find a valid position after max_attempts,
-        # just return a random position anyway
+        # If we couldn't find a valid position after max_attempts, give up
+        # on the distance but still never spawn inside an obstacle
+        for _ in range(self.max_attempts):
+            x = self.rng.uniform(self.margin, self.world_width - self.margin)
+            y = self.rng.uniform(self.margin, self.world_height - self.margin)
+            if self.obstacle_layer is None or not self.obstacle_layer.is_blocked(x, y):
+                return Position(x, y)
+        
+        # Almost everything is blocked: take the center of a random free cell
+        rows, columns = (~self.obstacle_layer.blocked).nonzero()
+        index = self.rng.randrange(len(rows))
+        cell_size = self.obstacle_layer.cell_size
         return Position(
-            random.uniform(self.margin, self.screen_width - self.margin),
-            random.uniform(self.margin, self.screen_height - self.margin)
+            min((columns[index] + 0.5) * cell_size, self.world_width),
+            min((rows[index] + 0.5) * cell_size, self.world_height)
         )
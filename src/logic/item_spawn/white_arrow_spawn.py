@@ -5,21 +5,21 @@ from src.general.position import Position
 class WhiteArrowSpawn:
     """Handles spawning of the white arrow at game start."""
     
-    def __init__(self, screen_width: int, screen_height: int):
+    def __init__(self, world_width: int, world_height: int):
         """
         Initialize the white arrow spawn logic.
         
         Args:
-            screen_width: Width of the game screen
-            screen_height: Height of the game screen
+            world_width: Width of the game world
+            world_height: Height of the game world
         """
-        self.screen_width = screen_width
-        self.screen_height = screen_height
+        self.world_width = world_width
+        self.world_height = world_height
         self.has_spawned = False
     
     def spawn(self) -> Position:
         """
-        Spawn the white arrow at the center of the screen.
+        Spawn the white arrow at the center of the world.
         
         This should only be called at the beginning of the game.
         
@@ -28,7 +28,7 @@ class WhiteArrowSpawn:
         """
         if not self.has_spawned:
             self.has_spawned = True
-            return Position(self.screen_width / 2, self.screen_height / 2)
+            return Position(self.world_width / 2, self.world_height / 2)
         return None
     
     def reset(self):
@@ -0,0 +1 @@
+"""Interchangeable implementations of the movement and collision math."""
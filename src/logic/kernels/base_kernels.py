@@ -0,0 +1,110 @@
+"""Interface of a movement and collision kernel backend."""
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class BaseKernels(ABC):
+    """
+    The math behind chasing movement and dot collisions, over arrays.
+
+    Every backend takes and returns NumPy arrays with the same shapes and
+    must give the same results as PythonKernels, the reference (see
+    src.logic.kernels.conformance). Positions are (n, 2) float64 arrays of
+    x, y.
+    """
+
+    # Name used to select the backend
+    name = None
+
+    @abstractmethod
+    def chase(self, positions: np.ndarray, speeds: np.ndarray, target_x: float, target_y: float) -> np.ndarray:
+        """
+        Move points towards a target.
+
+        Each point moves by its speed, or onto the target if it is closer
+        than that; points within 0.1 of the target stay where they are.
+
+        Args:
+            positions: (n, 2) current positions
+            speeds: (n,) movement speeds in pixels per frame
+            target_x: Target x
+            target_y: Target y
+
+        Returns:
+            (n, 2) new positions
+        """
+        pass
+
+    @abstractmethod
+    def chase_targets(self, positions: np.ndarray, speeds: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Move points towards a target each (same rule as chase()).
+
+        Args:
+            positions: (n, 2) current positions
+            speeds: (n,) movement speeds in pixels per frame
+            targets: (n, 2) target of each point
+
+        Returns:
+            (n, 2) new positions
+        """
+        pass
+
+    @abstractmethod
+    def points_in_circles(self, points: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """
+        Find the points strictly inside any of a set of circles.
+
+        Args:
+            points: (n, 2) points
+            centers: (m, 2) circle centers
+            radii: (m,) circle radii
+
+        Returns:
+            (n,) bool array, True where the point is inside at least one circle
+        """
+        pass
+
+    @abstractmethod
+    def circles_hit_polygon(self, offsets: np.ndarray, radius: float, outline: np.ndarray) -> np.ndarray:
+        """
+        Test circles against a polygon.
+
+        A circle hits if its center is inside the polygon (even-odd rule,
+        so concave polygons work) or closer than radius to one of its
+        edges. A negative radius never hits.
+
+        Args:
+            offsets: (n, 2) circle centers relative to the polygon's origin
+            radius: Radius shared by all circles
+            outline: (k, 2) polygon points relative to its origin
+
+        Returns:
+            (n,) bool array, True where the circle overlaps the polygon
+        """
+        pass
+
+    def chase_point(self, x: float, y: float, speed: float, target_x: float, target_y: float) -> tuple:
+        """
+        Move a single point towards a target (same rule as chase()).
+
+        Arrays gain nothing for one point, so all backends share this
+        scalar version unless they override it.
+
+        Args:
+            x: Current x
+            y: Current y
+            speed: Movement speed in pixels per frame
+            target_x: Target x
+            target_y: Target y
+
+        Returns:
+            Tuple of (dx, dy) actually moved; (0, 0) if the point is within 0.1 of the target
+        """
+        dx = target_x - x
+        dy = target_y - y
+        distance = (dx ** 2 + dy ** 2) ** 0.5
+        if distance < 0.1:
+            return 0.0, 0.0
+        move_distance = min(speed, distance)
+        return (dx / distance) * move_distance, (dy / distance) * move_distance
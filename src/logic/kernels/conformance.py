@@ -0,0 +1,115 @@
+"""Checks that a kernel backend matches the Python reference."""
+import numpy as np
+from .base_kernels import BaseKernels
+from .python_kernels import PythonKernels
+
+# Positions may differ from the reference by rounding only
+TOLERANCE = 1e-9
+
+# The white arrow's outline (concave), pointing up
+ARROW_OUTLINE = np.array([
+    (0, -6.5), (7.5, 3.25), (2.5, 3.25), (2.5, 6.5), (-2.5, 6.5), (-2.5, 3.25), (-7.5, 3.25)
+], dtype=np.float64)
+
+
+def _chase_cases(rng: np.random.Generator) -> list:
+    """Inputs for chase(): random points plus the boundary cases of the 0.1 and speed rules."""
+    random_points = rng.uniform(-500, 500, size=(500, 2))
+    special = np.array([
+        (10.0, 10.0),      # On the target
+        (10.05, 10.0),     # Closer than 0.1
+        (10.1, 10.0),      # Exactly 0.1 away
+        (11.0, 10.0),      # Closer than the speed
+        (10.0, 10.0 + 2.0), # Exactly one step away
+    ])
+    return [
+        (random_points, rng.uniform(0.5, 4.0, size=500), 10.0, 10.0),
+        (special, np.full(len(special), 2.0), 10.0, 10.0),
+        (np.empty((0, 2)), np.empty(0), 0.0, 0.0),
+    ]
+
+
+def _target_cases(rng: np.random.Generator) -> list:
+    """Inputs for chase_targets(): random points and targets, and points on or near their own targets."""
+    positions = rng.uniform(-500, 500, size=(500, 2))
+    near = np.array([(0.0, 0.0), (3.0, 4.0), (7.0, 7.0), (1.0, 1.0)])
+    return [
+        (positions, rng.uniform(0.5, 4.0, size=500), rng.uniform(-500, 500, size=(500, 2))),
+        (near, np.full(len(near), 2.0), near + np.array([(0.0, 0.0), (0.05, 0.0), (0.0, 2.0), (1.0, 1.0)])),
+        (np.empty((0, 2)), np.empty(0), np.empty((0, 2))),
+    ]
+
+
+def _circle_cases(rng: np.random.Generator) -> list:
+    """Inputs for points_in_circles(): random scenes, points on a boundary and empty inputs."""
+    return [
+        (rng.uniform(0, 400, size=(2000, 2)), rng.uniform(0, 400, size=(5, 2)), rng.uniform(0, 120, size=5)),
+        (np.array([(50.0, 0.0), (49.999, 0.0), (0.0, 0.0)]), np.array([(0.0, 0.0)]), np.array([50.0])),
+        (rng.uniform(0, 10, size=(10, 2)), np.empty((0, 2)), np.empty(0)),
+        (np.empty((0, 2)), np.array([(0.0, 0.0)]), np.array([5.0])),
+    ]
+
+
+def _polygon_cases(rng: np.random.Generator) -> list:
+    """Inputs for circles_hit_polygon(): rotated arrows, centers inside the notches and a negative radius."""
+    cases = []
+    for angle in (0.0, 37.0, 90.0, 200.0):
+        radians = np.radians(angle)
+        rotation = np.array([[np.cos(radians), np.sin(radians)], [-np.sin(radians), np.cos(radians)]])
+        cases.append((rng.uniform(-20, 20, size=(1000, 2)), 7.5, ARROW_OUTLINE @ rotation))
+    notches = np.array([(5.0, 5.0), (-5.0, 5.0), (0.0, 0.0), (0.0, -6.4), (0.0, 20.0)])
+    cases.append((notches, 0.5, ARROW_OUTLINE))
+    cases.append((notches, -1.0, ARROW_OUTLINE))
+    cases.append((np.empty((0, 2)), 7.5, ARROW_OUTLINE))
+    return cases
+
+
+def check_conformance(kernels: BaseKernels, seed: int = 0) -> list:
+    """
+    Run a backend against the reference on the same inputs.
+
+    Args:
+        kernels: The backend to check
+        seed: Random seed for the generated inputs
+
+    Returns:
+        Descriptions of every mismatch (empty if the backend conforms)
+    """
+    reference = PythonKernels()
+    rng = np.random.default_rng(seed)
+    failures = []
+
+    for case, (positions, speeds, target_x, target_y) in enumerate(_chase_cases(rng)):
+        expected = reference.chase(positions, speeds, target_x, target_y)
+        actual = np.asarray(kernels.chase(positions, speeds, target_x, target_y))
+        if actual.shape != expected.shape:
+            failures.append(f"chase case {case}: shape {actual.shape}, expected {expected.shape}")
+        elif not np.allclose(actual, expected, rtol=0, atol=TOLERANCE):
+            failures.append(f"chase case {case}: max error {np.abs(actual - expected).max():.3g}")
+
+    for case, (positions, speeds, targets) in enumerate(_target_cases(rng)):
+        expected = reference.chase_targets(positions, speeds, targets)
+        actual = np.asarray(kernels.chase_targets(positions, speeds, targets))
+        if actual.shape != expected.shape:
+            failures.append(f"chase_targets case {case}: shape {actual.shape}, expected {expected.shape}")
+        elif not np.allclose(actual, expected, rtol=0, atol=TOLERANCE):
+            failures.append(f"chase_targets case {case}: max error {np.abs(actual - expected).max():.3g}")
+
+    for case, (points, centers, radii) in enumerate(_circle_cases(rng)):
+        expected = reference.points_in_circles(points, centers, radii)
+        actual = np.asarray(kernels.points_in_circles(points, centers, radii))
+        if actual.shape != expected.shape or actual.dtype != bool:
+            failures.append(f"points_in_circles case {case}: {actual.dtype} {actual.shape}, expected bool {expected.shape}")
+        elif not np.array_equal(actual, expected):
+            failures.append(f"points_in_circles case {case}: {np.count_nonzero(actual != expected)} points differ")
+
+    for case, (offsets, radius, outline) in enumerate(_polygon_cases(rng)):
+        expected = reference.circles_hit_polygon(offsets, radius, outline)
+        actual = np.asarray(kernels.circles_hit_polygon(offsets, radius, outline))
+        if actual.shape != expected.shape or actual.dtype != bool:
+            failures.append(f"circles_hit_polygon case {case}: {actual.dtype} {actual.shape}, "
+                            f"expected bool {expected.shape}")
+        elif not np.array_equal(actual, expected):
+            failures.append(f"circles_hit_polygon case {case}: {np.count_nonzero(actual != expected)} circles differ")
+
+    return failures
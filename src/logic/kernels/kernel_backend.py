@@ -0,0 +1,76 @@
+"""Selection of the kernel backend used by movement and collision."""
+from src.config.config_loader import config
+from . import numba_kernels
+from .base_kernels import BaseKernels
+from .numba_kernels import NumbaKernels
+from .numpy_kernels import NumpyKernels
+from .python_kernels import PythonKernels
+
+
+class KernelBackend:
+    """
+    Holds the kernels that movement and collision code calls.
+
+    A single shared instance (like render_quality) lets the backend be
+    switched at runtime for every mover and collision detector at once.
+    'auto' picks Numba when it is installed and NumPy otherwise.
+    """
+
+    BACKENDS = {
+        PythonKernels.name: PythonKernels,
+        NumpyKernels.name: NumpyKernels,
+        NumbaKernels.name: NumbaKernels
+    }
+
+    def __init__(self):
+        """Initialize with the backend from config."""
+        self.kernels = None
+        self.select(config.get('logic', 'kernels', 'kernel_backend', 'backend'))
+
+    @classmethod
+    def get_available(cls) -> list:
+        """
+        Get the backends that can be used in this environment.
+
+        Returns:
+            List of backend names
+        """
+        return [name for name in cls.BACKENDS if name != NumbaKernels.name or numba_kernels.is_available()]
+
+    @classmethod
+    def create(cls, name: str) -> BaseKernels:
+        """
+        Create a backend's kernels.
+
+        Args:
+            name: Backend name, or 'auto'
+
+        Returns:
+            The kernels
+
+        Raises:
+            ValueError: If the name is unknown
+            RuntimeError: If the backend's dependency is not installed
+        """
+        if name == 'auto':
+            name = NumbaKernels.name if numba_kernels.is_available() else NumpyKernels.name
+        if name not in cls.BACKENDS:
+            raise ValueError(f"Unknown kernel backend '{name}' (choose from auto, {', '.join(cls.BACKENDS)})")
+        return cls.BACKENDS[name]()
+
+    def select(self, name: str) -> BaseKernels:
+        """
+        Switch every user of the shared instance to a backend.
+
+        Args:
+            name: Backend name, or 'auto'
+
+        Returns:
+            The selected kernels
+        """
+        self.kernels = self.create(name)
+        return self.kernels
+
+
+# Global kernel backend instance
+kernel_backend = KernelBackend()
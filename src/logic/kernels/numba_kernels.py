@@ -0,0 +1,151 @@
+"""Numba JIT kernel backend (only available when numba is installed)."""
+import numpy as np
+from .base_kernels import BaseKernels
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def is_available() -> bool:
+    """
+    Check whether the Numba backend can be used.
+
+    Returns:
+        True if numba is installed
+    """
+    return numba is not None
+
+
+def _chase(positions, speeds, target_x, target_y):
+    """Compiled loop of BaseKernels.chase."""
+    moved = positions.copy()
+    for i in range(positions.shape[0]):
+        dx = target_x - positions[i, 0]
+        dy = target_y - positions[i, 1]
+        distance = (dx * dx + dy * dy) ** 0.5
+        if distance < 0.1:
+            continue
+        move_distance = min(speeds[i], distance)
+        moved[i, 0] = positions[i, 0] + (dx / distance) * move_distance
+        moved[i, 1] = positions[i, 1] + (dy / distance) * move_distance
+    return moved
+
+
+def _chase_targets(positions, speeds, targets):
+    """Compiled loop of BaseKernels.chase_targets."""
+    moved = positions.copy()
+    for i in range(positions.shape[0]):
+        dx = targets[i, 0] - positions[i, 0]
+        dy = targets[i, 1] - positions[i, 1]
+        distance = (dx * dx + dy * dy) ** 0.5
+        if distance < 0.1:
+            continue
+        move_distance = min(speeds[i], distance)
+        moved[i, 0] = positions[i, 0] + (dx / distance) * move_distance
+        moved[i, 1] = positions[i, 1] + (dy / distance) * move_distance
+    return moved
+
+
+def _points_in_circles(points, centers, radii):
+    """Compiled loop of BaseKernels.points_in_circles."""
+    inside = np.zeros(points.shape[0], dtype=np.bool_)
+    for i in range(points.shape[0]):
+        for j in range(centers.shape[0]):
+            dx = centers[j, 0] - points[i, 0]
+            dy = centers[j, 1] - points[i, 1]
+            if (dx * dx + dy * dy) ** 0.5 < radii[j]:
+                inside[i] = True
+                break
+    return inside
+
+
+def _circles_hit_polygon(offsets, radius, outline):
+    """Compiled loop of BaseKernels.circles_hit_polygon."""
+    hits = np.zeros(offsets.shape[0], dtype=np.bool_)
+    if radius < 0:
+        return hits
+    radius_squared = radius * radius
+    count = outline.shape[0]
+    for i in range(offsets.shape[0]):
+        dx = offsets[i, 0]
+        dy = offsets[i, 1]
+        inside = False
+        start_x = outline[count - 1, 0]
+        start_y = outline[count - 1, 1]
+        for k in range(count):
+            end_x = outline[k, 0]
+            end_y = outline[k, 1]
+            edge_x = end_x - start_x
+            edge_y = end_y - start_y
+            if (end_y > dy) != (start_y > dy) and dx < start_x + (dy - start_y) * edge_x / edge_y:
+                inside = not inside
+            t = ((dx - start_x) * edge_x + (dy - start_y) * edge_y) / (edge_x * edge_x + edge_y * edge_y)
+            t = min(max(t, 0.0), 1.0)
+            offset_x = start_x + t * edge_x - dx
+            offset_y = start_y + t * edge_y - dy
+            if offset_x * offset_x + offset_y * offset_y < radius_squared:
+                inside = True
+                break
+            start_x = end_x
+            start_y = end_y
+        hits[i] = inside
+    return hits
+
+
+if numba is not None:
+    _chase = numba.njit(cache=True)(_chase)
+    _chase_targets = numba.njit(cache=True)(_chase_targets)
+    _points_in_circles = numba.njit(cache=True)(_points_in_circles)
+    _circles_hit_polygon = numba.njit(cache=True)(_circles_hit_polygon)
+
+
+class NumbaKernels(BaseKernels):
+    """
+    Kernels as loops compiled to machine code by Numba.
+
+    The loops are the reference's, compiled with nopython mode, so they
+    avoid both the interpreter and NumPy's temporary arrays. Compilation
+    happens in the constructor (and is cached on disk), so the first frame
+    does not stall.
+    """
+
+    name = 'numba'
+
+    def __init__(self):
+        """
+        Compile the kernels.
+
+        Raises:
+            RuntimeError: If numba is not installed
+        """
+        if numba is None:
+            raise RuntimeError("The numba kernel backend needs the numba package")
+        empty = np.zeros((1, 2))
+        _chase(empty, np.ones(1), 0.0, 0.0)
+        _chase_targets(empty, np.ones(1), empty)
+        _points_in_circles(empty, empty, np.ones(1))
+        _circles_hit_polygon(empty, 1.0, np.array([[0.0, -1.0], [1.0, 1.0], [-1.0, 1.0]]))
+
+    def chase(self, positions: np.ndarray, speeds: np.ndarray, target_x: float, target_y: float) -> np.ndarray:
+        """Move points towards a target (see BaseKernels.chase)."""
+        return _chase(np.ascontiguousarray(positions, dtype=np.float64),
+                      np.ascontiguousarray(speeds, dtype=np.float64), float(target_x), float(target_y))
+
+    def chase_targets(self, positions: np.ndarray, speeds: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """Move points towards a target each (see BaseKernels.chase_targets)."""
+        return _chase_targets(np.ascontiguousarray(positions, dtype=np.float64).reshape(-1, 2),
+                              np.ascontiguousarray(speeds, dtype=np.float64),
+                              np.ascontiguousarray(targets, dtype=np.float64).reshape(-1, 2))
+
+    def points_in_circles(self, points: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Find the points strictly inside any circle (see BaseKernels.points_in_circles)."""
+        return _points_in_circles(np.ascontiguousarray(points, dtype=np.float64),
+                                  np.ascontiguousarray(centers, dtype=np.float64).reshape(-1, 2),
+                                  np.ascontiguousarray(radii, dtype=np.float64))
+
+    def circles_hit_polygon(self, offsets: np.ndarray, radius: float, outline: np.ndarray) -> np.ndarray:
+        """Test circles against a polygon (see BaseKernels.circles_hit_polygon)."""
+        return _circles_hit_polygon(np.ascontiguousarray(offsets, dtype=np.float64).reshape(-1, 2), float(radius),
+                                    np.ascontiguousarray(outline, dtype=np.float64))
@@ -0,0 +1,85 @@
+"""Pure Python kernel backend, the reference for the other backends."""
+import numpy as np
+from .base_kernels import BaseKernels
+
+
+class PythonKernels(BaseKernels):
+    """
+    Kernels as plain Python loops over floats.
+
+    This is the math the movement and collision classes always used,
+    one item at a time, and the behavior every other backend is checked
+    against.
+    """
+
+    name = 'python'
+
+    def chase(self, positions: np.ndarray, speeds: np.ndarray, target_x: float, target_y: float) -> np.ndarray:
+        """Move points towards a target (see BaseKernels.chase)."""
+        moved = []
+        for (x, y), speed in zip(positions.tolist(), speeds.tolist()):
+            dx = target_x - x
+            dy = target_y - y
+            distance = (dx ** 2 + dy ** 2) ** 0.5
+            if distance < 0.1:
+                moved.append((x, y))
+                continue
+            move_distance = min(speed, distance)
+            moved.append((x + (dx / distance) * move_distance, y + (dy / distance) * move_distance))
+        return np.array(moved, dtype=np.float64).reshape(-1, 2)
+
+    def chase_targets(self, positions: np.ndarray, speeds: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """Move points towards a target each (see BaseKernels.chase_targets)."""
+        moved = []
+        for (x, y), speed, (target_x, target_y) in zip(positions.tolist(), speeds.tolist(), targets.tolist()):
+            dx = target_x - x
+            dy = target_y - y
+            distance = (dx ** 2 + dy ** 2) ** 0.5
+            if distance < 0.1:
+                moved.append((x, y))
+                continue
+            move_distance = min(speed, distance)
+            moved.append((x + (dx / distance) * move_distance, y + (dy / distance) * move_distance))
+        return np.array(moved, dtype=np.float64).reshape(-1, 2)
+
+    def points_in_circles(self, points: np.ndarray, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """Find the points strictly inside any circle (see BaseKernels.points_in_circles)."""
+        circles = list(zip(centers.tolist(), radii.tolist()))
+        inside = []
+        for x, y in points.tolist():
+            hit = False
+            for (center_x, center_y), radius in circles:
+                if ((center_x - x) ** 2 + (center_y - y) ** 2) ** 0.5 < radius:
+                    hit = True
+                    break
+            inside.append(hit)
+        return np.array(inside, dtype=bool)
+
+    def circles_hit_polygon(self, offsets: np.ndarray, radius: float, outline: np.ndarray) -> np.ndarray:
+        """Test circles against a polygon (see BaseKernels.circles_hit_polygon)."""
+        if radius < 0:
+            return np.zeros(len(offsets), dtype=bool)
+        points = outline.tolist()
+        radius_squared = radius * radius
+        hits = []
+        for dx, dy in offsets.tolist():
+            hit = False
+            inside = False
+            start_x, start_y = points[-1]
+            for end_x, end_y in points:
+                edge_x = end_x - start_x
+                edge_y = end_y - start_y
+                # Crossing of a ray from the center towards +x
+                if (end_y > dy) != (start_y > dy) and dx < start_x + (dy - start_y) * edge_x / edge_y:
+                    inside = not inside
+                # Squared distance from the center to the closest point of the edge
+                t = ((dx - start_x) * edge_x + (dy - start_y) * edge_y) / (edge_x * edge_x + edge_y * edge_y)
+                t = min(max(t, 0.0), 1.0)
+                offset_x = start_x + t * edge_x - dx
+                offset_y = start_y + t * edge_y - dy
+                if offset_x * offset_x + offset_y * offset_y < radius_squared:
+                    hit = True
+                    break
+                start_x, start_y = end_x, end_y
+            hits.append(hit or inside)
+        return np.array(hits, dtype=bool)
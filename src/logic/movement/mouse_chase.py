@@ -1,6 +1,7 @@
 """Movement behavior that chases the mouse position."""
 import pygame
 from src.general.position import Position
+from src.logic.kernels.kernel_backend import kernel_backend
 from .base_movement import BaseMovement
 
 
@@ -27,37 +28,29 @@ class MouseChase(BaseMovement):
         """
         return (self.last_dx, self.last_dy)
     
-    def update_position(self, current_position: Position, **kwargs) -> Position:
+    def update_position(self, current_position: Position, mouse_position: tuple = None, **kwargs) -> Position:
         """
         Update position by moving towards the mouse cursor.
         
         Args:
             current_position: The current position of the object
+            mouse_position: Sampled (x, y) mouse position (default: query pygame now)
             **kwargs: Additional parameters (not used)
             
         Returns:
             The new position after moving towards the mouse
         """
         # Get current mouse position
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        mouse_position = Position(mouse_x, mouse_y)
+        if mouse_position is None:
+            mouse_position = pygame.mouse.get_pos()
         
-        # Calculate direction vector
-        dx = mouse_position.x - current_position.x
-        dy = mouse_position.y - current_position.y
-        
-        # Calculate distance
-        distance = (dx ** 2 + dy ** 2) ** 0.5
+        dx, dy = kernel_backend.kernels.chase_point(current_position.x, current_position.y, self.speed,
+                                                    mouse_position[0], mouse_position[1])
         
         # If already at mouse position, don't move
-        if distance < 0.1:
+        if dx == 0 and dy == 0:
             return current_position
         
-        # Normalize direction and apply speed
-        move_distance = min(self.speed, distance)
-        dx = (dx / distance) * move_distance
-        dy = (dy / distance) * move_distance
-        
         # Store last direction for rotation
         self.last_dx = dx
         self.last_dy = dy
@@ -1,10 +1,18 @@
 """Movement behavior that chases a target position."""
+import numpy as np
 from src.general.position import Position
+from src.logic.kernels.kernel_backend import kernel_backend
 from .base_movement import BaseMovement
 
 
 class TargetChase(BaseMovement):
-    """Movement behavior that chases a target position."""
+    """
+    Movement behavior that chases a target position.
+    
+    The math runs on the selected kernel backend; update_all() moves a
+    whole list of chasers with one kernel call, optionally steering them
+    around obstacles with a flow field.
+    """
     
     def __init__(self, speed: float = 1.0):
         """
@@ -29,21 +37,44 @@ class TargetChase(BaseMovement):
         if target_position is None:
             return current_position
         
-        # Calculate direction vector
-        dx = target_position.x - current_position.x
-        dy = target_position.y - current_position.y
-        
-        # Calculate distance
-        distance = (dx ** 2 + dy ** 2) ** 0.5
+        dx, dy = kernel_backend.kernels.chase_point(current_position.x, current_position.y, self.speed,
+                                                    target_position.x, target_position.y)
         
         # If already at target, don't move
-        if distance < 0.1:
+        if dx == 0 and dy == 0:
             return current_position
         
-        # Normalize direction and apply speed
-        move_distance = min(self.speed, distance)
-        dx = (dx / distance) * move_distance
-        dy = (dy / distance) * move_distance
-        
         # Return new position
         return Position(current_position.x + dx, current_position.y + dy)
+    
+    @staticmethod
+    def update_all(items: list, target_position: Position, flow_field=None) -> np.ndarray:
+        """
+        Move every item that has a TargetChase movement towards the same target.
+        
+        Without a flow field this gives the same positions as updating the
+        items one by one; with one, each item heads for its waypoint
+        (see FlowField.get_waypoints) instead of straight for the target.
+        
+        Args:
+            items: Items whose movement is a TargetChase
+            target_position: The position to chase
+            flow_field: FlowField to path around obstacles with (default: chase in a straight line)
+            
+        Returns:
+            (n, 2) array of the new positions, in item order
+        """
+        count = len(items)
+        positions = np.fromiter(
+            (value for item in items for value in (item.position.x, item.position.y)),
+            dtype=np.float64, count=count * 2
+        ).reshape(-1, 2)
+        speeds = np.fromiter((item.movement.speed for item in items), dtype=np.float64, count=count)
+        if flow_field is None:
+            moved = kernel_backend.kernels.chase(positions, speeds, target_position.x, target_position.y)
+        else:
+            waypoints = flow_field.get_waypoints(positions, target_position.x, target_position.y)
+            moved = kernel_backend.kernels.chase_targets(positions, speeds, waypoints)
+        for item, (x, y) in zip(items, moved.tolist()):
+            item.position = Position(x, y)
+        return moved
@@ -0,0 +1 @@
+"""Static arena obstacles and flow-field pathfinding around them."""
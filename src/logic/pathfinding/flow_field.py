@@ -0,0 +1,235 @@
+"""Flow field that steers any number of chasers around obstacles to one target."""
+import time
+from collections import OrderedDict
+import numpy as np
+from src.config.config_loader import config
+from .obstacle_layer import ObstacleLayer
+
+
+class FlowField:
+    """
+    A next-cell table from every grid cell towards the target's cell.
+
+    The distance from each cell to the target cell is the shortest
+    8-connected path over the free cells of an ObstacleLayer, with integer
+    chamfer step costs (5 straight, 7 diagonal, close to 1 : sqrt(2)).
+    Diagonal steps may not cut the corner of a blocked cell. Instead of a
+    Dijkstra search over a priority queue, the distances come from
+    directional sweeps. For each of the 8 directions, the grid is laid out
+    as lines running that way, and one np.minimum.accumulate carries
+    distances along every line at once. Steps that are not allowed split
+    the lines into segments, and a large offset per segment stops the
+    running minimum at segment boundaries. Repeating the 8 sweeps until
+    nothing changes takes a few rounds (about one per turn in the
+    paths). The result is exactly the Dijkstra distances, at a cost set
+    by the grid size alone.
+
+    Each cell then points at the neighbor with the lowest step cost plus
+    distance. A chaser looks up its cell's entry and heads for that
+    neighbor's center. Chasers in the target's cell, or with no path to
+    it, head straight for the target. Moving n chasers is O(n) with no
+    per-chaser search. The table only changes when the target enters a new
+    cell, and the tables of the last max_cached_fields target cells are
+    kept, so returning to a cell costs nothing.
+    """
+
+    # Step costs of a straight and a diagonal move
+    STRAIGHT_COST = 5
+    DIAGONAL_COST = 7
+    # Distance of cells with no path to the target
+    UNREACHABLE = 1 << 30
+    # Offset between line segments in a sweep; larger than any distance
+    SEGMENT_OFFSET = 1 << 32
+    # (row, column) steps to the 8 neighbors; on equal cost the first wins
+    NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1))
+
+    def __init__(self, obstacle_layer: ObstacleLayer, max_cached_fields: int = None):
+        """
+        Initialize the flow field.
+
+        Args:
+            obstacle_layer: The obstacles to path around (its grid is the field's grid)
+            max_cached_fields: Number of target cells whose tables are kept (default: from config)
+        """
+        if max_cached_fields is None:
+            max_cached_fields = config.get('logic', 'pathfinding', 'flow_field', 'max_cached_fields')
+        self.obstacle_layer = obstacle_layer
+        self.max_cached_fields = max_cached_fields
+        rows, columns = obstacle_layer.rows, obstacle_layer.columns
+        cell_size = obstacle_layer.cell_size
+        free = ~obstacle_layer.blocked
+        padded = np.zeros((rows + 2, columns + 2), dtype=bool)
+        padded[1:-1, 1:-1] = free
+
+        # Per direction: the neighbor of every cell (clamped at the border) and the cost of stepping to it
+        cell_rows, cell_columns = np.divmod(np.arange(rows * columns), columns)
+        self.neighbor_cells = np.empty((len(self.NEIGHBORS), rows * columns), dtype=np.intp)
+        self.step_costs = np.empty((len(self.NEIGHBORS), rows * columns), dtype=np.int64)
+        self.sweeps = []
+        for direction, (row_step, column_step) in enumerate(self.NEIGHBORS):
+            allowed = free & padded[1 + row_step:1 + row_step + rows, 1 + column_step:1 + column_step + columns]
+            if row_step and column_step:
+                # No cutting the corner of a blocked cell
+                allowed &= (padded[1 + row_step:1 + row_step + rows, 1:1 + columns] &
+                            padded[1:1 + rows, 1 + column_step:1 + column_step + columns])
+            cost = self.DIAGONAL_COST if row_step and column_step else self.STRAIGHT_COST
+            allowed = allowed.ravel()
+            self.neighbor_cells[direction] = (np.clip(cell_rows + row_step, 0, rows - 1) * columns +
+                                              np.clip(cell_columns + column_step, 0, columns - 1))
+            self.step_costs[direction] = np.where(allowed, cost, self.UNREACHABLE)
+            self.sweeps.append(self._build_sweep(row_step, column_step, cost, allowed))
+
+        self.centers = np.column_stack([(cell_columns + 0.5) * cell_size, (cell_rows + 0.5) * cell_size])
+
+        # Next-cell tables by target cell, least recently used first
+        self.fields = OrderedDict()
+        self.target_cell = -1
+        self.next_cells = None
+
+        self.fields_computed = 0
+        self.cache_hits = 0
+        self.compute_seconds = 0.0
+
+    def _build_sweep(self, row_step: int, column_step: int, cost: int, allowed: np.ndarray) -> tuple:
+        """
+        Lay the grid out as lines running in one direction.
+
+        Args:
+            row_step: Row step of the direction
+            column_step: Column step of the direction
+            cost: Cost of one step in the direction
+            allowed: Flat bool array, True where a cell may step to its neighbor in the direction
+
+        Returns:
+            Tuple of (cell order, offset) for _sweep: the cells of all lines
+            one after another, and per position its step cost times the
+            position plus its segment number times SEGMENT_OFFSET
+        """
+        rows, columns = self.obstacle_layer.rows, self.obstacle_layer.columns
+        index = np.arange(rows * columns).reshape(rows, columns)
+        if row_step == 0:
+            lines = list(index[:, ::column_step])
+        elif column_step == 0:
+            lines = list(index[::row_step].T)
+        else:
+            # Diagonals of the grid, mirrored for the anti-diagonal directions
+            mirrored = index[:, ::row_step * column_step]
+            lines = [np.diagonal(mirrored, offset) for offset in range(1 - rows, columns)]
+            if row_step < 0:
+                lines = [line[::-1] for line in lines]
+        order = np.concatenate(lines)
+
+        # A segment starts with every line and after every step that is not allowed
+        starts = np.ones(len(order), dtype=bool)
+        following = np.ones(len(order), dtype=bool)
+        following[np.cumsum([len(line) for line in lines[:-1]], dtype=np.intp)] = False
+        following[0] = False
+        positions = np.nonzero(following)[0]
+        starts[positions] = ~allowed[order[positions - 1]]
+        segments = np.cumsum(starts).astype(np.int64)
+        return order, np.arange(len(order), dtype=np.int64) * cost + segments * self.SEGMENT_OFFSET
+
+    def _compute_distances(self, target_cell: int) -> np.ndarray:
+        """
+        Compute the path distance from every cell to a target cell.
+
+        Args:
+            target_cell: Flat index of the target cell
+
+        Returns:
+            Flat int64 array of distances (UNREACHABLE where there is no path)
+        """
+        distances = np.full(self.obstacle_layer.rows * self.obstacle_layer.columns, self.UNREACHABLE, dtype=np.int64)
+        if self.obstacle_layer.blocked.flat[target_cell]:
+            return distances
+        distances[target_cell] = 0
+        changed = True
+        while changed:
+            changed = False
+            for order, offset in self.sweeps:
+                line_distances = distances[order]
+                # Best of each cell's own distance and any earlier cell's in its segment plus the steps between
+                swept = np.minimum.accumulate(line_distances - offset) + offset
+                if not changed and (swept < line_distances).any():
+                    changed = True
+                distances[order] = swept
+        return distances
+
+    def _compute_next_cells(self, target_cell: int) -> np.ndarray:
+        """
+        Compute the next-cell table for a target cell.
+
+        Args:
+            target_cell: Flat index of the target cell
+
+        Returns:
+            Flat array of the cell each cell should head for; the target
+            cell and cells without a path point at themselves
+        """
+        distances = self._compute_distances(target_cell)
+        via = distances[self.neighbor_cells] + self.step_costs
+        best = np.argmin(via, axis=0)
+        next_cells = self.neighbor_cells[best, np.arange(len(distances))]
+        stay = (distances >= self.UNREACHABLE) | (distances == 0)
+        next_cells[stay] = np.nonzero(stay)[0]
+        return next_cells
+
+    def update(self, target_x: float, target_y: float):
+        """
+        Point the field at a target, computing its cell's table unless it is cached.
+
+        Args:
+            target_x: Target world x
+            target_y: Target world y
+        """
+        row, column = self.obstacle_layer.get_cell(target_x, target_y)
+        target_cell = row * self.obstacle_layer.columns + column
+        if target_cell == self.target_cell:
+            return
+        self.target_cell = target_cell
+        next_cells = self.fields.get(target_cell)
+        if next_cells is not None:
+            self.fields.move_to_end(target_cell)
+            self.cache_hits += 1
+        else:
+            started = time.perf_counter()
+            next_cells = self._compute_next_cells(target_cell)
+            self.compute_seconds += time.perf_counter() - started
+            self.fields_computed += 1
+            self.fields[target_cell] = next_cells
+            if len(self.fields) > self.max_cached_fields:
+                self.fields.popitem(last=False)
+        self.next_cells = next_cells
+
+    def get_waypoints(self, positions: np.ndarray, target_x: float, target_y: float) -> np.ndarray:
+        """
+        Get the point each chaser should head for this tick.
+
+        Args:
+            positions: (n, 2) chaser positions
+            target_x: Target world x
+            target_y: Target world y
+
+        Returns:
+            (n, 2) array: the center of the next cell on the chaser's path,
+            or the target itself in the target's cell or without a path
+        """
+        self.update(target_x, target_y)
+        cells = self.obstacle_layer.get_cells(positions)
+        next_cells = self.next_cells[cells]
+        waypoints = self.centers.take(next_cells, axis=0)
+        waypoints[next_cells == cells] = (target_x, target_y)
+        return waypoints
+
+    def get_stats(self) -> dict:
+        """
+        Get table computation statistics.
+
+        Returns:
+            Dictionary with tables computed, cache hits and mean computation time
+        """
+        return {
+            'fields_computed': self.fields_computed,
+            'cache_hits': self.cache_hits,
+            'compute_mean_us': self.compute_seconds / max(self.fields_computed, 1) * 1e6
+        }
@@ -0,0 +1,120 @@
+"""Static rectangular obstacles on a grid over the game world."""
+import numpy as np
+from src.general.position import Position
+from src.config.config_loader import config
+
+
+class ObstacleLayer:
+    """
+    The arena's obstacles, as rectangles and as a grid of blocked cells.
+
+    Every cell a rectangle overlaps is blocked; movement and pathfinding
+    only look at the grid, so rectangles are best aligned to cell_size.
+    Positions outside the world fall into the border cells.
+    """
+
+    def __init__(self, world_width: float, world_height: float, rects: list = None, cell_size: float = None):
+        """
+        Initialize the layer.
+
+        Args:
+            world_width: Width of the game world
+            world_height: Height of the game world
+            rects: (x, y, width, height) obstacle rectangles in world pixels (default: the configured layout)
+            cell_size: Side length of a grid cell (default: from config)
+        """
+        cfg = config.get('logic', 'pathfinding', 'obstacle_layer')
+        if rects is None:
+            rects = cfg['layouts'][cfg['layout']]
+        if cell_size is None:
+            cell_size = cfg['cell_size']
+        self.rects = [tuple(rect) for rect in rects]
+        self.cell_size = cell_size
+        self.world_width = world_width
+        self.world_height = world_height
+        self.columns = max(1, int(np.ceil(world_width / cell_size)))
+        self.rows = max(1, int(np.ceil(world_height / cell_size)))
+
+        self.blocked = np.zeros((self.rows, self.columns), dtype=bool)
+        for x, y, width, height in self.rects:
+            column_start, row_start = max(int(x // cell_size), 0), max(int(y // cell_size), 0)
+            column_end = min(int(np.ceil((x + width) / cell_size)), self.columns)
+            row_end = min(int(np.ceil((y + height) / cell_size)), self.rows)
+            self.blocked[row_start:row_end, column_start:column_end] = True
+
+    def has_obstacles(self) -> bool:
+        """
+        Check whether the arena has any obstacles.
+
+        Returns:
+            True if at least one cell is blocked
+        """
+        return bool(self.rects)
+
+    def get_cell(self, x: float, y: float) -> tuple:
+        """
+        Get the grid cell containing a point.
+
+        Args:
+            x: World x
+            y: World y
+
+        Returns:
+            Tuple of (row, column), clamped to the grid
+        """
+        # Same arithmetic as get_cells, so a point is in the same cell either way
+        return (min(max(int(y / self.cell_size), 0), self.rows - 1),
+                min(max(int(x / self.cell_size), 0), self.columns - 1))
+
+    def get_cells(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Get the flat grid cell index (row * columns + column) of many points.
+
+        Args:
+            positions: (n, 2) world positions
+
+        Returns:
+            (n,) array of cell indices, clamped to the grid
+        """
+        # Division and truncation rather than floor_divide, which is many times slower;
+        # the two only differ below zero, which is clamped to the first cell anyway
+        columns = (positions[:, 0] / self.cell_size).astype(np.intp)
+        rows = (positions[:, 1] / self.cell_size).astype(np.intp)
+        np.clip(columns, 0, self.columns - 1, out=columns)
+        np.clip(rows, 0, self.rows - 1, out=rows)
+        rows *= self.columns
+        rows += columns
+        return rows
+
+    def is_blocked(self, x: float, y: float) -> bool:
+        """
+        Check whether a point lies in a blocked cell.
+
+        Args:
+            x: World x
+            y: World y
+
+        Returns:
+            True if the point's cell is blocked
+        """
+        return bool(self.blocked[self.get_cell(x, y)])
+
+    def resolve_move(self, old_position: Position, new_position: Position) -> Position:
+        """
+        Keep a move out of the obstacles, sliding along them where possible.
+
+        Args:
+            old_position: Position before the move (not blocked)
+            new_position: Position the move would end at
+
+        Returns:
+            new_position if it is free, else the move with only its x or
+            only its y part if either is free, else old_position
+        """
+        if not self.is_blocked(new_position.x, new_position.y):
+            return new_position
+        if not self.is_blocked(new_position.x, old_position.y):
+            return Position(new_position.x, old_position.y)
+        if not self.is_blocked(old_position.x, new_position.y):
+            return Position(old_position.x, new_position.y)
+        return old_position
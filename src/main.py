@@ -1,14 +1,181 @@
 """Main entry point for the Dot Chasing Game."""
+import argparse
+import shlex
 import pygame
 from src.general.menu_page.menu import MenuPage
-from src.general.game_loop import GameLoop
+from src.general.warmup import BackgroundWarmup
 from src.config.config_loader import config
 
 
-def main():
+def parse_args(argv=None):
+    """
+    Parse command line options.
+    
+    Args:
+        argv: Argument list (default: sys.argv)
+        
+    Returns:
+        The parsed options
+    """
+    parser = argparse.ArgumentParser(description="Dot Chasing Game")
+    parser.add_argument('--capture', metavar='PATH',
+                        help="record gameplay frames to a raw file")
+    parser.add_argument('--capture-command', metavar='CMD',
+                        help="record gameplay frames by piping them to an encoder command "
+                             "({width}, {height} and {pitch} are substituted)")
+    parser.add_argument('--export-state', metavar='NAME', nargs='?', const='',
+                        help="publish live game state to a shared-memory segment "
+                             "(default name from config)")
+    parser.add_argument('--serve-spectators', metavar='HOST:PORT', nargs='?', const='',
+                        help="stream the game to spectator clients over TCP (default address from config)")
+    parser.add_argument('--spectate', metavar='HOST:PORT', nargs='?', const='',
+                        help="watch a game streamed with --serve-spectators instead of playing")
+    parser.add_argument('--telemetry', metavar='DIR', nargs='?', const='',
+                        help="save a per-tick timeline of every game to DIR (default directory from config)")
+    parser.add_argument('--serve-metrics', metavar='HOST:PORT', nargs='?', const='',
+                        help="serve aggregate game metrics in Prometheus text format at /metrics "
+                             "(default address from config)")
+    parser.add_argument('--pipelined', action='store_true',
+                        help="run the simulation on a worker thread and render its latest state")
+    parser.add_argument('--low-jitter', action='store_true',
+                        help="pace frames with a busy-wait and run garbage collection between frames; "
+                             "prints frame time and GC pause statistics on exit")
+    parser.add_argument('--input-latency', action='store_true',
+                        help="print input-to-display latency statistics on exit")
+    parser.add_argument('--profile-allocations', metavar='PATH',
+                        help="trace memory allocations per frame phase and write a JSON report to PATH on exit "
+                             "(not with --pipelined)")
+    parser.add_argument('--arena', metavar='LAYOUT',
+                        help="obstacle layout of the arena, one of the layouts in config (default from config)")
+    parser.add_argument('--kernels', choices=['auto', 'python', 'numpy', 'numba'],
+                        help="backend for the movement and collision math (default from config)")
+    parser.add_argument('--bot', action='store_true',
+                        help="let the built-in density bot steer the arrow and fire bombs")
+    parser.add_argument('--player', metavar='NAME',
+                        help="name to record high scores under (default from config, then the OS user)")
+    parser.add_argument('--no-high-scores', action='store_true',
+                        help="do not record or show the persistent leaderboard")
+    return parser.parse_args(argv)
+
+
+def parse_address(value: str) -> tuple:
+    """
+    Split a HOST:PORT option value.
+    
+    Args:
+        value: 'HOST:PORT', 'HOST', ':PORT' or '' (missing parts default to config)
+        
+    Returns:
+        Tuple of (host or None, port or None)
+    """
+    host, _, port = value.rpartition(':') if ':' in value else (value, '', '')
+    return host or None, int(port) if port else None
+
+
+def create_game_loop(args, screen: pygame.Surface, high_score_store):
+    """
+    Create the game loop and the optional features attached to it.
+    
+    Game modules are imported here rather than at the top of the file, so
+    they stay off the path to the first menu frame.
+    
+    Args:
+        args: Parsed command line options
+        screen: The display surface
+        high_score_store: HighScoreStore to record games in, or None
+        
+    Returns:
+        Tuple of (game_loop, frame_capture, state_exporter, spectator_server, metrics_server);
+        all but the first may be None
+    """
+    from src.general.game_loop import GameLoop
+    
+    # Optional kernel backend for the movement and collision math (numba may not be installed)
+    if args.kernels:
+        from src.logic.kernels.kernel_backend import KernelBackend, kernel_backend
+        try:
+            kernel_backend.select(args.kernels)
+        except RuntimeError as e:
+            raise SystemExit(f"{e} (available: auto, {', '.join(KernelBackend.get_available())})")
+    
+    game_loop = GameLoop(*screen.get_size())
+    game_loop.high_score_store = high_score_store
+    
+    # Optional obstacle layout (checked here rather than by the parser, which must not load the config)
+    if args.arena:
+        layouts = config.get('logic', 'pathfinding', 'obstacle_layer', 'layouts')
+        if args.arena not in layouts:
+            raise SystemExit(f"Unknown arena layout {args.arena!r} (choose from {', '.join(sorted(layouts))})")
+        game_loop.set_obstacles(layouts[args.arena])
+    
+    # Optional low-jitter pacing
+    if args.low_jitter:
+        game_loop.frame_pacer.busy_loop = True
+        game_loop.frame_pacer.manage_gc = True
+    
+    # Optional automated player
+    if args.bot:
+        from src.logic.control.density_bot import DensityBot
+        game_loop.bot = DensityBot(game_loop.world_width, game_loop.world_height)
+    
+    # Optional pipelined mode: simulation on a worker thread
+    if args.pipelined:
+        from src.general.pipeline.simulation_worker import SimulationWorker
+        game_loop.simulation_worker = SimulationWorker(game_loop)
+    
+    # Optional gameplay recording
+    frame_capture = None
+    if args.capture_command or args.capture:
+        from src.media.capture.frame_capture import FrameCapture, RawFileSink, EncoderSink
+        if args.capture_command:
+            frame_capture = FrameCapture(EncoderSink(shlex.split(args.capture_command)))
+        else:
+            frame_capture = FrameCapture(RawFileSink(args.capture))
+        frame_capture.start(screen)
+        game_loop.frame_capture = frame_capture
+    
+    # Optional live state export for external visualizers
+    state_exporter = None
+    if args.export_state is not None:
+        from src.general.live_state.shared_state_writer import SharedStateWriter
+        state_exporter = SharedStateWriter(name=args.export_state or None)
+        game_loop.state_exporter = state_exporter
+    
+    # Optional network stream for spectators
+    spectator_server = None
+    if args.serve_spectators is not None:
+        from src.general.spectator.spectator_server import SpectatorServer
+        host, port = parse_address(args.serve_spectators)
+        spectator_server = SpectatorServer(host, port, (game_loop.world_width, game_loop.world_height))
+        game_loop.spectator_server = spectator_server
+        print(f"Streaming to spectators on {spectator_server.address[0]}:{spectator_server.get_port()}")
+    
+    # Optional per-tick telemetry, with aggregate metrics for scrapers
+    metrics_server = None
+    if args.telemetry is not None or args.serve_metrics is not None:
+        from src.general.telemetry.timeline_recorder import TimelineRecorder
+        game_loop.timeline_recorder = TimelineRecorder(args.telemetry or None, save=args.telemetry is not None)
+    if args.serve_metrics is not None:
+        from src.general.telemetry.metrics_server import MetricsServer
+        metrics_server = MetricsServer(game_loop.timeline_recorder, *parse_address(args.serve_metrics))
+        print(f"Serving metrics on http://{metrics_server.address[0]}:{metrics_server.get_port()}/metrics")
+    
+    # Optional allocation profiling of each frame phase
+    if args.profile_allocations:
+        from src.general.profiling.allocation_profiler import AllocationProfiler
+        game_loop.allocation_profiler = AllocationProfiler()
+        game_loop.allocation_profiler.start()
+    
+    return game_loop, frame_capture, state_exporter, spectator_server, metrics_server
+
+
+def main(argv=None):
     """Main function to start the game."""
-    # Initialize pygame
-    pygame.init()
+    args = parse_args(argv)
+    
+    # Initialize only the pygame subsystems the game uses (no audio or joystick)
+    pygame.display.init()
+    pygame.font.init()
     
     # Screen dimensions from config
     screen_width = config.get_screen_width()
@@ -18,9 +185,33 @@ def main():
     screen = pygame.display.set_mode((screen_width, screen_height))
     pygame.display.set_caption("Dot Chasing Game")
     
-    # Create menu and game loop
-    menu = MenuPage(screen_width, screen_height)
-    game_loop = GameLoop(screen_width, screen_height)
+    # Spectator mode: show a streamed game instead of the menu
+    if args.spectate is not None:
+        from src.general.spectator.spectator_client import SpectatorClient
+        from src.general.spectator.spectator_view import SpectatorView
+        pygame.display.set_caption("Dot Chasing Game - Spectator")
+        client = SpectatorClient(*parse_address(args.spectate))
+        SpectatorView(client, screen_width, screen_height).run(screen)
+        client.close()
+        pygame.quit()
+        return
+    
+    # Persistent leaderboard
+    high_score_store = None
+    if not args.no_high_scores:
+        from src.general.scoring.high_score_store import HighScoreStore
+        high_score_store = HighScoreStore(player=args.player)
+    
+    # Create menu; the game loop is created when the first game starts
+    menu = MenuPage(screen_width, screen_height, high_score_store=high_score_store)
+    game_loop = None
+    frame_capture = None
+    state_exporter = None
+    spectator_server = None
+    metrics_server = None
+    
+    # Import game modules in the background once the menu is on screen
+    warmup = BackgroundWarmup()
     
     # Main game state loop
     running = True
@@ -29,11 +220,16 @@ def main():
     while running:
         if not in_game:
             # Show menu and wait for start
-            should_start = menu.run(screen)
+            should_start = menu.run(screen, on_first_frame=warmup.start)
             if not should_start:
                 running = False
             else:
                 in_game = True
+                if game_loop is None:
+                    warmup.wait()
+                    game_loop, frame_capture, state_exporter, spectator_server, metrics_server = create_game_loop(
+                        args, screen, high_score_store
+                    )
                 game_loop.initialize_game()
         else:
             # Run game loop
@@ -44,6 +240,81 @@ def main():
                 menu.set_previous_score(last_score)
                 in_game = False
     
+    # Report how much simulation and rendering overlapped
+    if game_loop is not None and game_loop.simulation_worker is not None:
+        stats = game_loop.simulation_worker.get_stats()
+        print(f"Pipeline: {stats['ticks']} ticks, {stats['frames']} frames, "
+              f"parallelism {stats['parallelism']:.2f}")
+    
+    # Report adaptive quality level changes
+    if game_loop is not None and game_loop.quality_governor is not None:
+        stats = game_loop.quality_governor.get_stats()
+        print(f"Quality: {stats['level_changes']} level changes over {stats['frames']} frames, "
+              f"lowest quality -{stats['lowest_quality']}, final -{stats['level']}")
+        for change in stats['recent_changes']:
+            print(f"  frame {change['frame']}: level {change['from']} -> {change['to']} "
+                  f"(mean frame time {change['mean_frame_ms']:.2f} ms, budget {stats['budget_ms']:.2f} ms)")
+    
+    # Report frame pacing and GC pauses
+    if game_loop is not None and args.low_jitter:
+        stats = game_loop.frame_pacer.get_stats()
+        print(f"Frame time: mean {stats['frame_mean_ms']:.2f} ms, stdev {stats['frame_stdev_ms']:.2f} ms, "
+              f"p99 {stats['frame_p99_ms']:.2f} ms, max {stats['frame_max_ms']:.2f} ms")
+        print(f"GC pauses: {stats['gc_collections']} ({stats['gc_forced_collections']} forced), "
+              f"max {stats['gc_pause_max_ms']:.2f} ms, histogram {stats['gc_pause_histogram']}")
+    
+    # Report how long pointer samples took to reach the screen
+    if game_loop is not None and args.input_latency:
+        stats = game_loop.input_dispatcher.get_latency_stats()
+        print(f"Input latency: mean {stats['mean_ms']:.2f} ms, p95 {stats['p95_ms']:.2f} ms, "
+              f"max {stats['max_ms']:.2f} ms over {stats['frames']} frames")
+    
+    # Flush recorded frames
+    if frame_capture is not None:
+        stats = frame_capture.stop()
+        print(f"Captured {stats['written']} frames ({stats['dropped']} dropped) "
+              f"as {frame_capture.frame_format}")
+        if stats['error'] is not None:
+            print(f"Capture stopped early, writing failed: {stats['error']}")
+    
+    # Flush queued high scores
+    if high_score_store is not None:
+        stats = high_score_store.close()
+        if stats['error'] is not None:
+            print(f"High scores: {stats['lost']} games could not be saved: {stats['error']}")
+    
+    # Remove the shared state segment
+    if state_exporter is not None:
+        state_exporter.close()
+    
+    # Disconnect spectators
+    if spectator_server is not None:
+        stats = spectator_server.get_stats()
+        disconnects = ', '.join(f"{count} {reason}" for reason, count in stats['disconnects'].items()) or 'none'
+        print(f"Spectators: {stats['connects']} connected, disconnected: {disconnects}; "
+              f"{stats['messages']} messages ({stats['bytes_sent']} bytes) sent")
+        spectator_server.close()
+    
+    # Write the last timeline and stop serving metrics
+    if game_loop is not None and game_loop.timeline_recorder is not None:
+        game_loop.timeline_recorder.close()
+        if game_loop.timeline_recorder.save:
+            print(f"Saved {game_loop.timeline_recorder.files_written} game timelines "
+                  f"to {game_loop.timeline_recorder.directory}")
+    if metrics_server is not None:
+        metrics_server.close()
+    
+    # Write the allocation report
+    if game_loop is not None and game_loop.allocation_profiler is not None:
+        game_loop.allocation_profiler.write_report(args.profile_allocations)
+        game_loop.allocation_profiler.stop()
+        print(f"Wrote allocation report for {game_loop.allocation_profiler.frames} frames "
+              f"to {args.profile_allocations}")
+    
+    # Stop timing collections and restore the automatic collector
+    if game_loop is not None:
+        game_loop.frame_pacer.close()
+    
     # Quit pygame
     pygame.quit()
 
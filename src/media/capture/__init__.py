@@ -0,0 +1 @@
+"""Frame capture for recording rendered gameplay."""
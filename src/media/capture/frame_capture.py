@@ -0,0 +1,240 @@
+"""Bounded frame capture stream drained by a background writer thread."""
+import queue
+import subprocess
+import threading
+import pygame
+from src.config.config_loader import config
+
+
+class RawFileSink:
+    """Writes captured frames back to back into a single raw file."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the raw file sink.
+
+        Args:
+            path: Path of the raw output file
+        """
+        self.path = path
+        self.file = None
+
+    def open(self, frame_format: dict):
+        """
+        Open the output file.
+
+        Args:
+            frame_format: Pixel layout of the frames (see FrameCapture.get_frame_format)
+        """
+        self.file = open(self.path, 'wb')
+
+    def write(self, buffer):
+        """
+        Write one frame.
+
+        Args:
+            buffer: Object exposing the frame's pixels through the buffer protocol
+        """
+        self.file.write(buffer)
+
+    def close(self):
+        """Close the output file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class EncoderSink:
+    """Pipes captured frames into the stdin of a local encoder process."""
+
+    def __init__(self, command: list):
+        """
+        Initialize the encoder sink.
+
+        Args:
+            command: Encoder command line; "{width}", "{height}" and "{pitch}"
+                are substituted from the frame format
+        """
+        self.command = command
+        self.process = None
+
+    def open(self, frame_format: dict):
+        """
+        Start the encoder process.
+
+        Args:
+            frame_format: Pixel layout of the frames (see FrameCapture.get_frame_format)
+        """
+        command = [argument.format(**frame_format) for argument in self.command]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, buffer):
+        """
+        Write one frame.
+
+        Args:
+            buffer: Object exposing the frame's pixels through the buffer protocol
+        """
+        self.process.stdin.write(buffer)
+
+    def close(self):
+        """Close the encoder input and wait for it to finish."""
+        if self.process is not None:
+            self.process.stdin.close()
+            self.process.wait()
+            self.process = None
+
+
+class FrameCapture:
+    """
+    Hands rendered frames to a writer thread through a bounded ring of slots.
+
+    The ring holds preallocated surfaces matching the screen. Capturing a
+    frame is a single blit into a free slot; the writer thread passes the
+    slot's pixel BufferProxy straight to the sink, so no Python-level copy
+    or allocation happens per frame. When every slot is still waiting to be
+    written the frame is dropped instead of stalling the game loop. If the
+    sink fails (disk full, encoder gone), the writer keeps the error and
+    stops; later frames are dropped and stop() reports the error.
+    """
+
+    def __init__(self, sink, ring_size: int = None):
+        """
+        Initialize the frame capture.
+
+        Args:
+            sink: Destination for frames (RawFileSink or EncoderSink)
+            ring_size: Number of frame slots in the ring (default: from config)
+        """
+        cfg = config.get('media', 'capture', 'frame_capture')
+        self.sink = sink
+        self.ring_size = ring_size if ring_size is not None else cfg['ring_size']
+
+        self.slots = []
+        self.free_slots = queue.Queue()
+        self.filled_slots = queue.Queue()
+        self.writer_thread = None
+        self.frame_format = None
+        # Exception that stopped the writer thread, if any
+        self.error = None
+
+        # Statistics
+        self.frames_captured = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+
+    def start(self, screen: pygame.Surface):
+        """
+        Allocate the ring and start the writer thread.
+
+        Args:
+            screen: The surface frames will be captured from
+        """
+        self.slots = [screen.copy() for _ in range(self.ring_size)]
+        for index in range(self.ring_size):
+            self.free_slots.put(index)
+        self.frame_format = self.get_frame_format(self.slots[0])
+        self.sink.open(self.frame_format)
+
+        self.writer_thread = threading.Thread(target=self._write_frames, daemon=True)
+        self.writer_thread.start()
+
+    def get_frame_format(self, surface: pygame.Surface) -> dict:
+        """
+        Describe the raw pixel layout of captured frames.
+
+        Args:
+            surface: A surface with the capture format
+
+        Returns:
+            Dictionary with width, height, pitch, bytes per pixel and channel masks
+        """
+        width, height = surface.get_size()
+        return {
+            'width': width,
+            'height': height,
+            'pitch': surface.get_pitch(),
+            'bytes_per_pixel': surface.get_bytesize(),
+            'masks': surface.get_masks()
+        }
+
+    def capture(self, screen: pygame.Surface) -> bool:
+        """
+        Queue the current frame for writing (call once per rendered frame).
+
+        Args:
+            screen: The surface holding the rendered frame
+
+        Returns:
+            True if the frame was queued, False if it was dropped
+        """
+        self.frames_captured += 1
+        if self.error is not None:
+            # Nothing would write the frame any more
+            self.frames_dropped += 1
+            return False
+        try:
+            index = self.free_slots.get_nowait()
+        except queue.Empty:
+            self.frames_dropped += 1
+            return False
+
+        self.slots[index].blit(screen, (0, 0))
+        self.filled_slots.put(index)
+        return True
+
+    def _write_frames(self):
+        """Writer thread: drain filled slots into the sink."""
+        while True:
+            index = self.filled_slots.get()
+            if index is None:
+                break
+
+            # The proxy locks the slot, so drop it before the slot is reused
+            buffer = self.slots[index].get_buffer()
+            try:
+                self.sink.write(buffer)
+            except Exception as error:
+                # Keep the error for stop() instead of dying silently with the slot unreturned
+                self.error = error
+                break
+            finally:
+                del buffer
+
+            self.frames_written += 1
+            self.free_slots.put(index)
+
+    def stop(self) -> dict:
+        """
+        Flush pending frames, stop the writer thread and close the sink.
+
+        Returns:
+            Dictionary with capture statistics, including the error that
+            stopped the writer (None if every frame was written)
+        """
+        if self.writer_thread is not None:
+            self.filled_slots.put(None)
+            self.writer_thread.join()
+            self.writer_thread = None
+            try:
+                self.sink.close()
+            except OSError as error:
+                # A broken encoder pipe also fails on close
+                if self.error is None:
+                    self.error = error
+        return self.get_stats()
+
+    def get_stats(self) -> dict:
+        """
+        Get capture statistics.
+
+        Returns:
+            Dictionary with captured, written and dropped frame counts and the
+            writer's error message (None if it has not failed)
+        """
+        return {
+            'captured': self.frames_captured,
+            'written': self.frames_written,
+            'dropped': self.frames_dropped,
+            'error': str(self.error) if self.error is not None else None
+        }
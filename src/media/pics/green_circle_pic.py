@@ -1,6 +1,7 @@
 """Visual representation of a green circle (bomb wave)."""
 import pygame
 from .base_pic import BasePic
+from .render_quality import render_quality
 from src.config.config_loader import config
 
 
@@ -14,9 +15,15 @@ class GreenCirclePic(BasePic):
         self.max_radius = cfg['max_radius']
         self.current_radius = self.base_radius
         self.color = tuple(cfg['color'])
-        self.alpha = cfg['alpha']
+        self.base_alpha = cfg['alpha']
+        self.alpha = self.base_alpha
         self.border_width = cfg['border_width']
     
+    def reset(self):
+        """Return to the initial radius and alpha."""
+        self.current_radius = self.base_radius
+        self.alpha = self.base_alpha
+    
     def set_radius(self, progress: float):
         """
         Set the current radius based on animation progress.
@@ -37,18 +44,30 @@ class GreenCirclePic(BasePic):
             x: The x-coordinate of the center
             y: The y-coordinate of the center
         """
+        scale = render_quality.render_scale
+        x *= scale
+        y *= scale
+        radius = self.current_radius * scale
+        border_width = max(1, round(self.border_width * scale))
+        
+        if render_quality.circle_border_only:
+            # Reduced quality: skip the alpha fill and its temporary surface
+            pygame.draw.circle(surface, self.color, (int(x), int(y)),
+                               int(radius), border_width)
+            return
+        
         # Create a transparent surface for the circle
-        temp_surface = pygame.Surface((int(self.current_radius * 2), int(self.current_radius * 2)), pygame.SRCALPHA)
+        temp_surface = pygame.Surface((int(radius * 2), int(radius * 2)), pygame.SRCALPHA)
         pygame.draw.circle(temp_surface, (*self.color, self.alpha), 
-                         (int(self.current_radius), int(self.current_radius)), 
-                         int(self.current_radius))
+                         (int(radius), int(radius)), 
+                         int(radius))
         # Draw border
         pygame.draw.circle(temp_surface, (*self.color, 255), 
-                         (int(self.current_radius), int(self.current_radius)), 
-                         int(self.current_radius), self.border_width)
+                         (int(radius), int(radius)), 
+                         int(radius), border_width)
         
         # Blit to main surface
-        surface.blit(temp_surface, (x - self.current_radius, y - self.current_radius))
+        surface.blit(temp_surface, (x - radius, y - radius))
     
     def get_size(self) -> tuple[int, int]:
         """
@@ -0,0 +1,52 @@
+"""Visual representation of the arena's obstacles."""
+import pygame
+from .base_pic import BasePic
+from .render_quality import render_quality
+from src.config.config_loader import config
+
+
+class ObstaclePic(BasePic):
+    """Filled rectangles with a lighter border, one per obstacle."""
+    
+    def __init__(self, rects: list):
+        """
+        Initialize the obstacle visual properties.
+        
+        Args:
+            rects: (x, y, width, height) obstacle rectangles in world pixels
+        """
+        cfg = config.get('media', 'pics', 'obstacle_pic')
+        self.rects = [tuple(rect) for rect in rects]
+        self.color = tuple(cfg['color'])
+        self.border_color = tuple(cfg['border_color'])
+        self.border_width = cfg['border_width']
+    
+    def draw(self, surface: pygame.Surface, x: float, y: float):
+        """
+        Draw the obstacles on the given surface.
+        
+        Args:
+            surface: The pygame Surface to draw on
+            x: Screen x-coordinate of the world origin
+            y: Screen y-coordinate of the world origin
+        """
+        scale = render_quality.render_scale
+        border_width = max(1, round(self.border_width * scale))
+        clip = surface.get_rect()
+        for rect_x, rect_y, width, height in self.rects:
+            rect = pygame.Rect(round((x + rect_x) * scale), round((y + rect_y) * scale),
+                               round(width * scale), round(height * scale))
+            if not rect.colliderect(clip):
+                continue
+            pygame.draw.rect(surface, self.color, rect)
+            pygame.draw.rect(surface, self.border_color, rect, border_width)
+    
+    def get_size(self) -> tuple[int, int]:
+        """
+        Get the size of the area the obstacles cover.
+        
+        Returns:
+            A tuple (width, height) of their bounding box from the world origin
+        """
+        return (max((x + width for x, _, width, _ in self.rects), default=0),
+                max((y + height for _, y, _, height in self.rects), default=0))
@@ -0,0 +1,152 @@
+"""Vectorized rendering of many red dots at once."""
+import numpy as np
+import pygame
+from .red_dot_pic import RedDotPic
+from .render_quality import render_quality
+from src.config.config_loader import config
+
+
+class RedDotBulkPic:
+    """
+    Draws every red dot in one NumPy pass over the frame buffer.
+
+    A single RedDotPic is rendered once into a small stamp (per render
+    scale and quality setting); each pixel the stamp covers becomes an
+    (offset, color) pair. Drawing N dots then
+    scatters the stamp at every truncated dot center into the surface's
+    pixel buffer in a single NumPy assignment, in dot order, so
+    overlapping dots end up exactly as they would with one RedDotPic.draw
+    call per dot.
+    """
+
+    def __init__(self):
+        """Initialize the bulk renderer."""
+        cfg = config.get('media', 'pics', 'red_dot_bulk_pic')
+        self.min_dots = cfg['min_dots']
+        self.pic = RedDotPic()
+
+        # Stamps per (render scale, simple dots) and mapped colors per pixel format
+        self.stamps = {}
+        self.mapped_colors = {}
+
+    def _get_stamp(self) -> tuple:
+        """
+        Get the stamp for the current render quality, building it on first use.
+
+        Returns:
+            Tuple of (offset_x, offset_y, stamp_rgb, extent)
+        """
+        key = (render_quality.render_scale, render_quality.simple_red_dots)
+        stamp = self.stamps.get(key)
+        if stamp is not None:
+            return stamp
+
+        # Render one dot on a sentinel background and keep the pixels it touched
+        scale = render_quality.render_scale
+        half_size = int(np.ceil(self.pic.radius * scale)) + 2
+        size = half_size * 2 + 1
+        surface = pygame.Surface((size, size), depth=32)
+        sentinel = self._pick_sentinel_color()
+        surface.fill(sentinel)
+        self.pic.draw_at_pixel(surface, half_size, half_size, scale)
+
+        rgb = pygame.surfarray.array3d(surface)
+        touched = np.any(rgb != np.array(sentinel, dtype=rgb.dtype), axis=2)
+        xs, ys = np.nonzero(touched)
+        stamp = (
+            (xs - half_size).astype(np.intp),
+            (ys - half_size).astype(np.intp),
+            rgb[xs, ys],
+            half_size
+        )
+        self.stamps[key] = stamp
+        return stamp
+
+    def _pick_sentinel_color(self) -> tuple:
+        """
+        Choose a background color that differs from both dot colors.
+
+        Returns:
+            An RGB tuple
+        """
+        for color in ((0, 0, 0), (1, 2, 3), (4, 5, 6)):
+            if color != self.pic.color and color != self.pic.border_color:
+                return color
+
+    def should_use(self, dot_count: int) -> bool:
+        """
+        Check if the bulk path should be used for this many dots.
+
+        Args:
+            dot_count: Number of red dots to draw
+
+        Returns:
+            True if dot_count reaches the configured threshold
+        """
+        return dot_count >= self.min_dots
+
+    def _get_mapped_colors(self, surface: pygame.Surface, stamp_rgb: np.ndarray) -> np.ndarray:
+        """
+        Get the stamp colors mapped to a surface's pixel format.
+
+        Args:
+            surface: The destination surface
+            stamp_rgb: RGB color of every stamp pixel
+
+        Returns:
+            Array of mapped pixel values, one per stamp pixel
+        """
+        key = (id(stamp_rgb), surface.get_bitsize(), surface.get_masks(), surface.get_shifts())
+        mapped = self.mapped_colors.get(key)
+        if mapped is None:
+            mapped = np.array([surface.map_rgb(tuple(int(c) for c in color)) for color in stamp_rgb],
+                              dtype=np.uint32)
+            self.mapped_colors[key] = mapped
+        return mapped
+
+    def draw(self, surface: pygame.Surface, positions: np.ndarray):
+        """
+        Draw red dots at all positions.
+
+        Args:
+            surface: The pygame Surface to draw on
+            positions: (n, 2) array of dot centers
+        """
+        if len(positions) == 0:
+            return
+        if surface.get_bytesize() != 4 or surface.get_pitch() % 4:
+            # The flat buffer write needs 32-bit pixels; fall back to the per-dot path
+            for x, y in positions.tolist():
+                self.pic.draw(surface, x, y)
+            return
+
+        offset_x, offset_y, stamp_rgb, extent = self._get_stamp()
+        row_length = surface.get_pitch() // 4
+        clip = surface.get_clip()
+
+        # Same scaling and truncation as int(x * scale) in RedDotPic.draw
+        centers = (np.asarray(positions, dtype=np.float64) * render_quality.render_scale).astype(np.intp)
+        center_x = centers[:, 0:1]
+        center_y = centers[:, 1:2]
+
+        # Flat buffer index of every stamp pixel, dot after dot
+        indices = center_y * row_length + center_x + (offset_y * row_length + offset_x)
+        colors = np.broadcast_to(self._get_mapped_colors(surface, stamp_rgb), indices.shape)
+
+        # Only dots near the clip edge need per-pixel clipping
+        near_edge = ((center_x[:, 0] < clip.left + extent) | (center_x[:, 0] >= clip.right - extent) |
+                     (center_y[:, 0] < clip.top + extent) | (center_y[:, 0] >= clip.bottom - extent))
+        if near_edge.any():
+            xs = center_x[near_edge] + offset_x
+            ys = center_y[near_edge] + offset_y
+            visible = np.ones(indices.shape, dtype=bool)
+            visible[near_edge] = (xs >= clip.left) & (xs < clip.right) & (ys >= clip.top) & (ys < clip.bottom)
+            indices = indices[visible]
+            colors = colors[visible]
+        else:
+            indices = indices.ravel()
+            colors = colors.ravel()
+
+        pixels = np.frombuffer(surface.get_buffer(), dtype=np.uint32)
+        pixels[indices] = colors
+        del pixels
@@ -1,6 +1,7 @@
 """Visual representation of a red dot."""
 import pygame
 from .base_pic import BasePic
+from .render_quality import render_quality
 from src.config.config_loader import config
 
 
@@ -25,11 +26,29 @@ class RedDotPic(BasePic):
             x: The x-coordinate of the center
             y: The y-coordinate of the center
         """
+        scale = render_quality.render_scale
+        self.draw_at_pixel(surface, int(x * scale), int(y * scale), scale)
+    
+    def draw_at_pixel(self, surface: pygame.Surface, center_x: int, center_y: int, scale: float):
+        """
+        Draw the red dot centered on a surface pixel.
+        
+        Args:
+            surface: The pygame Surface to draw on
+            center_x: The pixel x-coordinate of the center
+            center_y: The pixel y-coordinate of the center
+            scale: Render scale the surface is drawn at
+        """
+        radius = self.radius * scale
+        
         # Draw the red circle
-        pygame.draw.circle(surface, self.color, (int(x), int(y)), self.radius)
+        pygame.draw.circle(surface, self.color, (center_x, center_y), radius)
+        if render_quality.simple_red_dots:
+            # Reduced quality: one draw call per dot, no border
+            return
         # Draw the white border
-        pygame.draw.circle(surface, self.border_color, (int(x), int(y)), 
-                         self.radius, self.border_width)
+        pygame.draw.circle(surface, self.border_color, (center_x, center_y), 
+                         radius, max(1, round(self.border_width * scale)))
     
     def get_size(self) -> tuple[int, int]:
         """
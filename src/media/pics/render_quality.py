@@ -0,0 +1,32 @@
+"""Shared render quality settings for all pics."""
+
+
+class RenderQuality:
+    """
+    Quality switches read by the pics at draw time.
+    
+    A single shared instance (like the config) lets the quality governor
+    change how every existing and future item is drawn without touching
+    the items themselves.
+    """
+    
+    def __init__(self):
+        """Initialize at full quality."""
+        # Configured fraction of the output resolution the game is drawn at
+        self.base_render_scale = 1.0
+        self.reset()
+    
+    def reset(self):
+        """Restore full quality."""
+        # Fraction of the output resolution the game is currently drawn at
+        self.render_scale = self.base_render_scale
+        # Green circles drawn as an opaque ring instead of an alpha-filled disc
+        self.circle_border_only = False
+        # Red dots drawn as a plain disc without their border
+        self.simple_red_dots = False
+        # HUD text is re-rendered at most once every this many frames
+        self.hud_refresh_frames = 1
+
+
+# Global render quality instance
+render_quality = RenderQuality()
@@ -2,6 +2,7 @@
 import pygame
 import math
 from .base_pic import BasePic
+from .render_quality import render_quality
 from src.config.config_loader import config
 
 
@@ -15,6 +16,29 @@ class WhiteArrowPic(BasePic):
         self.height = cfg['height']
         self.color = tuple(cfg['color'])
         self.rotation_angle = 0  # Angle in degrees (0 = pointing up)
+        
+        # Define arrow points (pointing up by default)
+        # Arrow shape: tip at top, wings on sides, base at bottom
+        half_width = self.width / 2
+        half_height = self.height / 2
+        
+        # Points relative to origin (0, 0)
+        self.points = (
+            (0, -half_height),  # Top tip
+            (half_width, half_height / 2),  # Right wing
+            (half_width / 3, half_height / 2),  # Right inner
+            (half_width / 3, half_height),  # Right base
+            (-half_width / 3, half_height),  # Left base
+            (-half_width / 3, half_height / 2),  # Left inner
+            (-half_width, half_height / 2),  # Left wing
+        )
+        
+        # Distance from the center to the farthest point, the same at every rotation
+        self.bounding_radius = max(math.hypot(px, py) for px, py in self.points)
+        
+        # Rotated points for the rotation they were computed for
+        self.outline = self.points
+        self.outline_angle = 0
     
     def set_rotation_from_direction(self, dx: float, dy: float):
         """
@@ -38,36 +62,32 @@ class WhiteArrowPic(BasePic):
             x: The x-coordinate of the center
             y: The y-coordinate of the center
         """
-        # Define arrow points (pointing up by default)
-        # Arrow shape: tip at top, wings on sides, base at bottom
-        half_width = self.width / 2
-        half_height = self.height / 2
+        # Scale the rotated outline to the render resolution and translate it to the position
+        scale = render_quality.render_scale
+        x *= scale
+        y *= scale
+        rotated_points = [(x + px * scale, y + py * scale) for px, py in self.get_outline()]
         
-        # Points relative to origin (0, 0)
-        points = [
-            (0, -half_height),  # Top tip
-            (half_width, half_height / 2),  # Right wing
-            (half_width / 3, half_height / 2),  # Right inner
-            (half_width / 3, half_height),  # Right base
-            (-half_width / 3, half_height),  # Left base
-            (-half_width / 3, half_height / 2),  # Left inner
-            (-half_width, half_height / 2),  # Left wing
-        ]
+        pygame.draw.polygon(surface, self.color, rotated_points)
+    
+    def get_outline(self) -> tuple:
+        """
+        Get the arrow's points rotated to the current rotation angle.
         
-        # Rotate points
-        angle_rad = math.radians(self.rotation_angle)
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
+        The rotation is only recomputed when rotation_angle has changed
+        since the last call.
         
-        rotated_points = []
-        for px, py in points:
+        Returns:
+            Tuple of (x, y) points relative to the center, in world pixels
+        """
+        if self.rotation_angle != self.outline_angle:
+            angle_rad = math.radians(self.rotation_angle)
+            cos_a = math.cos(angle_rad)
+            sin_a = math.sin(angle_rad)
             # Rotate around origin
-            rotated_x = px * cos_a - py * sin_a
-            rotated_y = px * sin_a + py * cos_a
-            # Translate to position
-            rotated_points.append((x + rotated_x, y + rotated_y))
-        
-        pygame.draw.polygon(surface, self.color, rotated_points)
+            self.outline = tuple((px * cos_a - py * sin_a, px * sin_a + py * cos_a) for px, py in self.points)
+            self.outline_angle = self.rotation_angle
+        return self.outline
     
     def get_size(self) -> tuple[int, int]:
         """